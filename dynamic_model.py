@@ -1,15 +1,34 @@
 from __future__ import annotations
 
+import array
+import asyncio
+import atexit
+import base64
+import collections
+import concurrent.futures
 import contextlib
+import contextvars
 import datetime
+import io
+import itertools
 import json
+import keyword
+import os
+import queue
+import select
+import struct
 import threading
 import time
 import decimal
+import uuid
+import warnings
+import weakref
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
     Dict,
+    FrozenSet,
     Iterable,
     Iterator,
     List,
@@ -17,12 +36,592 @@ from typing import (
     Sequence,
     Set,
     Tuple,
+    Union,
 )
 
 import psycopg2
 from psycopg2 import sql
 import psycopg2.extras
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.pool import PoolError
+
+try:  # optional: nur für AsyncDynamicModel
+    import aiopg
+except ImportError:  # pragma: no cover
+    aiopg = None
+
+try:  # optional: NumPy-Arrays in query_columns/stream_columns
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class _IterStream(io.RawIOBase):
+    """
+    Datei-artiger Adapter über einen Iterator von Bytes-Blöcken (für COPY ... FROM STDIN).
+    """
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buf = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        size = len(b)
+        pos = 0
+        while pos < size:
+            if not self._buf:
+                try:
+                    self._buf = next(self._chunks)
+                except StopIteration:
+                    break
+                continue
+            n = min(size - pos, len(self._buf))
+            b[pos:pos + n] = self._buf[:n]
+            self._buf = self._buf[n:]
+            pos += n
+        return pos
+
+
+class _StreamCursor:
+    """
+    Server-seitiger (Named) Cursor hinter DynamicModel.stream_query(): iterierbar und
+    Context-Manager. close() — auch bei vorzeitigem Abbruch — schließt den Cursor und gibt
+    die Verbindung sofort frei statt erst bei der Garbage Collection.
+    """
+
+    def __init__(self, model, query: Any, params: Iterable[Any], fetch_size: int, rows: str, withhold: bool):
+        if rows not in ("dict", "tuple"):
+            raise ValueError("rows muss 'dict' oder 'tuple' sein.")
+        self._model = model
+        self._query = query
+        self._params = list(params)
+        self._fetch_size = max(1, fetch_size)
+        self._rows = rows
+        self._withhold = withhold
+        self._conn = None
+        self._cur = None
+        self._it: Optional[Iterator[Any]] = None
+        self._outer = False
+        self._closed = False
+        self._description = None
+
+    def __iter__(self) -> "_StreamCursor":
+        return self
+
+    @property
+    def description(self):
+        """cursor.description (nach dem ersten Abruf verfügbar)."""
+        return self._cur.description if self._cur is not None else self._description
+
+    def __next__(self) -> Any:
+        if self._it is None:
+            if self._closed:
+                raise StopIteration
+            self._open()
+        try:
+            return next(self._it)
+        except StopIteration:
+            self._finish(ok=True)
+            raise
+        except Exception:
+            self._finish(ok=False)
+            raise
+
+    def __enter__(self) -> "_StreamCursor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _open(self) -> None:
+        model = self._model
+        self._outer = model._in_transaction()
+        self._conn = conn = model._current_connection()
+        try:
+            # eindeutiger Name pro Prozess: parallele Streams auf einer Verbindung kollidieren nicht
+            self._cur = cur = conn.cursor(
+                name=f"ssc_{next(model._stream_names)}",
+                cursor_factory=psycopg2.extras.RealDictCursor if self._rows == "dict" else None,
+                withhold=self._withhold,
+            )
+            cur.itersize = self._fetch_size
+            model._log_sql(conn, self._query, self._params)
+            cur.execute(self._query, self._params)
+            if self._withhold and not self._outer:
+                # WITH HOLD: Cursor bleibt nach dem Commit lesbar, keine lange offene Transaktion
+                conn.commit()
+            self._it = iter(cur)
+        except Exception:
+            self._finish(ok=False)
+            raise
+
+    def close(self) -> None:
+        """
+        Bricht das Streaming ab (Rollback außerhalb einer transaction()) und gibt die Verbindung frei.
+        """
+        self._finish(ok=False)
+
+    def _finish(self, ok: bool) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._it = None
+        conn, cur = self._conn, self._cur
+        self._conn = self._cur = None
+        if conn is None:
+            return
+        try:
+            if cur is not None:
+                self._description = cur.description
+                cur.close()
+        finally:
+            if not self._outer:
+                try:
+                    if ok:
+                        conn.commit()
+                    else:
+                        conn.rollback()
+                finally:
+                    self._model._release_connection(conn)
+
+
+class _ScanAborted(Exception):
+    """Interner Abbruch von parallel_scan, wenn der Konsument von iter_parallel_scan aufhört."""
+
+
+def _ingest_init(model, db_params: Dict[str, Any]) -> None:
+    """
+    Initializer der parallel_ingest-Worker: eigene Verbindung pro Prozess, kein Auto-DDL.
+    Per fork geerbte Verbindungen des Elternprozesses werden nicht angefasst.
+    """
+    model._local = threading.local()
+    model._pool = None
+    model._connection = None
+    model.connect(**db_params)
+    model.set_strict_schema(True)
+
+
+def _ingest_chunk(
+    model, table: str, chunk: List[Dict[str, Any]], columns: List[str], method: str, format: str
+) -> Dict[str, Any]:
+    """
+    Schreibt einen Block im Worker-Prozess (COPY oder execute_values); Fehler werden als
+    Ergebnis zurückgegeben statt geworfen, damit der Elternprozess sie pro Worker zählen kann.
+    """
+    started = time.perf_counter()
+    out: Dict[str, Any] = {"worker": os.getpid(), "rows": 0, "error": None}
+    try:
+        if method == "copy":
+            model.bulk_copy(table, chunk, columns=columns, infer_types=False, format=format)
+        else:
+            model.bulk_create(table, chunk, infer_types=False, page_size=len(chunk))
+        out["rows"] = len(chunk)
+    except Exception as e:
+        out["error"] = f"{type(e).__name__}: {e}"
+    out["seconds"] = time.perf_counter() - started
+    return out
+
+
+class PoolTimeout(PoolError):
+    """
+    Keine freie Verbindung innerhalb des Checkout-Timeouts.
+    """
+
+
+class _ConnectionPool:
+    """
+    Thread-sicherer Connection-Pool: blockierender Checkout mit Timeout, maximale
+    Lebensdauer, Idle-Eviction, optionaler Pre-Ping und Zähler für pool_stats().
+    """
+
+    def __init__(
+        self,
+        minconn: int,
+        maxconn: int,
+        timeout: Optional[float] = 30.0,
+        max_lifetime: Optional[float] = None,
+        max_idle: Optional[float] = None,
+        pre_ping: bool = False,
+        ping_after: float = 30.0,
+        **db_params,
+    ):
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise ValueError("Ungültige Pool-Größe (0 <= minconn <= maxconn, maxconn >= 1).")
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.pre_ping = pre_ping
+        self.ping_after = ping_after
+        self._db_params = db_params
+        self._cond = threading.Condition()
+        # (conn, zuletzt zurückgegeben)
+        self._idle: List[Tuple[psycopg2.extensions.connection, float]] = []
+        self._created_at: Dict[int, float] = {}
+        self._in_use: Set[int] = set()
+        self._size = 0
+        self._closed = False
+        self._stats: Dict[str, float] = {
+            "checkouts": 0,
+            "waits": 0,
+            "wait_time_total": 0.0,
+            "timeouts": 0,
+            "connections_created": 0,
+            "connections_closed": 0,
+            "ping_failures": 0,
+        }
+        for _ in range(minconn):
+            self._size += 1
+            self._idle.append((self._connect(), time.monotonic()))
+
+    def _connect(self) -> psycopg2.extensions.connection:
+        try:
+            conn = psycopg2.connect(**self._db_params)
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        conn.autocommit = False
+        with self._cond:
+            self._created_at[id(conn)] = time.monotonic()
+            self._stats["connections_created"] += 1
+        return conn
+
+    def _discard(self, conn: psycopg2.extensions.connection) -> None:
+        with self._cond:
+            self._created_at.pop(id(conn), None)
+            self._in_use.discard(id(conn))
+            self._size -= 1
+            self._stats["connections_closed"] += 1
+            self._cond.notify()
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _expired(self, conn: psycopg2.extensions.connection, now: float) -> bool:
+        if conn.closed:
+            return True
+        if self.max_lifetime is not None:
+            return now - self._created_at.get(id(conn), now) >= self.max_lifetime
+        return False
+
+    def _evict_idle_locked(self, now: float) -> List[psycopg2.extensions.connection]:
+        """
+        Entfernt abgelaufene/zu lange ungenutzte Idle-Verbindungen (minconn bleibt erhalten).
+        Muss unter self._cond aufgerufen werden; Schließen erfolgt außerhalb.
+        """
+        evicted = []
+        keep = []
+        for conn, last_used in self._idle:
+            too_idle = (
+                self.max_idle is not None
+                and now - last_used >= self.max_idle
+                and self._size - len(evicted) > self.minconn
+            )
+            if too_idle or self._expired(conn, now):
+                evicted.append(conn)
+            else:
+                keep.append((conn, last_used))
+        self._idle = keep
+        return evicted
+
+    def _ping(self, conn: psycopg2.extensions.connection) -> bool:
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def getconn(self, timeout: Optional[float] = None) -> psycopg2.extensions.connection:
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        waited = False
+        while True:
+            conn = None
+            last_used = 0.0
+            create = False
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise PoolError("Connection-Pool ist geschlossen.")
+                    now = time.monotonic()
+                    evicted = self._evict_idle_locked(now)
+                    if evicted:
+                        break
+                    if self._idle:
+                        conn, last_used = self._idle.pop()
+                        break
+                    if self._size < self.maxconn:
+                        self._size += 1
+                        create = True
+                        break
+                    remaining = None if deadline is None else deadline - now
+                    if remaining is not None and remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolTimeout(f"Keine freie Verbindung nach {timeout:.1f}s (maxconn={self.maxconn}).")
+                    waited = True
+                    self._cond.wait(remaining)
+            if evicted:
+                for c in evicted:
+                    self._discard(c)
+                continue
+            if create:
+                conn = self._connect()
+            elif (
+                self.pre_ping
+                and time.monotonic() - last_used >= self.ping_after
+                and not self._ping(conn)
+            ):
+                with self._cond:
+                    self._stats["ping_failures"] += 1
+                self._discard(conn)
+                continue
+            with self._cond:
+                self._in_use.add(id(conn))
+                self._stats["checkouts"] += 1
+                if waited:
+                    self._stats["waits"] += 1
+                    self._stats["wait_time_total"] += time.monotonic() - started
+            return conn
+
+    def putconn(self, conn: psycopg2.extensions.connection, close: bool = False) -> None:
+        now = time.monotonic()
+        if not close and not self._closed and not conn.closed:
+            try:
+                if conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except Exception:
+                close = True
+        if close or self._closed or self._expired(conn, now):
+            self._discard(conn)
+            return
+        with self._cond:
+            self._in_use.discard(id(conn))
+            self._idle.append((conn, now))
+            self._cond.notify()
+
+    def closeall(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle = [c for c, _ in self._idle]
+            self._idle = []
+            self._cond.notify_all()
+        for conn in idle:
+            self._discard(conn)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            out: Dict[str, Any] = dict(self._stats)
+            out["in_use"] = len(self._in_use)
+            out["idle"] = len(self._idle)
+            out["size"] = self._size
+            out["maxconn"] = self.maxconn
+        return out
+
+
+class _FrozenTable:
+    """
+    Schema-Snapshot einer eingefrorenen Tabelle (freeze_schema) mit vorgerenderten
+    INSERT-/UPDATE-Statements je Spaltenkombination.
+    """
+
+    __slots__ = ("columns", "column_set", "insert_sql", "update_sql")
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns: Tuple[str, ...] = tuple(columns)
+        self.column_set = frozenset(columns)
+        # Spalten-Tupel -> SQL-Text
+        self.insert_sql: Dict[Tuple[str, ...], str] = {}
+        self.update_sql: Dict[Tuple[str, ...], str] = {}
+
+
+class _DeferredBatch:
+    """
+    Instanzen eines Abrufs (get_all, paginate, get_many, prefetch) mit nicht geladenen Spalten:
+    der erste Zugriff lädt sie für alle noch lebenden Geschwister mit einer Query nach.
+    Schwache Referenzen, damit der Abruf keine Instanzen am Leben hält.
+    """
+
+    __slots__ = ("members",)
+
+    def __init__(self, members: Iterable[Any]):
+        self.members = [weakref.ref(o) for o in members]
+
+
+class _DeferredSet(set):
+    """
+    Nicht geladene Spalten einer Instanz plus Verweis auf ihren Abruf (_DeferredBatch).
+    """
+
+    __slots__ = ("batch",)
+
+
+class _PendingWrites(dict):
+    """
+    Vorgemerkte Instanzen (Deferred Writes) eines Threads: id(obj) -> obj. Wird das Dict mit
+    ungeschriebenen Änderungen verworfen (Thread-Ende, GC), gibt es eine RuntimeWarning.
+    """
+
+    __slots__ = ()
+
+    def __del__(self):
+        if self:
+            _warn_unflushed(len(self))
+
+
+def _warn_unflushed(count: int) -> None:
+    warnings.warn(
+        f"{count} Instanz(en) mit vorgemerkten Änderungen wurden nie geschrieben — flush() vergessen?",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
+
+class _SlotsModel:
+    """
+    Mixin der von DynamicModel.model_for() erzeugten Klassen: ein Slot pro Spalte statt
+    _data-Dict und _columns-Set pro Instanz. Spalten, die nicht als Slot taugen
+    (kein Identifier, Namenskonflikt) oder später per DDL dazukommen, landen in _extra.
+    Die Spaltenliste der Klasse folgt dem Schema-Cache (_sync_schema).
+    """
+
+    __slots__ = ()
+
+    # werden von model_for() pro erzeugter Klasse gesetzt
+    _table: str = ""
+    _table_columns: FrozenSet[str] = frozenset()
+    _slot_columns: Tuple[str, ...] = ()
+    _slot_set: FrozenSet[str] = frozenset()
+    _slots_all: Tuple[str, ...] = ()
+    _schema_infos: Optional[List[Dict[str, Any]]] = None
+    _base_model: type = object
+
+    @classmethod
+    def _sync_schema(cls) -> FrozenSet[str]:
+        """
+        Gleicht die Spalten der Klasse mit dem Schema-Cache ab, sobald dieser neu geladen
+        wurde (DDL, Invalidierung, TTL): gelöschte Spalten fallen weg, neue landen in _extra.
+        """
+        infos = cls.inspect_schema(cls._table)
+        if infos is not cls._schema_infos:
+            if not infos:
+                raise ValueError(f"Tabelle '{cls._table}' existiert nicht.")
+            columns = frozenset(r["column_name"] for r in infos)
+            slots = tuple(c for c in cls._slots_all if c in columns)
+            cls._slot_columns = slots
+            cls._slot_set = frozenset(slots)
+            cls._table_columns = columns
+            cls._schema_infos = infos
+        return cls._table_columns
+
+    def __init__(self, row_id: int, lazy: bool = False):
+        if self._connection is None and self._pool is None:
+            raise RuntimeError("Bitte erst DynamicModel.connect() aufrufen.")
+        self._id = row_id
+        self._dirty = None
+        self._extra = None
+        if lazy:
+            self._deferred = set(self._sync_schema()) - {"id"} or None
+            self._store({"id": row_id})
+        else:
+            self._deferred = None
+            self._load_data()
+
+    @classmethod
+    def _from_row(cls, table: str, row: Dict[str, Any], columns: Optional[Iterable[str]] = None):
+        if table != cls._table:
+            return cls._base_model._from_row(table, row, columns)
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, "_id", row.get("id"))
+        object.__setattr__(obj, "_dirty", None)
+        object.__setattr__(obj, "_extra", None)
+        object.__setattr__(
+            obj, "_deferred", None if columns is None else set(columns).difference(row.keys()) or None
+        )
+        obj._store(row)
+        return obj
+
+    def _store(self, row: Dict[str, Any]) -> None:
+        slots = self._slot_set
+        extra = self._extra
+        for k, v in row.items():
+            if k in slots:
+                object.__setattr__(self, k, v)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[k] = v
+        object.__setattr__(self, "_extra", extra)
+
+    @property
+    def _columns(self) -> FrozenSet[str]:
+        columns = self._sync_schema()
+        extra = self._extra
+        return columns.union(extra) if extra else columns
+
+    @property
+    def _data(self) -> Dict[str, Any]:
+        # Snapshot; Schreiben über _assign()
+        data = {}
+        for c in self._slot_columns:
+            v = getattr(self, c, _MISSING)
+            if v is not _MISSING:
+                data[c] = v
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    @_data.setter
+    def _data(self, row: Dict[str, Any]) -> None:
+        self._store(row)
+
+    def _assign(self, name: str, value: Any) -> None:
+        self._store({name: value})
+
+    def _merge(self, row: Dict[str, Any]) -> None:
+        self._store(row)
+
+    def _register_column(self, name: str) -> None:
+        # neue Spalten landen beim ersten _assign() in _extra
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in ("_extra", "_deferred"):
+            deferred = self._deferred
+            if deferred and name in deferred:
+                self._load_deferred()
+                return getattr(self, name)
+            extra = self._extra
+            if extra and name in extra:
+                return extra[name]
+        raise AttributeError(f"'{type(self).__name__}' hat kein Attribut '{name}'")
+
+
+_MISSING = object()
+
+
+# Postgres-Typ-OID -> array.array-Typcode für spaltenweise Ergebnisse (query_columns)
+_ARRAY_TYPECODES = {16: "b", 20: "q", 21: "h", 23: "i", 700: "f", 701: "d"}
+
+
+# Postgres-Epoche für das binäre COPY-Format
+_PG_EPOCH_DATE = datetime.date(2000, 1, 1)
+_PG_EPOCH_TS = datetime.datetime(2000, 1, 1)
+_PG_EPOCH_TSTZ = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
 
 
 class DynamicModel:
@@ -31,9 +630,35 @@ class DynamicModel:
     Connection-Pooling, Hooks, Migrationen (mit Historie), Soft-Delete, u.v.m.
     """
 
+    # Instanzzustand in Slots; __dict__ bleibt für eigene Attribute von Subklassen
+    __slots__ = ("_table", "_id", "_columns", "_data", "_dirty", "_deferred", "_prefetched", "__dict__", "__weakref__")
+
+    # Namen, die __setattr__ direkt setzt (keine Spalten)
+    _INTERNAL_ATTRS = frozenset(
+        {
+            "_table",
+            "_id",
+            "_columns",
+            "_data",
+            "_dirty",
+            "_deferred",
+            "_prefetched",
+            "_extra",
+            "_connection",
+            "_pool",
+            "_before_hooks",
+            "_after_hooks",
+            "_migrations",
+            "_logger",
+            "_local",
+            "_schema_cache",
+            "_schema_cache_ttl_seconds",
+        }
+    )
+
     # --- Klassenattribute / State ---
     _connection: Optional[psycopg2.extensions.connection] = None
-    _pool: Optional[SimpleConnectionPool] = None
+    _pool: Optional[_ConnectionPool] = None
 
     # Hooks: tabellenspezifisch und global ("*")
     _before_hooks: Dict[str, List[Callable[[dict], None]]] = {}
@@ -52,30 +677,161 @@ class DynamicModel:
     _schema_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
     _schema_cache_ttl_seconds: int = 300
 
+    # Soft-Delete: Cache-Key -> hat Spalte 'deleted' (explizit registriert oder einmal ermittelt)
+    _soft_delete_flags: Dict[str, bool] = {}
+    _soft_delete_registered: Set[str] = set()
+    # indexfreundlich (passt zu partiellen Indexen WHERE deleted IS NOT TRUE), NULL = nicht gelöscht
+    _SOFT_DELETE_SQL = sql.SQL("deleted IS NOT TRUE")
+
+    # von model_for() erzeugte Klassen: (Basisklasse, Tabelle) -> Klasse
+    _model_classes: Dict[Tuple[type, str], type] = {}
+
+    # Schema-Freeze: kein Auto-DDL, vorkompilierte Statements (pro Tabelle bzw. global strikt)
+    _frozen_tables: Dict[str, _FrozenTable] = {}
+    _strict_schema: bool = False
+
+    # Auto-DDL: lock_timeout (ms, None = keins) und Retries mit exponentiellem Backoff
+    _ddl_lock_timeout_ms: Optional[int] = 2000
+    _ddl_retries: int = 5
+    _ddl_backoff_seconds: float = 0.1
+
+    # Verbindungsparameter (für Hintergrund-Verbindungen, z. B. Schema-Listener)
+    _db_params: Dict[str, Any] = {}
+
+    # Cross-Prozess-Invalidierung des Schema-Caches via LISTEN/NOTIFY
+    _schema_channel: Optional[str] = None
+    _schema_listener: Optional[threading.Thread] = None
+    _schema_listener_stop: Optional[threading.Event] = None
+
+    # Spalten-Metadaten direkt aus dem Katalog (statt information_schema);
+    # data_type in der Schreibweise von information_schema.columns (ohne Typmod, 'ARRAY' für
+    # Arrays, 'USER-DEFINED' für Enums/Extension-Typen, Domains als Basistyp),
+    # cast_type als Typname für Casts; is_nullable/column_default wie information_schema
+    _CATALOG_COLUMNS_SQL = """
+        SELECT c.relname AS table_name,
+               a.attname AS column_name,
+               CASE WHEN t.typtype = 'd' THEN
+                        CASE WHEN bt.typelem <> 0 AND bt.typlen = -1 THEN 'ARRAY'
+                             WHEN bt.typnamespace = 'pg_catalog'::regnamespace THEN format_type(t.typbasetype, NULL)
+                             ELSE 'USER-DEFINED' END
+                    WHEN t.typelem <> 0 AND t.typlen = -1 THEN 'ARRAY'
+                    WHEN t.typnamespace = 'pg_catalog'::regnamespace THEN format_type(a.atttypid, NULL)
+                    ELSE 'USER-DEFINED'
+               END AS data_type,
+               format_type(a.atttypid, -1) AS cast_type,
+               CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END AS is_nullable,
+               pg_get_expr(d.adbin, d.adrelid) AS column_default,
+               a.atttypid::BIGINT AS type_oid,
+               a.attnotnull AS not_null,
+               (pk.indrelid IS NOT NULL) AS is_primary_key
+          FROM pg_class c
+          JOIN pg_namespace n ON n.oid = c.relnamespace
+          JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+          JOIN pg_type t ON t.oid = a.atttypid
+          LEFT JOIN pg_type bt ON t.typtype = 'd' AND bt.oid = t.typbasetype
+          LEFT JOIN pg_attrdef d ON d.adrelid = c.oid AND d.adnum = a.attnum
+          LEFT JOIN pg_index pk ON pk.indrelid = c.oid AND pk.indisprimary AND a.attnum = ANY(pk.indkey)
+         WHERE n.nspname = %s
+           AND c.relkind IN ('r', 'p', 'v', 'm', 'f')
+           AND (%s::TEXT[] IS NULL OR c.relname = ANY(%s::TEXT[]))
+         ORDER BY c.relname, a.attnum
+    """
+
+    # Dirty-Tracking: Attribut-Zuweisungen sammeln statt sofort UPDATE
+    _deferred_writes: bool = False
+    _unflushed_check_registered: bool = False
+
+    # Statement-Cache (LRU): Statement-Form -> gerenderter SQL-Text
+    _stmt_cache: "collections.OrderedDict[Tuple[Any, ...], str]" = collections.OrderedDict()
+    _stmt_cache_size: int = 512
+    _stmt_cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+    _stmt_cache_lock = threading.Lock()
+
+    # Server-seitige Prepared Statements (opt-in): Verbindung -> {SQL-Text: Statement-Name}
+    _prepare_enabled: bool = False
+    _prepare_max_per_connection: int = 256
+    _prepared: "weakref.WeakKeyDictionary[Any, collections.OrderedDict[str, str]]" = weakref.WeakKeyDictionary()
+    _prepared_stats: Dict[str, int] = {"prepares": 0, "executes": 0, "evictions": 0}
+    _prepared_names = itertools.count(1)
+
+    # Namen server-seitiger Cursor (stream_query)
+    _stream_names = itertools.count(1)
+
+    # Count-Strategie: 'exact' | 'estimate' | 'cached' (global und pro Tabelle)
+    _count_strategy: str = "exact"
+    _count_strategy_by_table: Dict[str, str] = {}
+    _count_cache_ttl_seconds: float = 60.0
+    _count_cache: "collections.OrderedDict[Tuple[Any, ...], Tuple[float, int]]" = collections.OrderedDict()
+    _count_cache_max_entries: int = 1024
+    _count_cache_lock = threading.Lock()
+
     # ---------------------- Verbindungs-Setup ----------------------------
 
     @classmethod
-    def connect(cls, **db_params):
+    def connect(cls, warm_schema_cache: bool = False, **db_params):
         """
         Einfache Einzelverbindung (kein Pool).
+        warm_schema_cache: lädt direkt das Schema aller Tabellen (preload_schema()).
         """
         cls._connection = psycopg2.connect(**db_params)
         cls._connection.autocommit = False
         cls._pool = None
+        cls._db_params = dict(db_params)
+        if warm_schema_cache:
+            cls.preload_schema()
 
     @classmethod
-    def connect_pool(cls, minconn: int = 1, maxconn: int = 5, **db_params):
+    def connect_pool(
+        cls,
+        minconn: int = 1,
+        maxconn: int = 5,
+        timeout: Optional[float] = 30.0,
+        max_lifetime: Optional[float] = None,
+        max_idle: Optional[float] = None,
+        pre_ping: bool = False,
+        ping_after: float = 30.0,
+        warm_schema_cache: bool = False,
+        **db_params,
+    ):
         """
-        Verbindungs-Pooling via psycopg2.pool.SimpleConnectionPool.
+        Thread-sicheres Verbindungs-Pooling.
+        timeout: max. Wartezeit (s) auf eine freie Verbindung (None = unbegrenzt), sonst PoolTimeout.
+        max_lifetime: Verbindungen nach X Sekunden ersetzen. max_idle: ungenutzte Verbindungen
+        (über minconn hinaus) nach X Sekunden schließen. pre_ping: SELECT 1 vor der Ausgabe
+        einer Verbindung, die mindestens ping_after Sekunden ungenutzt war (Default aus —
+        kostet sonst einen Roundtrip pro Checkout).
         """
-        cls._pool = SimpleConnectionPool(minconn, maxconn, **db_params)
+        cls._pool = _ConnectionPool(
+            minconn,
+            maxconn,
+            timeout=timeout,
+            max_lifetime=max_lifetime,
+            max_idle=max_idle,
+            pre_ping=pre_ping,
+            ping_after=ping_after,
+            **db_params,
+        )
         cls._connection = None
+        cls._db_params = dict(db_params)
+        if warm_schema_cache:
+            cls.preload_schema()
+
+    @classmethod
+    def pool_stats(cls) -> Dict[str, Any]:
+        """
+        Zähler des Pools: checkouts, waits, wait_time_total, timeouts, in_use, idle, size, …
+        Ohne Pool: leeres Dict.
+        """
+        if cls._pool is None:
+            return {}
+        return cls._pool.stats()
 
     @classmethod
     def close(cls) -> None:
         """
         Schließt Einzelverbindung oder Pool (falls vorhanden).
         """
+        cls.disable_schema_notifications()
         if cls._pool is not None:
             try:
                 cls._pool.closeall()
@@ -116,6 +872,158 @@ class DynamicModel:
             # Logger darf niemals stören
             pass
 
+    # ---------------------- Statement-Cache -------------------------------
+
+    @classmethod
+    def set_statement_cache_size(cls, size: int) -> None:
+        """
+        Max. Anzahl gecachter SQL-Texte (0 = Cache aus).
+        """
+        with cls._stmt_cache_lock:
+            cls._stmt_cache_size = max(0, size)
+            while len(cls._stmt_cache) > cls._stmt_cache_size:
+                cls._stmt_cache.popitem(last=False)
+
+    @classmethod
+    def clear_statement_cache(cls) -> None:
+        with cls._stmt_cache_lock:
+            cls._stmt_cache.clear()
+            cls._stmt_cache_stats["hits"] = 0
+            cls._stmt_cache_stats["misses"] = 0
+
+    @classmethod
+    def statement_cache_stats(cls) -> Dict[str, int]:
+        """
+        Zähler des Statement-Caches: hits, misses, size, maxsize.
+        """
+        with cls._stmt_cache_lock:
+            out = dict(cls._stmt_cache_stats)
+            out["size"] = len(cls._stmt_cache)
+            out["maxsize"] = cls._stmt_cache_size
+        return out
+
+    @classmethod
+    def _cached_sql(cls, key: Tuple[Any, ...], conn, build: Callable[[], sql.Composable]) -> str:
+        """
+        Liefert den SQL-Text zur Statement-Form 'key'; komponiert/rendert nur beim ersten Mal.
+        """
+        with cls._stmt_cache_lock:
+            text = cls._stmt_cache.get(key)
+            if text is not None:
+                cls._stmt_cache.move_to_end(key)
+                cls._stmt_cache_stats["hits"] += 1
+                return text
+            cls._stmt_cache_stats["misses"] += 1
+        text = build().as_string(conn)
+        with cls._stmt_cache_lock:
+            if cls._stmt_cache_size > 0:
+                cls._stmt_cache[key] = text
+                while len(cls._stmt_cache) > cls._stmt_cache_size:
+                    cls._stmt_cache.popitem(last=False)
+        return text
+
+    # ---------------------- Prepared Statements ---------------------------
+
+    @classmethod
+    def enable_prepared_statements(cls, enabled: bool = True, max_per_connection: int = 256) -> None:
+        """
+        Opt-in: häufige Statement-Formen (find_ids, count, create, upsert, Laden/Speichern von
+        Instanzen) werden pro Verbindung einmal per PREPARE angelegt und danach per EXECUTE
+        ausgeführt. max_per_connection: LRU-Grenze, ältere werden per DEALLOCATE entfernt.
+        """
+        with cls._stmt_cache_lock:
+            cls._prepare_enabled = enabled
+            cls._prepare_max_per_connection = max(1, max_per_connection)
+            if not enabled:
+                cls._prepared.clear()
+
+    @classmethod
+    def prepared_statement_stats(cls) -> Dict[str, int]:
+        with cls._stmt_cache_lock:
+            out = dict(cls._prepared_stats)
+            out["connections"] = len(cls._prepared)
+            out["statements"] = sum(len(v) for v in cls._prepared.values())
+        return out
+
+    @classmethod
+    def _numbered_params(cls, query: str) -> str:
+        """
+        Ersetzt psycopg2-Platzhalter (%s) durch $1, $2, … für PREPARE.
+        """
+        parts = query.split("%s")
+        return parts[0] + "".join(f"${i}{p}" for i, p in enumerate(parts[1:], start=1))
+
+    @classmethod
+    def _execute(cls, conn, cur, query: str, params: Sequence[Any], prepare: bool = True) -> None:
+        """
+        Führt gecachten SQL-Text aus — bei aktivierten Prepared Statements via EXECUTE.
+        Nur für Statements mit stabilem Ergebnistyp verwenden (kein SELECT *).
+        Kennt der Server das Statement nicht mehr (SQLSTATE 26000, z. B. nach DISCARD ALL auf
+        einer Pool-Verbindung), wird einmal neu vorbereitet und wiederholt.
+        """
+        if not (prepare and cls._prepare_enabled):
+            cur.execute(query, params)
+            return
+        with cls._stmt_cache_lock:
+            try:
+                stmts = cls._prepared.get(conn)
+                if stmts is None:
+                    stmts = cls._prepared[conn] = collections.OrderedDict()
+            except TypeError:
+                # Verbindung nicht weakref-fähig -> ohne PREPARE
+                stmts = None
+        if stmts is None:
+            cur.execute(query, params)
+            return
+
+        # in einer laufenden Transaktion ist ein Fehlschlag nur per Savepoint rücksetzbar;
+        # sonst ist EXECUTE das erste Statement und ein Rollback verwirft nichts anderes
+        savepoint = conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE
+        try:
+            cls._execute_prepared(cur, query, params, stmts, savepoint)
+        except psycopg2.Error as e:
+            if getattr(e, "pgcode", None) != "26000":
+                raise
+            if savepoint:
+                cur.execute("ROLLBACK TO SAVEPOINT dm_prepared")
+            else:
+                conn.rollback()
+            with cls._stmt_cache_lock:
+                stmts.clear()
+            cls._execute_prepared(cur, query, params, stmts, False)
+        if savepoint:
+            with conn.cursor() as sp_cur:
+                sp_cur.execute("RELEASE SAVEPOINT dm_prepared")
+        with cls._stmt_cache_lock:
+            cls._prepared_stats["executes"] += 1
+
+    @classmethod
+    def _execute_prepared(
+        cls, cur, query: str, params: Sequence[Any], stmts: "collections.OrderedDict[str, str]", savepoint: bool
+    ) -> None:
+        # Savepoint im selben Roundtrip wie das erste Statement
+        prefix = "SAVEPOINT dm_prepared; " if savepoint else ""
+        with cls._stmt_cache_lock:
+            name = stmts.get(query)
+            if name is not None:
+                stmts.move_to_end(query)
+            else:
+                evicted = []
+                while len(stmts) >= cls._prepare_max_per_connection:
+                    evicted.append(stmts.popitem(last=False)[1])
+        if name is None:
+            name = f"dm_ps_{next(cls._prepared_names)}"
+            setup = [f"DEALLOCATE {old}" for old in evicted]
+            setup.append(f"PREPARE {name} AS {cls._numbered_params(query)}")
+            cur.execute(prefix + "; ".join(setup))
+            prefix = ""
+            with cls._stmt_cache_lock:
+                stmts[query] = name
+                cls._prepared_stats["prepares"] += 1
+                cls._prepared_stats["evictions"] += len(evicted)
+        exec_sql = f"EXECUTE {name}" + (f" ({', '.join(['%s'] * len(params))})" if params else "")
+        cur.execute(prefix + exec_sql, params)
+
     # ---------------------- Helpers für Connection / Cursor ---------------
 
     @classmethod
@@ -214,8 +1122,142 @@ class DynamicModel:
         return f"public.{table}"
 
     @classmethod
-    def _invalidate_schema_cache(cls, table: str) -> None:
-        cls._schema_cache.pop(cls._cache_key(table), None)
+    def _invalidate_schema_cache(cls, table: str, notify: bool = True) -> None:
+        """
+        Verwirft den Schema-Cache-Eintrag. Mit notify=False sendet der Aufrufer
+        das NOTIFY selbst (z. B. AsyncDynamicModel über seine eigene Verbindung).
+        """
+        key = cls._cache_key(table)
+        cls._schema_cache.pop(key, None)
+        if key not in cls._soft_delete_registered:
+            cls._soft_delete_flags.pop(key, None)
+        if notify and cls._schema_channel:
+            # andere Prozesse informieren (wird mit dem Commit zugestellt)
+            q = "SELECT pg_notify(%s, %s)"
+            params = (cls._schema_channel, key)
+            with cls._get_cursor() as (conn, cur):
+                cls._log_sql(conn, q, params)
+                cur.execute(q, params)
+
+    @classmethod
+    def enable_schema_notifications(
+        cls, channel: str = "dynamic_model_ddl", schema_cache_ttl: Optional[int] = 0
+    ) -> None:
+        """
+        Startet einen Hintergrund-Thread mit eigener Verbindung, der per LISTEN auf DDL-Events
+        wartet und nur die betroffenen Schema-Cache-Einträge verwirft. DDL über DynamicModel
+        sendet selbst NOTIFY; für beliebige DDL siehe install_ddl_event_trigger().
+        schema_cache_ttl: neue TTL (Default 0 = kein Ablauf), None = unverändert.
+        """
+        if not cls._db_params:
+            raise RuntimeError("Bitte erst DynamicModel.connect() oder connect_pool() aufrufen.")
+        cls.disable_schema_notifications()
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=cls._schema_listener_loop,
+            args=(channel, dict(cls._db_params), stop),
+            name=f"dynamic-model-listen-{channel}",
+            daemon=True,
+        )
+        cls._schema_channel = channel
+        cls._schema_listener_stop = stop
+        cls._schema_listener = thread
+        if schema_cache_ttl is not None:
+            cls.set_schema_cache_ttl(schema_cache_ttl)
+        thread.start()
+
+    @classmethod
+    def disable_schema_notifications(cls) -> None:
+        if cls._schema_listener_stop is not None:
+            cls._schema_listener_stop.set()
+        if cls._schema_listener is not None and cls._schema_listener is not threading.current_thread():
+            cls._schema_listener.join(timeout=5)
+        cls._schema_channel = None
+        cls._schema_listener = None
+        cls._schema_listener_stop = None
+
+    @classmethod
+    def _schema_listener_loop(cls, channel: str, db_params: Dict[str, Any], stop: threading.Event) -> None:
+        backoff = 1.0
+        while not stop.is_set():
+            conn = None
+            try:
+                conn = psycopg2.connect(**db_params)
+                conn.autocommit = True
+                with conn.cursor() as cur:
+                    cur.execute(sql.SQL("LISTEN {}").format(sql.Identifier(channel)))
+                # während einer Unterbrechung verpasste Events -> alles verwerfen
+                cls._schema_cache.clear()
+                backoff = 1.0
+                while not stop.is_set():
+                    if select.select([conn], [], [], 1.0) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        note = conn.notifies.pop(0)
+                        key = note.payload.replace('"', "")
+                        cls._schema_cache.pop(key, None)
+                        if key not in cls._soft_delete_registered:
+                            cls._soft_delete_flags.pop(key, None)
+            except Exception:
+                stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+    @classmethod
+    def install_ddl_event_trigger(cls, channel: str = "dynamic_model_ddl") -> None:
+        """
+        Legt einen Event-Trigger an, der bei jeder DDL (auch außerhalb von DynamicModel)
+        NOTIFY '<schema>.<tabelle>' sendet. Benötigt Superuser-Rechte.
+        """
+        func = sql.SQL(
+            """
+            CREATE OR REPLACE FUNCTION dynamic_model_ddl_notify() RETURNS event_trigger AS $$
+            DECLARE
+                r RECORD;
+            BEGIN
+                IF TG_EVENT = 'sql_drop' THEN
+                    FOR r IN SELECT * FROM pg_event_trigger_dropped_objects() LOOP
+                        IF r.object_type IN ('table', 'view', 'materialized view', 'foreign table') THEN
+                            PERFORM pg_notify({ch}, r.object_identity);
+                        END IF;
+                    END LOOP;
+                ELSE
+                    FOR r IN SELECT * FROM pg_event_trigger_ddl_commands() LOOP
+                        IF r.object_type IN ('table', 'view', 'materialized view', 'foreign table') THEN
+                            PERFORM pg_notify({ch}, r.object_identity);
+                        END IF;
+                    END LOOP;
+                END IF;
+            END;
+            $$ LANGUAGE plpgsql;
+            """
+        ).format(ch=sql.Literal(channel))
+        triggers = sql.SQL(
+            """
+            DO $$
+            BEGIN
+                IF NOT EXISTS (SELECT 1 FROM pg_event_trigger WHERE evtname = 'dynamic_model_ddl_end') THEN
+                    CREATE EVENT TRIGGER dynamic_model_ddl_end ON ddl_command_end
+                    EXECUTE FUNCTION dynamic_model_ddl_notify();
+                END IF;
+                IF NOT EXISTS (SELECT 1 FROM pg_event_trigger WHERE evtname = 'dynamic_model_ddl_drop') THEN
+                    CREATE EVENT TRIGGER dynamic_model_ddl_drop ON sql_drop
+                    EXECUTE FUNCTION dynamic_model_ddl_notify();
+                END IF;
+            END$$;
+            """
+        )
+        with cls._get_cursor() as (conn, cur):
+            cls._log_sql(conn, func, None)
+            cur.execute(func)
+            cls._log_sql(conn, triggers, None)
+            cur.execute(triggers)
 
     @classmethod
     def inspect_schema(cls, table: str) -> List[Dict[str, Any]]:
@@ -223,25 +1265,54 @@ class DynamicModel:
         Gibt Metadaten zu Spalten zurück: name, type, nullable, default…
         mit TTL-Cache.
         """
-        key = cls._cache_key(table)
+        entry = cls._schema_cache.get(cls._cache_key(table))
+        if entry is not None and cls._schema_entry_fresh(entry):
+            return entry[1]
+        return cls._load_catalog("public", [table])[table]
+
+    @classmethod
+    def _schema_entry_fresh(cls, entry: Tuple[float, List[Dict[str, Any]]]) -> bool:
+        ttl = cls._schema_cache_ttl_seconds
+        return ttl == 0 or (time.time() - entry[0]) < ttl
+
+    @classmethod
+    def preload_schema(cls, schema: str = "public") -> int:
+        """
+        Lädt die Spalten-Metadaten aller Tabellen eines Schemas mit einer Katalog-Query
+        (pg_class/pg_attribute) in den Schema-Cache. Gibt die Anzahl Tabellen zurück.
+        Einträge enthalten zusätzlich cast_type, type_oid, not_null und is_primary_key.
+        """
+        return len(cls._load_catalog(schema, None))
+
+    @classmethod
+    def _catalog_params(cls, schema: str, tables: Optional[List[str]]) -> List[Any]:
+        return [schema, tables, tables]
+
+    @classmethod
+    def _store_catalog_rows(
+        cls, schema: str, rows: Iterable[Dict[str, Any]], tables: Optional[List[str]], now: float
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        grouped: Dict[str, List[Dict[str, Any]]] = {t: [] for t in tables or ()}
+        for r in rows:
+            r = dict(r)
+            grouped.setdefault(r.pop("table_name"), []).append(r)
+        for t, infos in grouped.items():
+            key = f"{schema}.{t}"
+            cls._schema_cache[key] = (now, infos)
+            # automatisch ermittelte Soft-Delete-Flags gelten nur so lange wie der Cache-Eintrag
+            if key not in cls._soft_delete_registered:
+                cls._soft_delete_flags.pop(key, None)
+        return grouped
+
+    @classmethod
+    def _load_catalog(cls, schema: str, tables: Optional[List[str]]) -> Dict[str, List[Dict[str, Any]]]:
         now = time.time()
-        if key in cls._schema_cache:
-            ts, infos = cls._schema_cache[key]
-            if cls._schema_cache_ttl_seconds == 0 or (now - ts) < cls._schema_cache_ttl_seconds:
-                return infos
-
-        qry = """
-            SELECT column_name, data_type, is_nullable, column_default
-              FROM information_schema.columns
-             WHERE table_schema = 'public' AND table_name = %s
-             ORDER BY ordinal_position
-        """
-        with cls._get_cursor(dict_cursor=True) as (_, cur):
-            cls._log_sql(_, qry, (table,))
-            cur.execute(qry, (table,))
+        params = cls._catalog_params(schema, tables)
+        with cls._get_cursor(dict_cursor=True) as (conn, cur):
+            cls._log_sql(conn, cls._CATALOG_COLUMNS_SQL, params)
+            cur.execute(cls._CATALOG_COLUMNS_SQL, params)
             rows = cur.fetchall()
-            cls._schema_cache[key] = (now, rows)
-            return rows
+        return cls._store_catalog_rows(schema, rows, tables, now)
 
     @classmethod
     def _has_column(cls, table: str, column: str) -> bool:
@@ -253,6 +1324,7 @@ class DynamicModel:
         """
         Fügt mehrere Spalten mit expliziten SQL-Typen hinzu (falls nicht vorhanden).
         columns: {column: "SQLTYPE [DEFAULT ...] [NOT NULL]"}
+        Ein ALTER TABLE mit allen Spalten, unter lock_timeout und mit Retries (set_ddl_options).
         """
         if not columns:
             return
@@ -267,13 +1339,150 @@ class DynamicModel:
             sql.Identifier(table),
             sql.SQL(", ").join(stmts)
         )
+        attempt = 0
+        while True:
+            try:
+                if cls._in_transaction():
+                    # in äußerer Transaktion nur über Savepoint wiederholbar
+                    with cls.savepoint(f"dm_ddl_{attempt}"):
+                        cls._execute_ddl(stmt)
+                else:
+                    cls._execute_ddl(stmt)
+                break
+            except psycopg2.Error as e:
+                # 55P03 = lock_not_available (lock_timeout überschritten)
+                if getattr(e, "pgcode", None) != "55P03" or attempt >= cls._ddl_retries:
+                    raise
+                time.sleep(cls._ddl_backoff_seconds * (2 ** attempt))
+                attempt += 1
+        cls._invalidate_schema_cache(table)
+
+    @classmethod
+    def _execute_ddl(cls, stmt: sql.Composable) -> None:
         with cls._get_cursor() as (conn, cur):
+            restore = None
+            if cls._ddl_lock_timeout_ms is not None:
+                if cls._in_transaction():
+                    cur.execute("SELECT current_setting('lock_timeout')")
+                    restore = cur.fetchone()[0]
+                cur.execute("SELECT set_config('lock_timeout', %s, true)", (f"{cls._ddl_lock_timeout_ms}ms",))
             cls._log_sql(conn, stmt, None)
             cur.execute(stmt)
+            if restore is not None:
+                cur.execute("SELECT set_config('lock_timeout', %s, true)", (restore,))
+
+    @classmethod
+    def set_ddl_options(
+        cls,
+        lock_timeout_ms: Optional[int] = 2000,
+        retries: int = 5,
+        backoff_seconds: float = 0.1,
+    ) -> None:
+        """
+        Auto-DDL (fehlende Spalten): lock_timeout je Versuch (None = unbegrenzt warten),
+        Anzahl Wiederholungen bei Lock-Timeout und Start-Backoff (verdoppelt sich je Versuch).
+        """
+        cls._ddl_lock_timeout_ms = lock_timeout_ms
+        cls._ddl_retries = max(0, retries)
+        cls._ddl_backoff_seconds = max(0.0, backoff_seconds)
+
+    # -------------------- Schema-Freeze -----------------------------------
+
+    @classmethod
+    def set_strict_schema(cls, enabled: bool = True) -> None:
+        """
+        Global: kein Auto-DDL mehr — unbekannte Spalten lösen ValueError aus.
+        """
+        cls._strict_schema = enabled
+
+    @classmethod
+    def freeze_schema(cls, table: str) -> None:
+        """
+        Friert das Schema einer Tabelle ein: Auto-DDL aus (unbekannte Spalten -> ValueError),
+        Spaltenreihenfolge aus einem Snapshot, INSERT/UPDATE-Statements vorkompiliert.
+        Nach bewusster DDL an der Tabelle erneut aufrufen.
+        """
         cls._invalidate_schema_cache(table)
+        infos = cls.inspect_schema(table)
+        if not infos:
+            raise ValueError(f"Tabelle '{table}' existiert nicht.")
+        plan = _FrozenTable([r["column_name"] for r in infos])
+        data_cols = tuple(c for c in plan.columns if c != "id")
+        with cls._get_cursor() as (conn, _):
+            cls._frozen_insert_sql(plan, conn, table, data_cols)
+            cls._frozen_update_sql(plan, conn, table, data_cols)
+        cls._frozen_tables[table] = plan
+
+    @classmethod
+    def unfreeze_schema(cls, table: str) -> None:
+        cls._frozen_tables.pop(table, None)
+
+    @classmethod
+    def _check_auto_ddl(cls, table: str, missing: Iterable[str]) -> None:
+        missing = sorted(missing)
+        if missing and (cls._strict_schema or table in cls._frozen_tables):
+            raise ValueError(
+                f"Unbekannte Spalte(n) {', '.join(missing)} in Tabelle '{table}' (Schema eingefroren)."
+            )
+
+    @classmethod
+    def _auto_add_columns(cls, table: str, missing: Dict[str, str]) -> None:
+        """
+        Auto-DDL für fehlende Spalten — außer bei eingefrorenem/striktem Schema.
+        """
+        if missing:
+            cls._check_auto_ddl(table, missing)
+            cls.ensure_columns(table, missing)
+
+    @classmethod
+    def _frozen_insert_sql(cls, plan: _FrozenTable, conn, table: str, cols: Tuple[str, ...]) -> str:
+        text = plan.insert_sql.get(cols)
+        if text is None:
+            cls._check_auto_ddl(table, set(cols) - plan.column_set)
+            text = sql.SQL("INSERT INTO {} ({}) VALUES ({}) RETURNING {}").format(
+                sql.Identifier(table),
+                sql.SQL(", ").join(map(sql.Identifier, cols)),
+                sql.SQL(", ").join([sql.Placeholder()] * len(cols)),
+                sql.SQL(", ").join(map(sql.Identifier, plan.columns)),
+            ).as_string(conn)
+            plan.insert_sql[cols] = text
+        return text
+
+    @classmethod
+    def _frozen_update_sql(cls, plan: _FrozenTable, conn, table: str, cols: Tuple[str, ...]) -> str:
+        text = plan.update_sql.get(cols)
+        if text is None:
+            cls._check_auto_ddl(table, set(cols) - plan.column_set)
+            text = sql.SQL("UPDATE {t} SET {sets} WHERE id = %s").format(
+                t=sql.Identifier(table),
+                sets=sql.SQL(", ").join(sql.SQL("{} = %s").format(sql.Identifier(c)) for c in cols),
+            ).as_string(conn)
+            plan.update_sql[cols] = text
+        return text
 
     # -------------------- Type-Inference ----------------------------------
 
+    @classmethod
+    def _missing_column_types(
+        cls,
+        existing: Set[str],
+        sample: Dict[str, Any],
+        column_types: Optional[Dict[str, str]] = None,
+        infer_types: bool = True,
+    ) -> Dict[str, str]:
+        """
+        {spalte: SQL-Typ} für alle Keys aus sample (außer id), die noch nicht existieren.
+        """
+        missing: Dict[str, str] = {}
+        for col, val in sample.items():
+            if col == "id" or col in existing:
+                continue
+            typ = (column_types or {}).get(col) if column_types else None
+            if not typ and infer_types:
+                typ = cls._infer_pg_type(val)
+            missing[col] = typ or "TEXT"
+        return missing
+
     @classmethod
     def _infer_pg_type(cls, value: Any) -> str:
         if value is None:
@@ -351,39 +1560,45 @@ class DynamicModel:
         cond_sql: sql.SQL,
         cond_vals: List[Any],
         exclude_deleted: bool,
+        has_deleted: Optional[bool] = None,
     ) -> Tuple[sql.SQL, List[Any]]:
         """
         Hängt an WHERE-Klauseln zusätzliche Filter für Soft-Delete an, wenn Spalte 'deleted' existiert.
+        has_deleted: bereits bekannt (z. B. async ermittelt) — sonst per Schema-Cache geprüft.
         """
         vals = list(cond_vals)
-        if exclude_deleted and cls._has_column(table, "deleted"):
-            soft = sql.SQL("COALESCE(deleted, FALSE) = FALSE")
-            if cond_sql:
-                cond_sql = sql.SQL("{} AND {}").format(cond_sql, soft)
-            else:
-                cond_sql = soft
-        if cond_sql:
-            base_sql += sql.SQL(" WHERE {}").format(cond_sql)
+        # sql.SQL("") ist truthy -> explizit auf "keine Bedingungen" prüfen
+        parts = [] if cond_sql == sql.SQL("") else [cond_sql]
+        if has_deleted is None and exclude_deleted:
+            has_deleted = cls._soft_delete_active(table)
+        if exclude_deleted and has_deleted:
+            parts.append(cls._SOFT_DELETE_SQL)
+        if parts:
+            base_sql += sql.SQL(" WHERE {}").format(sql.SQL(" AND ").join(parts))
         return base_sql, vals
 
     # -------------------- SELECT Hilfen -----------------------------------
 
     @classmethod
-    def find_ids(
+    def _build_select(
         cls,
         table: str,
+        select_sql: sql.Composable,
         order_by: Iterable[str] = (),
         exclude_deleted: bool = True,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-        **conditions,
-    ) -> List[int]:
+        conditions: Optional[Dict[str, Any]] = None,
+        has_deleted: Optional[bool] = None,
+    ) -> Tuple[sql.Composed, List[Any]]:
         """
-        SELECT id FROM … WHERE … ORDER BY … LIMIT/OFFSET …
+        Baut SELECT <select_sql> FROM … WHERE … ORDER BY … LIMIT/OFFSET … inkl. Soft-Delete-Filter.
         """
-        cond_sql, cond_vals = cls._build_conditions(conditions)
-        q = sql.SQL("SELECT id FROM {}").format(sql.Identifier(table))
-        q, cond_vals = cls._append_soft_delete_filter(table, q, cond_sql, cond_vals, exclude_deleted)
+        cond_sql, cond_vals = cls._build_conditions(conditions or {})
+        q = sql.SQL("SELECT {} FROM {}").format(select_sql, sql.Identifier(table))
+        q, cond_vals = cls._append_soft_delete_filter(
+            table, q, cond_sql, cond_vals, exclude_deleted, has_deleted
+        )
 
         if order_by:
             ob_parts = []
@@ -399,12 +1614,211 @@ class DynamicModel:
         if offset is not None:
             q += sql.SQL(" OFFSET %s")
             cond_vals.append(offset)
+        return q, cond_vals
+
+    @classmethod
+    def _compiled_select(
+        cls,
+        conn,
+        table: str,
+        select: Union[str, Tuple[str, ...]],
+        order_by: Iterable[str] = (),
+        exclude_deleted: bool = True,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        conditions: Optional[Dict[str, Any]] = None,
+        has_deleted: Optional[bool] = None,
+    ) -> Tuple[str, List[Any]]:
+        """
+        Wie _build_select, aber als (gecachter) SQL-Text + Parameter.
+        select: fester SQL-Ausdruck der Projektion ("id", "*", "COUNT(*)") oder Tupel von Spaltennamen.
+        """
+        conditions = conditions or {}
+        order_by = tuple(order_by)
+        if exclude_deleted and has_deleted is None:
+            has_deleted = cls._soft_delete_active(table)
+        soft = bool(exclude_deleted and has_deleted)
+        vals: List[Any] = []
+        shape = []
+        for col, val in conditions.items():
+            is_list = isinstance(val, (list, tuple, set))
+            shape.append((col, is_list))
+            vals.append(list(val) if is_list else val)
+        if limit is not None:
+            vals.append(limit)
+        if offset is not None:
+            vals.append(offset)
+        key = ("select", table, select, tuple(shape), order_by, limit is not None, offset is not None, soft)
+        text = cls._cached_sql(
+            key,
+            conn,
+            lambda: cls._build_select(
+                table,
+                sql.SQL(select) if isinstance(select, str) else sql.SQL(", ").join(map(sql.Identifier, select)),
+                order_by,
+                exclude_deleted,
+                limit,
+                offset,
+                conditions,
+                soft,
+            )[0],
+        )
+        return text, vals
 
+    @classmethod
+    def find_ids(
+        cls,
+        table: str,
+        order_by: Iterable[str] = (),
+        exclude_deleted: bool = True,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        **conditions,
+    ) -> List[int]:
+        """
+        SELECT id FROM … WHERE … ORDER BY … LIMIT/OFFSET …
+        """
         with cls._get_cursor() as (conn, cur):
+            q, cond_vals = cls._compiled_select(
+                conn, table, "id", order_by, exclude_deleted, limit, offset, conditions
+            )
             cls._log_sql(conn, q, cond_vals)
-            cur.execute(q, cond_vals)
+            cls._execute(conn, cur, q, cond_vals)
             return [r[0] for r in cur.fetchall()]
 
+    @classmethod
+    def find_rows(
+        cls,
+        table: str,
+        order_by: Iterable[str] = (),
+        exclude_deleted: bool = True,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+        **conditions,
+    ) -> List[Dict[str, Any]]:
+        """
+        Wie find_ids, liefert aber komplette Zeilen (SELECT *) als Dicts — ein Roundtrip.
+        columns: nur diese Spalten laden (Projektion) statt SELECT *.
+        """
+        with cls._get_cursor(dict_cursor=True) as (conn, cur):
+            q, cond_vals = cls._compiled_select(
+                conn, table, tuple(columns) if columns else "*", order_by, exclude_deleted, limit, offset, conditions
+            )
+            cls._log_sql(conn, q, cond_vals)
+            cur.execute(q, cond_vals)
+            return [dict(r) for r in cur.fetchall()]
+
+    @classmethod
+    def _from_row(
+        cls, table: str, row: Dict[str, Any], columns: Optional[Iterable[str]] = None
+    ) -> "DynamicModel":
+        """
+        Baut eine Instanz direkt aus einer bereits geladenen Zeile (ohne weitere Queries).
+        Ohne columns muss die Zeile alle Spalten der Tabelle enthalten (SELECT *);
+        mit columns (alle Spalten der Tabelle) werden fehlende Spalten bei Bedarf nachgeladen.
+        """
+        obj = cls.__new__(cls)
+        obj._table = table
+        obj._id = row.get("id")
+        if columns is None:
+            obj._columns = set(row.keys())
+            obj._deferred = None
+        else:
+            obj._columns = set(columns)
+            obj._deferred = obj._columns - row.keys() or None
+        obj._data = dict(row)
+        obj._dirty = None
+        return obj
+
+    @classmethod
+    def _from_rows(
+        cls, table: str, rows: Iterable[Dict[str, Any]], columns: Optional[Iterable[str]] = None
+    ) -> List["DynamicModel"]:
+        objs = [cls._from_row(table, r, columns) for r in rows]
+        if columns is not None:
+            cls._link_deferred(objs)
+        return objs
+
+    @classmethod
+    def _link_deferred(cls, objs: Sequence["DynamicModel"]) -> None:
+        """
+        Verknüpft die Instanzen eines Abrufs, damit nicht geladene Spalten beim ersten Zugriff
+        für alle gemeinsam nachgeladen werden (siehe _load_deferred).
+        """
+        members = [o for o in objs if o._deferred]
+        if len(members) < 2:
+            return
+        batch = _DeferredBatch(members)
+        for o in members:
+            deferred = _DeferredSet(o._deferred)
+            deferred.batch = batch
+            object.__setattr__(o, "_deferred", deferred)
+
+    @classmethod
+    def _projection(
+        cls, table: str, only: Optional[Iterable[str]] = None, defer: Optional[Iterable[str]] = None
+    ) -> Tuple[Optional[Tuple[str, ...]], Optional[Tuple[str, ...]]]:
+        """
+        Spaltenauswahl für only=/defer=: (zu ladende Spalten, alle Spalten der Tabelle).
+        id wird immer geladen. Ohne only/defer: (None, None) = SELECT *.
+        """
+        if not only and not defer:
+            return None, None
+        columns = tuple(r["column_name"] for r in cls.inspect_schema(table))
+        if not columns:
+            raise ValueError(f"Tabelle '{table}' existiert nicht.")
+        requested = set(only or ()) | set(defer or ())
+        unknown = requested.difference(columns)
+        if unknown:
+            raise ValueError(f"Unbekannte Spalte(n) {', '.join(sorted(unknown))} in Tabelle '{table}'.")
+        if only:
+            wanted = set(only) | {"id"}
+            selected = tuple(c for c in columns if c in wanted)
+        else:
+            skipped = set(defer) - {"id"}
+            selected = tuple(c for c in columns if c not in skipped)
+        return selected, columns
+
+    @classmethod
+    def model_for(cls, table: str) -> type:
+        """
+        Erzeugt (einmalig, gecacht) eine Modellklasse für `table` aus dem Schema-Cache:
+        ein __slots__-Eintrag pro Spalte statt _data-Dict/_columns-Set pro Instanz,
+        Lesezugriffe laufen direkt über die Slot-Deskriptoren. Ändert sich das Schema,
+        passt die Klasse ihre Spaltenliste beim nächsten Laden an (neue Spalten ohne Slot).
+        Konstruktor: Model(row_id); Abfragen über die Klasse (z. B. Model.get_all(table))
+        liefern Instanzen des Modells. save/delete/to_dict wie gewohnt.
+        """
+        key = (cls, table)
+        model = cls._model_classes.get(key)
+        if model is not None:
+            return model
+        infos = cls.inspect_schema(table)
+        if not infos:
+            raise ValueError(f"Tabelle '{table}' existiert nicht.")
+        columns = tuple(r["column_name"] for r in infos)
+        slots = tuple(
+            c
+            for c in columns
+            if c.isidentifier() and not keyword.iskeyword(c) and not c.startswith("_") and not hasattr(cls, c)
+        )
+        model = type(
+            f"{cls.__name__}[{table}]",
+            (_SlotsModel, cls),
+            {
+                "__slots__": slots + ("_extra",),
+                "_table": table,
+                "_table_columns": frozenset(columns),
+                "_slot_columns": slots,
+                "_slot_set": frozenset(slots),
+                "_slots_all": slots,
+                "_schema_infos": infos,
+                "_base_model": cls,
+            },
+        )
+        return cls._model_classes.setdefault(key, model)
+
     @classmethod
     def list_all_ids(cls, table: str, exclude_deleted: bool = True) -> List[int]:
         return cls.find_ids(table, exclude_deleted=exclude_deleted)
@@ -415,10 +1829,19 @@ class DynamicModel:
         table: str,
         order_by: Iterable[str] = (),
         exclude_deleted: bool = True,
+        only: Optional[Iterable[str]] = None,
+        defer: Optional[Iterable[str]] = None,
         **conditions,
     ) -> List["DynamicModel"]:
-        ids = cls.find_ids(table, order_by=order_by, exclude_deleted=exclude_deleted, **conditions)
-        return [cls(table, i) for i in ids]
+        """
+        only=/defer=: nur diese Spalten laden bzw. diese auslassen; ausgelassene Spalten
+        werden beim ersten Zugriff mit einer Query für alle Instanzen des Abrufs nachgeladen.
+        """
+        selected, columns = cls._projection(table, only, defer)
+        rows = cls.find_rows(
+            table, order_by=order_by, exclude_deleted=exclude_deleted, columns=selected, **conditions
+        )
+        return cls._from_rows(table, rows, columns)
 
     @classmethod
     def paginate(
@@ -428,20 +1851,146 @@ class DynamicModel:
         per_page: int = 25,
         order_by: Iterable[str] = (),
         exclude_deleted: bool = True,
+        only: Optional[Iterable[str]] = None,
+        defer: Optional[Iterable[str]] = None,
         **conditions,
     ) -> List["DynamicModel"]:
         if page < 1:
             page = 1
         offset = (page - 1) * per_page
-        ids = cls.find_ids(
+        selected, columns = cls._projection(table, only, defer)
+        rows = cls.find_rows(
             table,
             order_by=order_by,
             exclude_deleted=exclude_deleted,
             limit=per_page,
             offset=offset,
+            columns=selected,
             **conditions,
         )
-        return [cls(table, i) for i in ids]
+        return cls._from_rows(table, rows, columns)
+
+    @classmethod
+    def _encode_cursor(cls, values: Sequence[Any], direction: str) -> str:
+        def enc(v: Any) -> Any:
+            if isinstance(v, datetime.datetime):
+                return {"$dt": v.isoformat()}
+            if isinstance(v, datetime.date):
+                return {"$d": v.isoformat()}
+            if isinstance(v, decimal.Decimal):
+                return {"$dec": str(v)}
+            if isinstance(v, uuid.UUID):
+                return {"$uuid": str(v)}
+            return v
+
+        payload = json.dumps({"v": [enc(v) for v in values], "d": direction}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def _decode_cursor(cls, token: str) -> Tuple[List[Any], str]:
+        def dec(v: Any) -> Any:
+            if isinstance(v, dict):
+                if "$dt" in v:
+                    return datetime.datetime.fromisoformat(v["$dt"])
+                if "$d" in v:
+                    return datetime.date.fromisoformat(v["$d"])
+                if "$dec" in v:
+                    return decimal.Decimal(v["$dec"])
+                if "$uuid" in v:
+                    return uuid.UUID(v["$uuid"])
+            return v
+
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            payload = json.loads(raw.decode("utf-8"))
+            direction = payload["d"]
+            if direction not in ("next", "prev"):
+                raise ValueError(direction)
+            return [dec(v) for v in payload["v"]], direction
+        except Exception as e:
+            raise ValueError(f"Ungültiger Pagination-Cursor: {token!r}") from e
+
+    @classmethod
+    def paginate_after(
+        cls,
+        table: str,
+        order_by: Iterable[str] = ("id",),
+        after: Optional[str] = None,
+        per_page: int = 25,
+        exclude_deleted: bool = True,
+        **conditions,
+    ) -> Tuple[List["DynamicModel"], Optional[str], Optional[str]]:
+        """
+        Keyset-(Seek-)Pagination: WHERE (order_by…, id) > (Werte der letzten Zeile) statt OFFSET —
+        jede Seite kostet gleich viel, egal wie tief.
+        Gibt (items, next_cursor, prev_cursor) zurück; Cursor sind opake Strings für 'after'
+        (None = keine weitere Seite). 'id' wird als Tie-Breaker angehängt.
+        Die order_by-Spalten sollten NOT NULL sein.
+        """
+        spec: List[Tuple[str, bool]] = [(str(c).lstrip("-"), str(c).startswith("-")) for c in order_by]
+        if not any(c == "id" for c, _ in spec):
+            spec.append(("id", bool(spec) and all(d for _, d in spec)))
+        values: Optional[List[Any]] = None
+        direction = "next"
+        if after:
+            values, direction = cls._decode_cursor(after)
+            if len(values) != len(spec):
+                raise ValueError("Pagination-Cursor passt nicht zu order_by.")
+        # Rückwärts blättern = umgekehrte Sortierung, Ergebnis danach wieder umdrehen
+        eff = [(c, d != (direction == "prev")) for c, d in spec]
+
+        cond_sql, cond_vals = cls._build_conditions(conditions)
+        if values is not None:
+            if all(d for _, d in eff) or not any(d for _, d in eff):
+                op = sql.SQL("<" if eff[0][1] else ">")
+                seek = sql.SQL("({}) {} ({})").format(
+                    sql.SQL(", ").join(sql.Identifier(c) for c, _ in eff),
+                    op,
+                    sql.SQL(", ").join([sql.Placeholder()] * len(eff)),
+                )
+                seek_vals = list(values)
+            else:
+                # gemischte Richtungen: (a > x) OR (a = x AND b < y) OR …
+                ors, seek_vals = [], []
+                for i, (col, desc) in enumerate(eff):
+                    ands = [sql.SQL("{} = %s").format(sql.Identifier(c)) for c, _ in eff[:i]]
+                    ands.append(sql.SQL("{} {} %s").format(sql.Identifier(col), sql.SQL("<" if desc else ">")))
+                    ors.append(sql.SQL("({})").format(sql.SQL(" AND ").join(ands)))
+                    seek_vals.extend(values[: i + 1])
+                seek = sql.SQL("({})").format(sql.SQL(" OR ").join(ors))
+            cond_sql = sql.SQL("{} AND {}").format(cond_sql, seek) if conditions else seek
+            cond_vals = cond_vals + seek_vals
+
+        q = sql.SQL("SELECT * FROM {}").format(sql.Identifier(table))
+        q, vals = cls._append_soft_delete_filter(table, q, cond_sql, cond_vals, exclude_deleted)
+        q += sql.SQL(" ORDER BY ") + sql.SQL(", ").join(
+            sql.Identifier(c) + sql.SQL(" DESC" if d else " ASC") for c, d in eff
+        )
+        q += sql.SQL(" LIMIT %s")
+        vals.append(per_page + 1)
+
+        with cls._get_cursor(dict_cursor=True) as (conn, cur):
+            cls._log_sql(conn, q, vals)
+            cur.execute(q, vals)
+            rows = [dict(r) for r in cur.fetchall()]
+
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+        if direction == "prev":
+            rows.reverse()
+
+        def token(row: Dict[str, Any], d: str) -> str:
+            return cls._encode_cursor([row[c] for c, _ in spec], d)
+
+        next_cursor = prev_cursor = None
+        if rows:
+            if direction == "next":
+                next_cursor = token(rows[-1], "next") if has_more else None
+                prev_cursor = token(rows[0], "prev") if values is not None else None
+            else:
+                next_cursor = token(rows[-1], "next")
+                prev_cursor = token(rows[0], "prev") if has_more else None
+        return cls._from_rows(table, rows), next_cursor, prev_cursor
 
     @classmethod
     def paginate_with_count(
@@ -451,9 +2000,13 @@ class DynamicModel:
         per_page: int = 25,
         order_by: Iterable[str] = (),
         exclude_deleted: bool = True,
+        count_strategy: Optional[str] = None,
         **conditions,
     ) -> Tuple[List["DynamicModel"], int]:
-        total = cls.count(table, exclude_deleted=exclude_deleted, **conditions)
+        """
+        Seite + Gesamtanzahl; count_strategy wie bei count().
+        """
+        total = cls.count(table, exclude_deleted=exclude_deleted, count_strategy=count_strategy, **conditions)
         items = cls.paginate(
             table, page=page, per_page=per_page, order_by=order_by, exclude_deleted=exclude_deleted, **conditions
         )
@@ -461,39 +2014,199 @@ class DynamicModel:
 
     @classmethod
     def first(cls, table: str, exclude_deleted: bool = True, **conditions) -> Optional["DynamicModel"]:
-        ids = cls.find_ids(table, order_by=("id",), exclude_deleted=exclude_deleted, limit=1, **conditions)
-        return cls(table, ids[0]) if ids else None
+        rows = cls.find_rows(table, order_by=("id",), exclude_deleted=exclude_deleted, limit=1, **conditions)
+        return cls._from_row(table, rows[0]) if rows else None
+
+    @classmethod
+    def last(cls, table: str, exclude_deleted: bool = True, **conditions) -> Optional["DynamicModel"]:
+        rows = cls.find_rows(table, order_by=("-id",), exclude_deleted=exclude_deleted, limit=1, **conditions)
+        return cls._from_row(table, rows[0]) if rows else None
+
+    @classmethod
+    def get_by(
+        cls,
+        table: str,
+        exclude_deleted: bool = True,
+        only: Optional[Iterable[str]] = None,
+        defer: Optional[Iterable[str]] = None,
+        **conditions,
+    ) -> Optional["DynamicModel"]:
+        selected, columns = cls._projection(table, only, defer)
+        rows = cls.find_rows(table, exclude_deleted=exclude_deleted, limit=1, columns=selected, **conditions)
+        return cls._from_row(table, rows[0], columns) if rows else None
+
+    @classmethod
+    def iter_all(
+        cls,
+        table: str,
+        batch_size: int = 1000,
+        order_by: Iterable[str] = (),
+        exclude_deleted: bool = True,
+        only: Optional[Iterable[str]] = None,
+        defer: Optional[Iterable[str]] = None,
+        **conditions,
+    ) -> Iterator["DynamicModel"]:
+        """
+        Wie get_all, aber als Generator über einen server-seitigen Cursor (stream_query):
+        es werden je batch_size Zeilen geholt und Instanzen einzeln erzeugt — konstanter
+        Speicher auch bei sehr großen Tabellen. Bedingungen/Soft-Delete wie find_ids.
+        Mit model_for()-Klassen (Model.iter_all(table)) entstehen Slot-Instanzen.
+        """
+        selected, columns = cls._projection(table, only, defer)
+        select_sql = sql.SQL(", ").join(map(sql.Identifier, selected)) if selected else sql.SQL("*")
+        q, vals = cls._build_select(table, select_sql, order_by, exclude_deleted, conditions=conditions)
+        with cls.stream_query(q, vals, fetch_size=batch_size) as rows:
+            for row in rows:
+                yield cls._from_row(table, row, columns)
+
+    @classmethod
+    def get_many(
+        cls,
+        table: str,
+        ids: Iterable[Any],
+        exclude_deleted: bool = True,
+        missing: str = "skip",
+        chunk_size: int = 1000,
+        only: Optional[Iterable[str]] = None,
+        defer: Optional[Iterable[str]] = None,
+    ) -> List[Optional["DynamicModel"]]:
+        """
+        Lädt Datensätze per Primärschlüssel mit WHERE id = ANY(%s) (je chunk_size ids eine Query).
+        Ergebnis in der angefragten Reihenfolge; doppelte ids werden nur einmal geladen und
+        liefern dieselbe Instanz.
+        missing: 'skip' (fehlende ids auslassen), 'none' (None an ihrer Stelle) oder
+        'raise' (ValueError mit den fehlenden ids).
+        """
+        if missing not in ("skip", "none", "raise"):
+            raise ValueError("missing muss 'skip', 'none' oder 'raise' sein.")
+        ids = list(ids)
+        unique = list(dict.fromkeys(ids))
+        selected, columns = cls._projection(table, only, defer)
+        found: Dict[Any, DynamicModel] = {}
+        for chunk in cls._iter_chunks(unique, max(1, chunk_size)):
+            rows = cls.find_rows(table, exclude_deleted=exclude_deleted, columns=selected, id=chunk)
+            for row in rows:
+                found[row["id"]] = cls._from_row(table, row, columns)
+        if columns is not None:
+            cls._link_deferred(list(found.values()))
+
+        if missing == "raise":
+            absent = [i for i in unique if i not in found]
+            if absent:
+                raise ValueError(f"Keine Datensätze in Tabelle {table} für id(s): {absent}")
+        if missing == "none":
+            return [found.get(i) for i in ids]
+        return [found[i] for i in ids if i in found]
+
+    @classmethod
+    def exists_by_id(cls, table: str, row_id: int, exclude_deleted: bool = True) -> bool:
+        return cls.exists(table, id=row_id, exclude_deleted=exclude_deleted)
+
+    # -------------------- Aggregate / Count / Exists ----------------------
+
+    @classmethod
+    def set_count_strategy(
+        cls, strategy: str, table: Optional[str] = None, ttl_seconds: Optional[float] = None
+    ) -> None:
+        """
+        strategy: 'exact' (COUNT(*)), 'estimate' (pg_class.reltuples bzw. EXPLAIN-Schätzung
+        bei Filtern) oder 'cached' (exakter COUNT, pro Bedingungs-Set mit TTL gecacht).
+        table=None setzt den globalen Default, sonst nur für diese Tabelle.
+        """
+        if strategy not in ("exact", "estimate", "cached"):
+            raise ValueError("strategy muss 'exact', 'estimate' oder 'cached' sein.")
+        if table is None:
+            cls._count_strategy = strategy
+        else:
+            cls._count_strategy_by_table[table] = strategy
+        if ttl_seconds is not None:
+            cls._count_cache_ttl_seconds = max(0.0, ttl_seconds)
 
     @classmethod
-    def last(cls, table: str, exclude_deleted: bool = True, **conditions) -> Optional["DynamicModel"]:
-        ids = cls.find_ids(table, order_by=("-id",), exclude_deleted=exclude_deleted, limit=1, **conditions)
-        return cls(table, ids[0]) if ids else None
+    def invalidate_count_cache(cls, table: Optional[str] = None) -> None:
+        with cls._count_cache_lock:
+            if table is None:
+                cls._count_cache.clear()
+            else:
+                for key in [k for k in cls._count_cache if k[0] == table]:
+                    del cls._count_cache[key]
 
     @classmethod
-    def get_by(cls, table: str, exclude_deleted: bool = True, **conditions) -> Optional["DynamicModel"]:
-        ids = cls.find_ids(table, exclude_deleted=exclude_deleted, limit=1, **conditions)
-        return cls(table, ids[0]) if ids else None
+    def count(
+        cls, table: str, exclude_deleted: bool = True, count_strategy: Optional[str] = None, **conditions
+    ) -> int:
+        """
+        Anzahl Zeilen. count_strategy (sonst Default aus set_count_strategy):
+        'exact' | 'estimate' | 'cached'.
+        """
+        strategy = count_strategy or cls._count_strategy_by_table.get(table, cls._count_strategy)
+        if strategy == "estimate":
+            return cls._count_estimate(table, exclude_deleted, conditions)
+        if strategy == "cached":
+            key = (
+                table,
+                exclude_deleted,
+                tuple(sorted((c, repr(sorted(v, key=repr) if isinstance(v, (list, tuple, set)) else v))
+                             for c, v in conditions.items())),
+            )
+            now = time.monotonic()
+            with cls._count_cache_lock:
+                hit = cls._count_cache.get(key)
+                if hit is not None and now - hit[0] < cls._count_cache_ttl_seconds:
+                    cls._count_cache.move_to_end(key)
+                    return hit[1]
+            total = cls._count_exact(table, exclude_deleted, conditions)
+            with cls._count_cache_lock:
+                cls._count_cache[key] = (now, total)
+                cls._count_cache.move_to_end(key)
+                while len(cls._count_cache) > cls._count_cache_max_entries:
+                    cls._count_cache.popitem(last=False)
+            return total
+        return cls._count_exact(table, exclude_deleted, conditions)
 
     @classmethod
-    def exists_by_id(cls, table: str, row_id: int, exclude_deleted: bool = True) -> bool:
-        return cls.exists(table, id=row_id, exclude_deleted=exclude_deleted)
-
-    # -------------------- Aggregate / Count / Exists ----------------------
+    def _count_estimate(cls, table: str, exclude_deleted: bool, conditions: Dict[str, Any]) -> int:
+        """
+        Ohne Filter: pg_class.reltuples; mit Filtern: Zeilenschätzung des Planers (EXPLAIN).
+        Fällt auf exakten COUNT zurück, wenn die Tabelle noch nie analysiert wurde.
+        """
+        filtered = bool(conditions) or (exclude_deleted and cls._soft_delete_active(table))
+        with cls._get_cursor() as (conn, cur):
+            if not filtered:
+                q = "SELECT reltuples::BIGINT FROM pg_class WHERE oid = %s::regclass"
+                params: List[Any] = [sql.Identifier(table).as_string(conn)]
+                cls._log_sql(conn, q, params)
+                cur.execute(q, params)
+                row = cur.fetchone()
+                estimate = row[0] if row else -1
+            else:
+                q, params = cls._compiled_select(
+                    conn, table, "1", exclude_deleted=exclude_deleted, conditions=conditions
+                )
+                q = "EXPLAIN (FORMAT JSON) " + q
+                cls._log_sql(conn, q, params)
+                cur.execute(q, params)
+                plan = cur.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                estimate = int(plan[0]["Plan"]["Plan Rows"])
+        if estimate < 0:
+            return cls._count_exact(table, exclude_deleted, conditions)
+        return estimate
 
     @classmethod
-    def count(cls, table: str, exclude_deleted: bool = True, **conditions) -> int:
-        cond_sql, cond_vals = cls._build_conditions(conditions)
-        q = sql.SQL("SELECT COUNT(*) FROM {}").format(sql.Identifier(table))
-        q, cond_vals = cls._append_soft_delete_filter(table, q, cond_sql, cond_vals, exclude_deleted)
-
+    def _count_exact(cls, table: str, exclude_deleted: bool, conditions: Dict[str, Any]) -> int:
         with cls._get_cursor() as (conn, cur):
+            q, cond_vals = cls._compiled_select(
+                conn, table, "COUNT(*)", exclude_deleted=exclude_deleted, conditions=conditions
+            )
             cls._log_sql(conn, q, cond_vals)
-            cur.execute(q, cond_vals)
+            cls._execute(conn, cur, q, cond_vals)
             return cur.fetchone()[0]
 
     @classmethod
     def exists(cls, table: str, exclude_deleted: bool = True, **conditions) -> bool:
-        return cls.count(table, exclude_deleted=exclude_deleted, **conditions) > 0
+        return cls.count(table, exclude_deleted=exclude_deleted, count_strategy="exact", **conditions) > 0
 
     @classmethod
     def aggregate(cls, table: str, func: str, column: str, exclude_deleted: bool = True, **conditions) -> Any:
@@ -518,47 +2231,59 @@ class DynamicModel:
         """
         Legt einen neuen Datensatz an. Fehlende Spalten werden ergänzt (Typen nach column_types oder inferiert).
         Führt Hooks BEFORE/AFTER Insert aus.
+        Ein Roundtrip: INSERT ... RETURNING <alle Spalten>, die Instanz wird direkt aus der
+        zurückgegebenen Zeile gebaut (inkl. serverseitiger Defaults).
+        Bei eingefrorenem Schema (freeze_schema): kein Schema-Lookup, vorkompiliertes INSERT.
         """
+        plan = cls._frozen_tables.get(table)
+        if plan is not None:
+            cls._run_before_hooks(table, kwargs)
+            cols = tuple(kwargs.keys())
+            vals = list(kwargs.values())
+            with cls._get_cursor(dict_cursor=True) as (conn, cur):
+                ins = plan.insert_sql.get(cols) or cls._frozen_insert_sql(plan, conn, table, cols)
+                cls._log_sql(conn, ins, vals)
+                cls._execute(conn, cur, ins, vals)
+                row = dict(cur.fetchone())
+            cls._run_after_hooks(table, kwargs)
+            return cls._from_row(table, row)
+
         infos = cls.inspect_schema(table)
         if not infos:
             raise ValueError(f"Tabelle '{table}' existiert nicht.")
         existing = {r["column_name"] for r in infos}
+        # explizite Spaltenliste statt RETURNING *: stabiler Ergebnistyp (Statement-Cache/PREPARE)
+        returning = [r["column_name"] for r in infos]
 
-        # Fehlende Spalten anlegen (optional mit Typinferenz)
-        for col, val in kwargs.items():
-            if col in ("id",):
-                continue
-            if col not in existing:
-                typ = (column_types or {}).get(col) if column_types else None
-                if not typ and infer_types:
-                    typ = cls._infer_pg_type(val)
-                typ = typ or "TEXT"
-                stmt = sql.SQL("ALTER TABLE {} ADD COLUMN IF NOT EXISTS {} {}").format(
-                    sql.Identifier(table), sql.Identifier(col), sql.SQL(typ)
-                )
-                with cls._get_cursor() as (conn, cur):
-                    cls._log_sql(conn, stmt, None)
-                    cur.execute(stmt)
-                cls._invalidate_schema_cache(table)
-                existing.add(col)
+        # Fehlende Spalten anlegen (optional mit Typinferenz) — ein ALTER TABLE für alle
+        missing = cls._missing_column_types(existing, kwargs, column_types, infer_types)
+        if missing:
+            cls._auto_add_columns(table, missing)
+            existing.update(missing)
+            returning.extend(missing)
 
         cls._run_before_hooks(table, kwargs)
 
-        cols = [sql.Identifier(c) for c in kwargs.keys()]
-        phs = [sql.Placeholder()] * len(kwargs)
-        ins = sql.SQL("INSERT INTO {} ({}) VALUES ({}) RETURNING id").format(
-            sql.Identifier(table),
-            sql.SQL(", ").join(cols),
-            sql.SQL(", ").join(phs),
-        )
+        cols = tuple(kwargs.keys())
+        ret_cols = tuple(returning)
         vals = list(kwargs.values())
-        with cls._get_cursor() as (conn, cur):
+        with cls._get_cursor(dict_cursor=True) as (conn, cur):
+            ins = cls._cached_sql(
+                ("insert", table, cols, ret_cols),
+                conn,
+                lambda: sql.SQL("INSERT INTO {} ({}) VALUES ({}) RETURNING {}").format(
+                    sql.Identifier(table),
+                    sql.SQL(", ").join(map(sql.Identifier, cols)),
+                    sql.SQL(", ").join([sql.Placeholder()] * len(cols)),
+                    sql.SQL(", ").join(map(sql.Identifier, ret_cols)),
+                ),
+            )
             cls._log_sql(conn, ins, vals)
-            cur.execute(ins, vals)
-            new_id = cur.fetchone()[0]
+            cls._execute(conn, cur, ins, vals)
+            row = dict(cur.fetchone())
 
         cls._run_after_hooks(table, kwargs)
-        return cls(table, new_id)
+        return cls._from_row(table, row)
 
     @classmethod
     def upsert(
@@ -574,103 +2299,470 @@ class DynamicModel:
         INSERT ... ON CONFLICT DO UPDATE.
         Gibt die id zurück (RETURNING id). Erwartet, dass es eine id PK gibt.
         """
-        # fehlende Spalten anlegen
-        existing = {r["column_name"] for r in cls.inspect_schema(table)}
-        for col, val in values.items():
-            if col not in existing:
-                typ = (column_types or {}).get(col) if column_types else None
-                if not typ and infer_types:
-                    typ = cls._infer_pg_type(val)
-                typ = typ or "TEXT"
-                stmt = sql.SQL("ALTER TABLE {} ADD COLUMN IF NOT EXISTS {} {}").format(
-                    sql.Identifier(table), sql.Identifier(col), sql.SQL(typ)
-                )
-                with cls._get_cursor() as (conn, cur):
-                    cls._log_sql(conn, stmt, None)
-                    cur.execute(stmt)
-                cls._invalidate_schema_cache(table)
-
-        cols = [sql.Identifier(c) for c in values.keys()]
-        placeholders = [sql.Placeholder()] * len(values)
-        conflict = sql.SQL(", ").join(sql.Identifier(c) for c in conflict_cols)
+        # fehlende Spalten anlegen (ein ALTER TABLE für alle)
+        plan = cls._frozen_tables.get(table)
+        if plan is not None:
+            cls._check_auto_ddl(table, values.keys() - plan.column_set)
+        else:
+            existing = {r["column_name"] for r in cls.inspect_schema(table)}
+            cls._auto_add_columns(
+                table, cls._missing_column_types(existing, values, column_types, infer_types)
+            )
 
+        cols = tuple(values.keys())
+        conflict_cols = tuple(conflict_cols)
         if update_cols is None:
-            update_cols = [c for c in values.keys() if c not in set(conflict_cols) and c != "id"]
-
-        set_exprs = [
-            sql.SQL("{} = EXCLUDED.{}").format(sql.Identifier(c), sql.Identifier(c)) for c in update_cols
-        ]
-
-        stmt = sql.SQL(
-            "INSERT INTO {} ({cols}) VALUES ({vals}) ON CONFLICT ({conflict}) DO UPDATE SET {set_exprs} RETURNING id"
-        ).format(
-            sql.Identifier(table),
-            cols=sql.SQL(", ").join(cols),
-            vals=sql.SQL(", ").join(placeholders),
-            conflict=conflict,
-            set_exprs=sql.SQL(", ").join(set_exprs),
-        )
+            update_cols = [c for c in cols if c not in set(conflict_cols) and c != "id"]
+        update_cols = tuple(update_cols)
+
+        def build() -> sql.Composed:
+            set_exprs = [
+                sql.SQL("{} = EXCLUDED.{}").format(sql.Identifier(c), sql.Identifier(c)) for c in update_cols
+            ]
+            return sql.SQL(
+                "INSERT INTO {} ({cols}) VALUES ({vals}) ON CONFLICT ({conflict}) DO UPDATE SET {set_exprs} RETURNING id"
+            ).format(
+                sql.Identifier(table),
+                cols=sql.SQL(", ").join(map(sql.Identifier, cols)),
+                vals=sql.SQL(", ").join([sql.Placeholder()] * len(cols)),
+                conflict=sql.SQL(", ").join(map(sql.Identifier, conflict_cols)),
+                set_exprs=sql.SQL(", ").join(set_exprs),
+            )
 
         with cls._get_cursor() as (conn, cur):
+            stmt = cls._cached_sql(("upsert", table, cols, conflict_cols, update_cols), conn, build)
             vals = list(values.values())
             cls._log_sql(conn, stmt, vals)
-            cur.execute(stmt, vals)
+            cls._execute(conn, cur, stmt, vals)
             new_id = cur.fetchone()[0]
             return new_id
 
+    @classmethod
+    def _iter_chunks(cls, items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+        it = iter(items)
+        while True:
+            chunk = list(itertools.islice(it, size))
+            if not chunk:
+                return
+            yield chunk
+
+    @classmethod
+    def _chunk_missing_columns(
+        cls,
+        chunk: List[Dict[str, Any]],
+        existing: Set[str],
+        column_types: Optional[Dict[str, str]],
+        infer_types: bool,
+    ) -> Dict[str, str]:
+        """
+        {spalte: SQL-Typ} für Keys einer Seite, die noch nicht existieren; Typ aus column_types
+        bzw. aus dem ersten Nicht-NULL-Wert der Seite.
+        """
+        missing = set().union(*(r.keys() for r in chunk)) - {"id"} - existing
+        add: Dict[str, str] = {}
+        for col in missing:
+            typ = (column_types or {}).get(col) if column_types else None
+            if not typ and infer_types:
+                val = next((r.get(col) for r in chunk if r.get(col) is not None), None)
+                typ = cls._infer_pg_type(val)
+            add[col] = typ or "TEXT"
+        return add
+
     @classmethod
     def bulk_create(
         cls,
         table: str,
-        rows: List[Dict[str, Any]],
+        rows: Iterable[Dict[str, Any]],
         column_types: Optional[Dict[str, str]] = None,
         infer_types: bool = True,
+        page_size: int = 1000,
     ) -> List[int]:
         """
-        Fügt mehrere Datensätze in einem großen INSERT ein.
-        Fehlende Spalten werden ergänzt.
+        Fügt mehrere Datensätze seitenweise (page_size Zeilen je INSERT) in einer Transaktion ein.
+        'rows' darf ein Generator sein; es liegt immer nur eine Seite im Speicher.
+        Fehlende Spalten werden ergänzt — die der ersten Seite vorab in einer eigenen kurzen
+        Transaktion (außerhalb von transaction()), damit der DDL-Lock nicht während des ganzen
+        Imports gehalten wird. Gibt alle neuen ids in Eingabereihenfolge zurück.
+        Laufzeiten je Seite gehen an den Logger.
         """
-        if not rows:
-            return []
-        all_cols = set().union(*(r.keys() for r in rows)) - {"id"}
+        if page_size < 1:
+            raise ValueError("page_size muss >= 1 sein.")
+        new_ids: List[int] = []
+        chunks = cls._iter_chunks(rows, page_size)
+        first = next(chunks, None)
+        if first is None:
+            return new_ids
+        plan = cls._frozen_tables.get(table)
+        existing = set(plan.column_set) if plan else {r["column_name"] for r in cls.inspect_schema(table)}
+
+        # Auto-DDL für die erste Seite in eigener kurzer Transaktion (ohne äußere transaction()),
+        # damit der ACCESS EXCLUSIVE-Lock des ALTER TABLE nicht bis zur letzten Seite gehalten wird
+        if not cls._in_transaction():
+            add = cls._chunk_missing_columns(first, existing, column_types, infer_types)
+            if add:
+                cls._auto_add_columns(table, add)
+                existing |= add.keys()
+
+        with cls.transaction():
+            for n, chunk in enumerate(itertools.chain([first], chunks), start=1):
+                started = time.perf_counter()
+                all_cols = set().union(*(r.keys() for r in chunk)) - {"id"}
+
+                # Spalten, die erst in späteren Seiten auftauchen, werden hier angelegt
+                add = cls._chunk_missing_columns(chunk, existing, column_types, infer_types)
+                if add:
+                    cls._auto_add_columns(table, add)
+                    existing |= add.keys()
+
+                # BEFORE-Hooks
+                for row in chunk:
+                    cls._run_before_hooks(table, row)
+
+                ordered = sorted(all_cols)
+                cols_sql = sql.SQL(",").join(map(sql.Identifier, ordered))
+                values = [[row.get(c) for c in ordered] for row in chunk]
+                ins = sql.SQL("INSERT INTO {} ({}) VALUES %s RETURNING id").format(sql.Identifier(table), cols_sql)
+                with cls._get_cursor() as (conn, cur):
+                    cls._log_sql(conn, ins, ("<execute_values>",))
+                    ids = psycopg2.extras.execute_values(cur, ins, values, page_size=len(values), fetch=True)
+                    new_ids.extend(r[0] for r in ids)
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    cls._log_sql(
+                        conn, f"-- bulk_create {table}: chunk {n}, {len(chunk)} rows, {elapsed_ms:.1f} ms", None
+                    )
+
+                # AFTER-Hooks
+                for row in chunk:
+                    cls._run_after_hooks(table, row)
+        return new_ids
+
+    @classmethod
+    def parallel_ingest(
+        cls,
+        table: str,
+        rows: Iterable[Dict[str, Any]],
+        workers: int = 4,
+        chunk_size: int = 10_000,
+        columns: Optional[Sequence[str]] = None,
+        column_types: Optional[Dict[str, str]] = None,
+        infer_types: bool = True,
+        method: str = "copy",
+        format: str = "text",
+        max_pending_chunks: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Verteilt Blöcke zu chunk_size Zeilen auf workers Prozesse (ProcessPoolExecutor), jeder mit
+        eigener Verbindung; geschrieben wird per COPY (method='copy', format 'text'|'binary') oder
+        execute_values (method='values', wie bulk_create). Die Wertumwandlung läuft so nicht mehr
+        in einem einzigen Python-Thread.
+        Spalten: 'columns' oder Keys der ersten Zeile. Fehlende Spalten werden einmal vorab im
+        Elternprozess angelegt (Typ nach column_types bzw. aus dem ersten Block inferiert);
+        die Worker machen kein Auto-DDL.
+        Jeder Block ist eine eigene Transaktion; fehlgeschlagene Blöcke brechen den Lauf nicht ab.
+        Hooks laufen nur, soweit sie im Worker-Prozess registriert sind (z. B. per fork geerbt).
+        Rückgabe: {'rows', 'chunks', 'failed_chunks', 'seconds', 'rows_per_second',
+        'workers': {pid: {'rows', 'chunks', 'errors', 'seconds'}}, 'errors': [...]}.
+        """
+        if method not in ("copy", "values"):
+            raise ValueError("method muss 'copy' oder 'values' sein.")
+        if format not in ("text", "binary"):
+            raise ValueError("format muss 'text' oder 'binary' sein.")
+        if not cls._db_params:
+            raise RuntimeError("parallel_ingest benötigt connect() oder connect_pool() (Parameter für die Worker).")
+        workers = max(1, workers)
+        started = time.perf_counter()
+        report: Dict[str, Any] = {
+            "rows": 0,
+            "chunks": 0,
+            "failed_chunks": 0,
+            "seconds": 0.0,
+            "rows_per_second": 0.0,
+            "workers": {},
+            "errors": [],
+        }
+
+        chunks = cls._iter_chunks(rows, max(1, chunk_size))
+        first = next(chunks, None)
+        if first is None:
+            return report
+        if columns is None:
+            columns = [c for c in first[0].keys() if c != "id"]
+        columns = list(columns)
+
+        # Auto-DDL einmal vorab; Typ-Inferenz aus dem ersten Nicht-NULL-Wert des ersten Blocks
         existing = {r["column_name"] for r in cls.inspect_schema(table)}
-        missing = all_cols - existing
+        if not existing:
+            raise ValueError(f"Tabelle '{table}' existiert nicht.")
+        sample = {c: next((r.get(c) for r in first if r.get(c) is not None), None) for c in columns if c not in existing}
+        cls._auto_add_columns(table, cls._missing_column_types(existing, sample, column_types, infer_types))
 
-        # fehlende Spalten anlegen mit Typinferenz
-        for col in missing:
-            typ = (column_types or {}).get(col) if column_types else None
-            if not typ and infer_types:
-                # Wert aus erster Zeile mit nicht-None
-                val = next((r.get(col) for r in rows if r.get(col) is not None), None)
-                typ = cls._infer_pg_type(val)
-            typ = typ or "TEXT"
-            with cls._get_cursor() as (conn, cur):
-                stmt = sql.SQL("ALTER TABLE {} ADD COLUMN IF NOT EXISTS {} {}").format(
-                    sql.Identifier(table), sql.Identifier(col), sql.SQL(typ)
-                )
-                cls._log_sql(conn, stmt, None)
-                cur.execute(stmt)
-        if missing:
-            cls._invalidate_schema_cache(table)
+        def collect(fut: "concurrent.futures.Future[Dict[str, Any]]") -> None:
+            n, size = pending.pop(fut)
+            try:
+                res = fut.result()
+            except Exception as e:  # z. B. BrokenProcessPool
+                res = {"worker": None, "rows": 0, "seconds": 0.0, "error": f"{type(e).__name__}: {e}"}
+            stats = report["workers"].setdefault(
+                res["worker"], {"rows": 0, "chunks": 0, "errors": 0, "seconds": 0.0}
+            )
+            stats["chunks"] += 1
+            stats["seconds"] += res["seconds"]
+            if res["error"]:
+                stats["errors"] += 1
+                report["failed_chunks"] += 1
+                report["errors"].append({"chunk": n, "worker": res["worker"], "rows": size, "error": res["error"]})
+                cls._log_sql(None, f"-- parallel_ingest {table}: Block {n} fehlgeschlagen: {res['error']}", None)
+            else:
+                stats["rows"] += res["rows"]
+                report["rows"] += res["rows"]
+
+        limit = max_pending_chunks or workers * 2
+        pending: Dict[Any, Tuple[int, int]] = {}
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_ingest_init, initargs=(cls, dict(cls._db_params))
+        ) as ex:
+            for n, chunk in enumerate(itertools.chain([first], chunks), start=1):
+                if len(pending) >= limit:
+                    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for fut in done:
+                        collect(fut)
+                pending[ex.submit(_ingest_chunk, cls, table, chunk, columns, method, format)] = (n, len(chunk))
+                report["chunks"] = n
+            for fut in concurrent.futures.as_completed(list(pending)):
+                collect(fut)
+
+        report["seconds"] = time.perf_counter() - started
+        report["rows_per_second"] = report["rows"] / report["seconds"] if report["seconds"] else 0.0
+        cls._log_sql(
+            None,
+            f"-- parallel_ingest {table}: {report['rows']} Zeilen in {report['seconds']:.2f}s "
+            f"({report['rows_per_second']:.0f}/s), {report['failed_chunks']} Blöcke fehlgeschlagen",
+            None,
+        )
+        return report
+
+    # -------------------- COPY (Bulk-Ingest) -----------------------------
+
+    @classmethod
+    def _copy_text_value(cls, value: Any) -> str:
+        if value is None:
+            return "\\N"
+        if isinstance(value, bool):
+            text = "t" if value else "f"
+        elif isinstance(value, (dict, list)):
+            text = json.dumps(value)
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            text = "\\x" + bytes(value).hex()
+        elif isinstance(value, (datetime.date, datetime.time)):
+            text = value.isoformat()
+        else:
+            text = str(value)
+        return (
+            text.replace("\\", "\\\\")
+            .replace("\t", "\\t")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+        )
 
-        ordered = sorted(all_cols)
-        cols_sql = sql.SQL(",").join(map(sql.Identifier, ordered))
-        values = [[row.get(c) for c in ordered] for row in rows]
+    @classmethod
+    def _copy_binary_encoder(cls, data_type: str) -> Callable[[Any], bytes]:
+        """
+        Liefert einen Encoder Python-Wert -> Bytes im binären COPY-Format für einen Spaltentyp
+        (data_type aus information_schema).
+        """
+        if data_type == "smallint":
+            return struct.Struct("!h").pack
+        if data_type == "integer":
+            return struct.Struct("!i").pack
+        if data_type == "bigint":
+            return struct.Struct("!q").pack
+        if data_type == "real":
+            return struct.Struct("!f").pack
+        if data_type == "double precision":
+            return struct.Struct("!d").pack
+        if data_type == "boolean":
+            return lambda v: b"\x01" if v else b"\x00"
+        if data_type in ("text", "character varying", "character", "name"):
+            return lambda v: str(v).encode("utf-8")
+        if data_type == "bytea":
+            return bytes
+        if data_type in ("json", "jsonb"):
+            prefix = b"\x01" if data_type == "jsonb" else b""
+            return lambda v: prefix + (v if isinstance(v, str) else json.dumps(v)).encode("utf-8")
+        if data_type == "uuid":
+            return lambda v: (v if isinstance(v, uuid.UUID) else uuid.UUID(str(v))).bytes
+        if data_type == "date":
+            pack_date = struct.Struct("!i").pack
+            return lambda v: pack_date((v - _PG_EPOCH_DATE).days)
+        if data_type == "timestamp without time zone":
+            pack_ts = struct.Struct("!q").pack
+            return lambda v: pack_ts((v - _PG_EPOCH_TS) // datetime.timedelta(microseconds=1))
+        if data_type == "timestamp with time zone":
+            pack_tstz = struct.Struct("!q").pack
+
+            def enc_tstz(v: datetime.datetime) -> bytes:
+                if v.tzinfo is None:
+                    v = v.replace(tzinfo=datetime.timezone.utc)
+                return pack_tstz((v - _PG_EPOCH_TSTZ) // datetime.timedelta(microseconds=1))
+
+            return enc_tstz
+        raise ValueError(f"Binäres COPY unterstützt den Typ '{data_type}' nicht — nutze format='text'.")
 
-        # BEFORE-Hooks
+    @classmethod
+    def _copy_chunks(
+        cls,
+        table: str,
+        rows: Iterable[Dict[str, Any]],
+        columns: Sequence[str],
+        fmt: str,
+        run_hooks: bool,
+        types: Dict[str, str],
+        chunk_bytes: int = 1 << 16,
+    ) -> Iterator[bytes]:
+        """
+        Kodiert Zeilen blockweise (ca. chunk_bytes) für COPY ... FROM STDIN.
+        """
+        buf: List[bytes] = []
+        size = 0
+        if fmt == "binary":
+            encoders = [cls._copy_binary_encoder(types.get(c, "text")) for c in columns]
+            pack_i16 = struct.Struct("!h").pack
+            pack_i32 = struct.Struct("!i").pack
+            null = pack_i32(-1)
+            field_count = pack_i16(len(columns))
+            yield b"PGCOPY\n\xff\r\n\x00" + pack_i32(0) + pack_i32(0)
         for row in rows:
-            cls._run_before_hooks(table, row)
+            if run_hooks:
+                cls._run_before_hooks(table, row)
+            if fmt == "binary":
+                parts = [field_count]
+                for c, enc in zip(columns, encoders):
+                    v = row.get(c)
+                    if v is None:
+                        parts.append(null)
+                    else:
+                        data = enc(v)
+                        parts.append(pack_i32(len(data)))
+                        parts.append(data)
+                line = b"".join(parts)
+            else:
+                line = ("\t".join(cls._copy_text_value(row.get(c)) for c in columns) + "\n").encode("utf-8")
+            buf.append(line)
+            size += len(line)
+            if size >= chunk_bytes:
+                yield b"".join(buf)
+                buf, size = [], 0
+        if fmt == "binary":
+            buf.append(struct.pack("!h", -1))
+        if buf:
+            yield b"".join(buf)
+
+    @classmethod
+    def bulk_copy(
+        cls,
+        table: str,
+        rows: Iterable[Dict[str, Any]],
+        columns: Optional[Sequence[str]] = None,
+        column_types: Optional[Dict[str, str]] = None,
+        infer_types: bool = True,
+        format: str = "text",
+        returning: bool = False,
+        run_hooks: bool = True,
+    ) -> Union[int, List[int]]:
+        """
+        Streamt Zeilen (beliebiges Iterable von Dicts) per COPY ... FROM STDIN in die Tabelle.
+        format: 'text' | 'binary'. Spalten: 'columns' oder Keys der ersten Zeile.
+        Fehlende Spalten werden (Typ nach column_types bzw. inferiert aus der ersten Zeile) ergänzt.
+        BEFORE-Hooks laufen pro Zeile; AFTER-Hooks nicht (Zeilen werden nicht vorgehalten).
+        returning=False: Anzahl eingefügter Zeilen.
+        returning=True: COPY in eine temporäre Staging-Tabelle, danach INSERT ... SELECT mit
+        vorab aus der id-Sequenz vergebenen ids (je Staging-Zeilennummer); gibt die ids in
+        Eingabereihenfolge zurück — unabhängig von der Reihenfolge der RETURNING-Zeilen.
+        """
+        if format not in ("text", "binary"):
+            raise ValueError("format muss 'text' oder 'binary' sein.")
+        it = iter(rows)
+        first = next(it, None)
+        if first is None:
+            return [] if returning else 0
+        it = itertools.chain([first], it)
+        if columns is None:
+            columns = [c for c in first.keys() if c != "id"]
+        columns = list(columns)
+
+        infos = cls.inspect_schema(table)
+        if not infos:
+            raise ValueError(f"Tabelle '{table}' existiert nicht.")
+        existing = {r["column_name"] for r in infos}
+        missing: Dict[str, str] = {}
+        for col in columns:
+            if col not in existing:
+                typ = (column_types or {}).get(col) if column_types else None
+                if not typ and infer_types:
+                    typ = cls._infer_pg_type(first.get(col))
+                missing[col] = typ or "TEXT"
+        if missing:
+            cls._auto_add_columns(table, missing)
+            infos = cls.inspect_schema(table)
+        types = {r["column_name"]: r["data_type"] for r in infos}
+
+        tbl = sql.Identifier(table)
+        cols_sql = sql.SQL(", ").join(map(sql.Identifier, columns))
+        copy_opts = sql.SQL(" (FORMAT binary)" if format == "binary" else "")
+        stream = _IterStream(cls._copy_chunks(table, it, columns, format, run_hooks, types))
 
-        ins = sql.SQL("INSERT INTO {} ({}) VALUES %s RETURNING id").format(sql.Identifier(table), cols_sql)
         with cls._get_cursor() as (conn, cur):
-            cls._log_sql(conn, ins, ("<execute_values>",))
-            psycopg2.extras.execute_values(cur, ins, values)
+            if not returning:
+                copy = sql.SQL("COPY {} ({}) FROM STDIN").format(tbl, cols_sql) + copy_opts
+                cls._log_sql(conn, copy, ("<copy>",))
+                cur.copy_expert(copy, stream)
+                return cur.rowcount
+
+            # ids vorab vergeben (Sequenz bzw. Default der id-Spalte) und über die
+            # Staging-Zeilennummer zuordnen: RETURNING garantiert keine Reihenfolge
+            if "id" in columns:
+                id_expr = sql.Identifier("id")
+            else:
+                q, params = "SELECT pg_get_serial_sequence(%s, 'id')", (tbl.as_string(conn),)
+                cls._log_sql(conn, q, params)
+                cur.execute(q, params)
+                seq = cur.fetchone()[0]
+                default = next((r["column_default"] for r in infos if r["column_name"] == "id"), None)
+                if seq is not None:
+                    id_expr = sql.SQL("nextval({})").format(sql.Literal(seq))
+                elif default is not None:
+                    id_expr = sql.SQL(default)
+                else:
+                    raise ValueError(f"returning=True braucht eine id-Spalte mit Sequenz/Default in '{table}'.")
+            data_cols = [c for c in columns if c != "id"]
+            ins_cols = sql.SQL(", ").join(map(sql.Identifier, ["id"] + data_cols))
+            src_cols = sql.SQL(", ").join([sql.Identifier("_dm_id")] + [sql.Identifier(c) for c in data_cols])
+
+            stage = sql.Identifier(f"_dm_stage_{table}")
+            create_stage = sql.SQL(
+                "CREATE TEMP TABLE {s} ON COMMIT DROP AS SELECT {cols} FROM {t} WITH NO DATA"
+            ).format(s=stage, cols=cols_sql, t=tbl)
+            add_ord = sql.SQL("ALTER TABLE {s} ADD COLUMN _dm_ord BIGSERIAL").format(s=stage)
+            copy = sql.SQL("COPY {} ({}) FROM STDIN").format(stage, cols_sql) + copy_opts
+            ins = sql.SQL(
+                "WITH src AS (SELECT _dm_ord, {id_expr} AS _dm_id, {cols} FROM {s} ORDER BY _dm_ord), "
+                "ins AS (INSERT INTO {t} ({ins_cols}) OVERRIDING SYSTEM VALUE "
+                "SELECT {src_cols} FROM src ORDER BY _dm_ord RETURNING id) "
+                "SELECT src._dm_id FROM src JOIN ins ON ins.id = src._dm_id ORDER BY src._dm_ord"
+            ).format(t=tbl, cols=cols_sql, s=stage, id_expr=id_expr, ins_cols=ins_cols, src_cols=src_cols)
+            drop_stage = sql.SQL("DROP TABLE {s}").format(s=stage)
+            for stmt in (create_stage, add_ord):
+                cls._log_sql(conn, stmt, None)
+                cur.execute(stmt)
+            cls._log_sql(conn, copy, ("<copy>",))
+            cur.copy_expert(copy, stream)
+            cls._log_sql(conn, ins, None)
+            cur.execute(ins)
             new_ids = [r[0] for r in cur.fetchall()]
-
-        # AFTER-Hooks
-        for row in rows:
-            cls._run_after_hooks(table, row)
-        return new_ids
+            # innerhalb einer äußeren transaction() greift ON COMMIT DROP erst später
+            cls._log_sql(conn, drop_stage, None)
+            cur.execute(drop_stage)
+            return new_ids
 
     @classmethod
     def bulk_update(
@@ -694,15 +2786,23 @@ class DynamicModel:
         if not update_cols:
             return 0
 
-        # VALUES Template
+        # VALUES Template; Casts auf die Spaltentypen, sonst wird z. B. eine reine NULL-Spalte
+        # in VALUES als text typisiert und SET int_col = v.col schlägt fehl. cast_type ist ohne
+        # Typmod (bpchar statt character = char(1)); Länge/Präzision prüft erst die Zuweisung
         cols = [key] + update_cols
         values = [[r.get(c) for c in cols] for r in rows]
+        types = {r["column_name"]: r["cast_type"] for r in cls.inspect_schema(table)}
+        template = sql.SQL("({})").format(
+            sql.SQL(", ").join(
+                sql.SQL("%s::" + types[c]) if c in types else sql.SQL("%s") for c in cols
+            )
+        )
 
         v_alias = sql.Identifier("v")
         v_cols = sql.SQL(", ").join(sql.Identifier(c) for c in cols)
+        # SET-Ziel ohne Tabellen-Präfix (Postgres erlaubt dort keinen qualifizierten Namen)
         set_exprs = [
-            sql.SQL("{t}.{col} = {v}.{col}").format(
-                t=sql.Identifier(table),
+            sql.SQL("{col} = {v}.{col}").format(
                 col=sql.Identifier(c),
                 v=v_alias,
             ) for c in update_cols
@@ -720,7 +2820,8 @@ class DynamicModel:
 
         with cls._get_cursor() as (conn, cur):
             cls._log_sql(conn, stmt, ("<execute_values>",))
-            psycopg2.extras.execute_values(cur, stmt, values)
+            tpl = template.as_string(conn)
+            psycopg2.extras.execute_values(cur, stmt, values, template=tpl, page_size=len(values))
             return cur.rowcount
 
     @classmethod
@@ -751,7 +2852,7 @@ class DynamicModel:
             set_vals.append(val)
         cond_sql, cond_vals = cls._build_conditions(conditions)
         q = sql.SQL("UPDATE {} SET {}").format(sql.Identifier(table), sql.SQL(", ").join(set_parts))
-        if cond_sql:
+        if conditions:
             q += sql.SQL(" WHERE {}").format(cond_sql)
         with cls._get_cursor() as (conn, cur):
             params = set_vals + cond_vals
@@ -766,7 +2867,7 @@ class DynamicModel:
         """
         cond_sql, cond_vals = cls._build_conditions(conditions)
         q = sql.SQL("DELETE FROM {}").format(sql.Identifier(table))
-        if cond_sql:
+        if conditions:
             q += sql.SQL(" WHERE {}").format(cond_sql)
         with cls._get_cursor() as (conn, cur):
             cls._log_sql(conn, q, cond_vals)
@@ -775,6 +2876,54 @@ class DynamicModel:
 
     # -------------------- Soft Delete -------------------------------------
 
+    @classmethod
+    def _soft_delete_active(cls, table: str) -> bool:
+        """
+        Hat die Tabelle eine 'deleted'-Spalte? Per register_soft_delete_table() dauerhaft
+        festgelegt, sonst aus dem Schema-Cache ermittelt und mit dessen Eintrag (TTL,
+        Invalidierung) verworfen.
+        """
+        key = cls._cache_key(table)
+        if key in cls._soft_delete_registered:
+            return True
+        flag = cls._soft_delete_flags.get(key)
+        entry = cls._schema_cache.get(key)
+        if flag is None or entry is None or not cls._schema_entry_fresh(entry):
+            flag = cls._soft_delete_flags[key] = cls._has_column(table, "deleted")
+        return flag
+
+    @classmethod
+    def register_soft_delete_table(cls, table: str, partial_index: bool = True) -> None:
+        """
+        Registriert eine Tabelle dauerhaft als Soft-Delete-Tabelle: legt deleted/deleted_at an
+        (falls fehlend) und optional den passenden partiellen Index (add_soft_delete_index).
+        Danach kostet der Filter keinen Schema-Lookup mehr.
+        """
+        cls.ensure_columns(table, {"deleted": "BOOLEAN DEFAULT FALSE", "deleted_at": "TIMESTAMP"})
+        key = cls._cache_key(table)
+        cls._soft_delete_registered.add(key)
+        cls._soft_delete_flags[key] = True
+        if partial_index:
+            cls.add_soft_delete_index(table)
+
+    @classmethod
+    def add_soft_delete_index(cls, table: str, columns: Iterable[str] = ("id",)) -> None:
+        """
+        Partieller Index über columns nur für nicht gelöschte Zeilen (WHERE deleted IS NOT TRUE);
+        passt zum Soft-Delete-Filter und ermöglicht Index-Only-Scans für SELECT id.
+        """
+        columns = list(columns)
+        idx_name = f"{table}_{'_'.join(columns)}_live_idx"
+        stmt = sql.SQL("CREATE INDEX IF NOT EXISTS {iname} ON {t} ({cols}) WHERE {pred}").format(
+            iname=sql.Identifier(idx_name),
+            t=sql.Identifier(table),
+            cols=sql.SQL(", ").join(map(sql.Identifier, columns)),
+            pred=cls._SOFT_DELETE_SQL,
+        )
+        with cls._get_cursor() as (conn, cur):
+            cls._log_sql(conn, stmt, None)
+            cur.execute(stmt)
+
     def soft_delete(self):
         """
         Setzt 'deleted_at' auf NOW() und 'deleted' auf True, statt physisch zu löschen.
@@ -787,7 +2936,7 @@ class DynamicModel:
                 ).format(t=sql.Identifier(self._table))
                 self._log_sql(conn, stmt, None)
                 cur.execute(stmt)
-            self._columns.add("deleted_at")
+            self._register_column("deleted_at")
             self.__class__._invalidate_schema_cache(self._table)
         # deleted-Feld anlegen falls nicht vorhanden
         if "deleted" not in self._columns:
@@ -797,7 +2946,7 @@ class DynamicModel:
                 ).format(t=sql.Identifier(self._table))
                 self._log_sql(conn, stmt, None)
                 cur.execute(stmt)
-            self._columns.add("deleted")
+            self._register_column("deleted")
             self.__class__._invalidate_schema_cache(self._table)
 
         now = datetime.datetime.utcnow()
@@ -808,8 +2957,8 @@ class DynamicModel:
             params = (now, True, self._id)
             self._log_sql(conn, stmt, params)
             cur.execute(stmt, params)
-        self._data["deleted_at"] = now
-        self._data["deleted"] = True
+        self._assign("deleted_at", now)
+        self._assign("deleted", True)
 
     def restore_soft_deleted(self):
         """
@@ -824,8 +2973,8 @@ class DynamicModel:
             params = (False, self._id)
             self._log_sql(conn, stmt, params)
             cur.execute(stmt, params)
-        self._data["deleted_at"] = None
-        self._data["deleted"] = False
+        self._assign("deleted_at", None)
+        self._assign("deleted", False)
 
     @classmethod
     def purge_soft_deleted_older_than(cls, table: str, minutes: int) -> int:
@@ -871,6 +3020,9 @@ class DynamicModel:
         with DynamicModel.transaction():
             … mehrere Operationen …
         commit/rollback automatisch; unterstützt Verschachtelungen via Savepoints.
+        Vor dem Commit der äußersten Transaktion läuft flush() — auch bei intern geöffneten
+        Transaktionen (bulk_create, get_or_create, unit_of_work, …): vorgemerkte Änderungen
+        (set_deferred_writes) werden dabei mitgeschrieben.
         """
         # Hole/erzeuge Verbindung
         if cls._connection is None and cls._pool is None:
@@ -894,6 +3046,7 @@ class DynamicModel:
                 with conn.cursor() as cur:
                     cur.execute(sql.SQL("SAVEPOINT {}").format(sql.Identifier(savepoint_name)))
             yield
+            cls.flush()
             if outermost:
                 conn.commit()
             else:
@@ -901,6 +3054,10 @@ class DynamicModel:
                     cur.execute(sql.SQL("RELEASE SAVEPOINT {}").format(sql.Identifier(savepoint_name)))
         except Exception:
             if outermost:
+                # verworfen, nicht vergessen -> ohne Warnung leeren
+                pending = getattr(cls._local, "pending", None)
+                if pending:
+                    pending.clear()
                 conn.rollback()
             else:
                 with conn.cursor() as cur:
@@ -908,14 +3065,10 @@ class DynamicModel:
             raise
         finally:
             if outermost:
-                # Verbindung zurückgeben
-                try:
-                    pass
-                finally:
-                    if cls._pool:
-                        cls._release_connection(conn)
-                    cls._local.conn = None
-                    cls._local.depth = 0
+                # erst Transaktionszustand lösen, sonst hält _release_connection die Verbindung fest
+                cls._local.conn = None
+                cls._local.depth = 0
+                cls._release_connection(conn)
             else:
                 cls._local.depth = max(0, getattr(cls._local, "depth", 1) - 1)
 
@@ -940,6 +3093,99 @@ class DynamicModel:
                 cur.execute(sql.SQL("ROLLBACK TO SAVEPOINT {}").format(sql.Identifier(sp)))
             raise
 
+    # -------------------- Unit of Work / Dirty-Tracking ------------------
+
+    @classmethod
+    def set_deferred_writes(cls, enabled: bool = True) -> None:
+        """
+        Global: Attribut-Zuweisungen nur vormerken; geschrieben wird bei save(), flush()
+        oder beim Verlassen der äußersten transaction() — auch einer intern geöffneten
+        (z. B. in bulk_create). Bleiben Änderungen ungeschrieben (Thread-Ende, Programmende),
+        gibt es eine RuntimeWarning.
+        """
+        cls._deferred_writes = enabled
+        if enabled and not DynamicModel._unflushed_check_registered:
+            DynamicModel._unflushed_check_registered = True
+            atexit.register(cls._check_unflushed)
+
+    @classmethod
+    def _check_unflushed(cls) -> None:
+        pending = getattr(cls._local, "pending", None)
+        if pending:
+            _warn_unflushed(len(pending))
+            pending.clear()
+
+    @classmethod
+    def _deferring(cls) -> bool:
+        return cls._deferred_writes or getattr(cls._local, "uow_depth", 0) > 0
+
+    @classmethod
+    @contextlib.contextmanager
+    def unit_of_work(cls):
+        """
+        with DynamicModel.unit_of_work():
+            obj.a = 1; obj.b = 2   # noch kein UPDATE
+        Beim Verlassen: ein UPDATE je Instanz (nur geänderte Spalten), gleichartige
+        Instanzen einer Tabelle gebündelt via bulk_update — alles in einer Transaktion.
+        """
+        cls._local.uow_depth = getattr(cls._local, "uow_depth", 0) + 1
+        try:
+            with cls.transaction():
+                yield
+        finally:
+            cls._local.uow_depth -= 1
+
+    @classmethod
+    def _register_dirty(cls, obj: "DynamicModel") -> None:
+        pending = getattr(cls._local, "pending", None)
+        if pending is None:
+            pending = cls._local.pending = _PendingWrites()
+        pending[id(obj)] = obj
+
+    @classmethod
+    def flush(cls) -> int:
+        """
+        Schreibt alle vorgemerkten Änderungen (dieses Threads). Instanzen derselben Tabelle
+        mit gleichen geänderten Spalten werden in einem bulk_update zusammengefasst.
+        Gibt die Anzahl geschriebener Instanzen zurück. Läuft automatisch am Ende jeder
+        äußersten transaction().
+        """
+        pending = getattr(cls._local, "pending", None)
+        if not pending:
+            return 0
+        cls._local.pending = _PendingWrites()
+
+        groups: Dict[Tuple[str, Tuple[str, ...]], List[DynamicModel]] = {}
+        for obj in pending.values():
+            if obj._dirty:
+                key = (obj._table, tuple(sorted(obj._dirty)))
+                groups.setdefault(key, []).append(obj)
+
+        written = 0
+        try:
+            for (table, cols), objs in groups.items():
+                if len(objs) == 1:
+                    objs[0]._write_columns(cols)
+                else:
+                    rows = []
+                    for o in objs:
+                        data = o._data
+                        rows.append(dict({"id": o._id}, **{c: data.get(c) for c in cols}))
+                    cls.bulk_update(table, rows, key="id", update_cols=cols)
+                for o in objs:
+                    o._dirty = None
+                written += len(objs)
+        except Exception:
+            # Nicht geschriebene Instanzen bleiben vorgemerkt
+            for obj in pending.values():
+                if obj._dirty:
+                    cls._register_dirty(obj)
+            raise
+        finally:
+            # abgearbeitet bzw. neu vorgemerkt -> alte Liste ohne Warnung leeren
+            pending.clear()
+        return written
+
     @classmethod
     def healthcheck(cls) -> bool:
         try:
@@ -968,46 +3214,254 @@ class DynamicModel:
                 return []
 
     @classmethod
-    def stream_query(cls, query: str, params: Iterable[Any] = (), fetch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    def _columnar(cls, description, rows: List[Tuple[Any, ...]], use_numpy: bool) -> Dict[str, Any]:
         """
-        Server-seitiger Cursor (Named Cursor) für große Resultsets.
-        Achtung: Nicht in aktiver outer transaction committen, bis Streaming fertig ist.
+        Transponiert Tupel-Zeilen in Spalten: numerische Spalten (int2/4/8, float4/8, bool) als
+        zusammenhängendes array.array bzw. NumPy-Array, alles andere (und Spalten mit NULL) als Liste.
         """
-        if cls._connection is None and cls._pool is None:
-            raise RuntimeError("Keine Datenbankverbindung.")
-        conn = cls._current_connection()
-        name = f"ssc_{int(time.time()*1000)}"
-        cur = conn.cursor(name=name, cursor_factory=psycopg2.extras.RealDictCursor)
-        try:
+        names = [d[0] for d in description]
+        columns = list(zip(*rows)) if rows else [()] * len(names)
+        out: Dict[str, Any] = {}
+        for d, name, values in zip(description, names, columns):
+            code = _ARRAY_TYPECODES.get(d[1])
+            if code is None:
+                out[name] = list(values)
+                continue
+            try:
+                arr = array.array(code, values)
+            except TypeError:  # NULL-Werte
+                out[name] = list(values)
+                continue
+            if use_numpy and numpy is not None:
+                np_arr = numpy.frombuffer(arr, dtype=numpy.dtype(code))
+                out[name] = np_arr.view(numpy.bool_) if d[1] == 16 else np_arr
+            else:
+                out[name] = arr
+        return out
+
+    @classmethod
+    def query_columns(cls, query: Any, params: Iterable[Any] = (), use_numpy: bool = True) -> Dict[str, Any]:
+        """
+        Spaltenweises Ergebnis für analytische Abfragen: {Spalte: Werte} statt einem Dict pro Zeile.
+        Numerische Spalten als array.array (bzw. NumPy-Array, falls installiert und use_numpy),
+        übrige Spalten als Listen.
+        """
+        with cls._get_cursor() as (conn, cur):
             cls._log_sql(conn, query, params)
             cur.execute(query, list(params))
+            rows = cur.fetchall()
+            return cls._columnar(cur.description, rows, use_numpy)
+
+    @classmethod
+    def stream_columns(
+        cls, query: Any, params: Iterable[Any] = (), chunk_size: int = 100_000, use_numpy: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Wie query_columns, aber in Blöcken zu chunk_size Zeilen über einen server-seitigen Cursor
+        (stream_query) — für Aggregationen über sehr große Resultsets bei konstantem Speicher.
+        """
+        chunk_size = max(1, chunk_size)
+        with cls.stream_query(query, params, fetch_size=min(chunk_size, 10_000), rows="tuple") as rows:
             while True:
-                rows = cur.fetchmany(fetch_size)
-                if not rows:
-                    break
-                for r in rows:
-                    yield dict(r)
-            if not cls._in_transaction():
-                conn.commit()
-        except Exception:
-            if not cls._in_transaction():
-                conn.rollback()
-            raise
+                chunk = list(itertools.islice(rows, chunk_size))
+                if not chunk:
+                    return
+                yield cls._columnar(rows.description, chunk, use_numpy)
+
+    @classmethod
+    def stream_query(
+        cls,
+        query: Any,
+        params: Iterable[Any] = (),
+        fetch_size: int = 1000,
+        rows: str = "dict",
+        withhold: bool = False,
+    ) -> _StreamCursor:
+        """
+        Server-seitiger Cursor (Named Cursor) für große Resultsets; holt je fetch_size Zeilen (itersize).
+        rows: 'dict' (RealDictRow) oder 'tuple' (ohne Dict pro Zeile).
+        withhold=True: WITH HOLD-Cursor, außerhalb von transaction() wird direkt nach dem Öffnen
+        committet — das Streaming hält keine Transaktion offen.
+        Als Context-Manager (with DM.stream_query(...) as rows) wird die Verbindung auch bei
+        vorzeitigem Abbruch sofort freigegeben; alternativ close().
+        """
+        if cls._connection is None and cls._pool is None:
+            raise RuntimeError("Keine Datenbankverbindung.")
+        return _StreamCursor(cls, query, params, fetch_size, rows, withhold)
+
+    @classmethod
+    def explain(cls, query: str, params: Iterable[Any] = (), analyze: bool = True) -> str:
+        expl = f"EXPLAIN {'(ANALYZE, BUFFERS)' if analyze else ''} {query}"
+        with cls._get_cursor() as (conn, cur):
+            cls._log_sql(conn, expl, params)
+            cur.execute(expl, list(params))
+            lines = [r[0] for r in cur.fetchall()]
+            return "\n".join(lines)
+
+    # -------------------- Paralleler Scan ---------------------------------
+
+    @classmethod
+    def parallel_scan(
+        cls,
+        table: str,
+        fn: Callable[[List[Dict[str, Any]]], None],
+        workers: int = 4,
+        shards: Optional[int] = None,
+        consistent: bool = False,
+        batch_size: int = 1000,
+        exclude_deleted: bool = True,
+        columns: Optional[Sequence[str]] = None,
+        **conditions,
+    ) -> int:
+        """
+        Scannt eine Tabelle parallel: der id-Bereich (min..max) wird in shards Teilbereiche
+        (Default workers * 4) zerlegt, jeder Teilbereich läuft in einem eigenen Thread auf einer
+        eigenen Pool-Verbindung über einen server-seitigen Cursor.
+        fn(rows) wird pro Batch (Liste von Dicts, batch_size Zeilen) im Worker-Thread aufgerufen.
+        consistent=True: alle Shards lesen denselben Snapshot (pg_export_snapshot, REPEATABLE READ).
+        Benötigt connect_pool() mit maxconn >= workers (+1 bei consistent) und eine ganzzahlige id.
+        Gibt die Anzahl gelesener Zeilen zurück.
+        """
+        if cls._pool is None:
+            raise RuntimeError("parallel_scan benötigt connect_pool().")
+        workers = max(1, workers)
+        select_sql = sql.SQL(", ").join(map(sql.Identifier, columns)) if columns else sql.SQL("*")
+        bounds_sql, bounds_vals = cls._build_select(
+            table, sql.SQL("min(id), max(id)"), (), exclude_deleted, conditions=conditions
+        )
+
+        coord = cls._pool.getconn()
+        snapshot = None
+        try:
+            with coord.cursor() as cur:
+                if consistent:
+                    cur.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+                    cur.execute("SELECT pg_export_snapshot()")
+                    snapshot = cur.fetchone()[0]
+                cls._log_sql(coord, bounds_sql, bounds_vals)
+                cur.execute(bounds_sql, bounds_vals)
+                lo, hi = cur.fetchone()
+            if lo is None:
+                return 0
+            if not isinstance(lo, int):
+                raise ValueError("parallel_scan braucht eine ganzzahlige id-Spalte.")
+
+            n = max(1, shards or workers * 4)
+            step = max(1, -(-(hi - lo + 1) // n))
+            ranges = [(s, min(s + step, hi + 1)) for s in range(lo, hi + 1, step)]
+            cond_sql, cond_vals = cls._build_conditions(conditions)
+            range_sql = sql.SQL("id >= %s AND id < %s")
+            if cond_sql != sql.SQL(""):
+                range_sql = cond_sql + sql.SQL(" AND ") + range_sql
+            shard_sql, _ = cls._append_soft_delete_filter(
+                table,
+                sql.SQL("SELECT {} FROM {}").format(select_sql, sql.Identifier(table)),
+                range_sql,
+                [],
+                exclude_deleted,
+            )
+            stop = threading.Event()
+
+            def scan(start: int, end: int) -> int:
+                if stop.is_set():
+                    return 0
+                conn = cls._pool.getconn()
+                try:
+                    if snapshot is not None:
+                        with conn.cursor() as setup:
+                            setup.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+                            setup.execute(sql.SQL("SET TRANSACTION SNAPSHOT {}").format(sql.Literal(snapshot)))
+                    cur = conn.cursor(
+                        name=f"ssc_{next(cls._stream_names)}", cursor_factory=psycopg2.extras.RealDictCursor
+                    )
+                    cur.itersize = batch_size
+                    params = list(cond_vals) + [start, end]
+                    cls._log_sql(conn, shard_sql, params)
+                    cur.execute(shard_sql, params)
+                    count = 0
+                    while not stop.is_set():
+                        rows = cur.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        fn(rows)
+                        count += len(rows)
+                    cur.close()
+                    conn.commit()
+                    return count
+                except BaseException:
+                    stop.set()
+                    conn.rollback()
+                    raise
+                finally:
+                    cls._pool.putconn(conn)
+
+            t0 = time.perf_counter()
+            total = 0
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+                futures = [ex.submit(scan, s, e) for s, e in ranges]
+                for fut in concurrent.futures.as_completed(futures):
+                    total += fut.result()
+            cls._log_sql(
+                None,
+                f"-- parallel_scan {table}: {total} Zeilen, {len(ranges)} Shards, "
+                f"{workers} Worker in {time.perf_counter() - t0:.3f}s",
+                None,
+            )
+            return total
         finally:
             try:
-                cur.close()
+                coord.rollback()
             finally:
-                if not cls._in_transaction():
-                    cls._release_connection(conn)
+                cls._pool.putconn(coord)
 
     @classmethod
-    def explain(cls, query: str, params: Iterable[Any] = (), analyze: bool = True) -> str:
-        expl = f"EXPLAIN {'(ANALYZE, BUFFERS)' if analyze else ''} {query}"
-        with cls._get_cursor() as (conn, cur):
-            cls._log_sql(conn, expl, params)
-            cur.execute(expl, list(params))
-            lines = [r[0] for r in cur.fetchall()]
-            return "\n".join(lines)
+    def iter_parallel_scan(
+        cls, table: str, workers: int = 4, max_pending_batches: Optional[int] = None, **kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        parallel_scan als zusammengeführter Iterator (Reihenfolge zwischen Shards beliebig).
+        Höchstens max_pending_batches (Default workers * 2) Batches werden gepuffert; bricht der
+        Konsument ab, werden die Worker beendet. Weitere Argumente wie parallel_scan.
+        """
+        q: "queue.Queue[Any]" = queue.Queue(maxsize=max_pending_batches or workers * 2)
+        abandoned = threading.Event()
+        done = object()
+
+        def put(item: Any) -> None:
+            while not abandoned.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+            raise _ScanAborted()
+
+        def run() -> None:
+            outcome: Any = done
+            try:
+                cls.parallel_scan(table, put, workers=workers, **kwargs)
+            except _ScanAborted:
+                return
+            except BaseException as e:
+                outcome = e
+            try:
+                put(outcome)
+            except _ScanAborted:
+                pass
+
+        producer = threading.Thread(target=run, name=f"parallel_scan_{table}", daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = q.get()
+                if item is done:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield from item
+        finally:
+            abandoned.set()
+            producer.join()
 
     # -------------------- DDL-Operationen ---------------------------------
 
@@ -1257,14 +3711,28 @@ class DynamicModel:
 
     # -------------------- Simple Relationships ----------------------------
 
-    def children(self, child_table: str, fk_column: str, exclude_deleted: bool = True) -> List["DynamicModel"]:
-        ids = DynamicModel.find_ids(child_table, exclude_deleted=exclude_deleted, **{fk_column: self._id})
-        return [DynamicModel(child_table, i) for i in ids]
+    def children(
+        self,
+        child_table: str,
+        fk_column: str,
+        exclude_deleted: bool = True,
+        only: Optional[Iterable[str]] = None,
+        defer: Optional[Iterable[str]] = None,
+    ) -> List["DynamicModel"]:
+        cached = self._recall(("children", child_table, fk_column, exclude_deleted))
+        if cached is not _MISSING:
+            return list(cached)
+        return DynamicModel.get_all(
+            child_table, exclude_deleted=exclude_deleted, only=only, defer=defer, **{fk_column: self._id}
+        )
 
     def has_many(self, child_table: str, fk_column: str, exclude_deleted: bool = True) -> List["DynamicModel"]:
         return self.children(child_table, fk_column=fk_column, exclude_deleted=exclude_deleted)
 
     def has_one(self, child_table: str, fk_column: str, exclude_deleted: bool = True) -> Optional["DynamicModel"]:
+        cached = self._recall(("children", child_table, fk_column, exclude_deleted))
+        if cached is not _MISSING:
+            return cached[0] if cached else None
         return DynamicModel.get_by(child_table, exclude_deleted=exclude_deleted, **{fk_column: self._id})
 
     def belongs_to(self, parent_table: str, fk_column: str = "", exclude_deleted: bool = True) -> Optional["DynamicModel"]:
@@ -1276,19 +3744,111 @@ class DynamicModel:
         fk_val = getattr(self, fk_column, None)
         if fk_val is None:
             return None
+        cached = self._recall(("belongs_to", parent_table, fk_column, exclude_deleted))
+        if cached is not _MISSING and cached[0] == fk_val:
+            return cached[1]
         return DynamicModel.get_by(parent_table, id=fk_val, exclude_deleted=exclude_deleted)
 
+    # -------------------- Eager Loading (prefetch) -------------------------
+
+    @classmethod
+    def prefetch(
+        cls,
+        instances: Iterable["DynamicModel"],
+        child_table: str,
+        fk_column: str,
+        exclude_deleted: bool = True,
+        only: Optional[Iterable[str]] = None,
+        defer: Optional[Iterable[str]] = None,
+        chunk_size: int = 1000,
+    ) -> None:
+        """
+        Eager Loading für children()/has_many()/has_one(): lädt die Kindzeilen aller Instanzen
+        mit einer Query (fk_column = ANY(...), je chunk_size Eltern) und hängt sie an die Instanzen;
+        spätere children()-Aufrufe werden aus dem Speicher bedient.
+        """
+        instances = list(instances)
+        parent_ids = list(dict.fromkeys(o._id for o in instances))
+        if only:
+            only = set(only) | {fk_column}
+        if defer:
+            defer = set(defer) - {fk_column}
+        selected, columns = DynamicModel._projection(child_table, only, defer)
+        groups: Dict[Any, List[DynamicModel]] = {}
+        loaded: List[DynamicModel] = []
+        for chunk in cls._iter_chunks(parent_ids, max(1, chunk_size)):
+            rows = DynamicModel.find_rows(
+                child_table, exclude_deleted=exclude_deleted, columns=selected, **{fk_column: chunk}
+            )
+            for row in rows:
+                child = DynamicModel._from_row(child_table, row, columns)
+                groups.setdefault(row[fk_column], []).append(child)
+                loaded.append(child)
+        if columns is not None:
+            DynamicModel._link_deferred(loaded)
+        key = ("children", child_table, fk_column, exclude_deleted)
+        for obj in instances:
+            obj._remember(key, groups.get(obj._id, []))
+
+    @classmethod
+    def prefetch_belongs_to(
+        cls,
+        instances: Iterable["DynamicModel"],
+        parent_table: str,
+        fk_column: str = "",
+        exclude_deleted: bool = True,
+        only: Optional[Iterable[str]] = None,
+        defer: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Eager Loading für belongs_to(): lädt die Eltern aller Instanzen per get_many
+        (id = ANY(...)) und hängt sie an; Instanzen mit gleichem Fremdschlüssel teilen sich
+        die Eltern-Instanz. Ändert sich der Fremdschlüssel danach, lädt belongs_to() neu.
+        """
+        if not fk_column:
+            fk_column = f"{parent_table}_id"
+        instances = list(instances)
+        fk_vals = [getattr(o, fk_column, None) for o in instances]
+        parents = DynamicModel.get_many(
+            parent_table, [v for v in fk_vals if v is not None], exclude_deleted=exclude_deleted, only=only, defer=defer
+        )
+        by_id = {p._id: p for p in parents}
+        key = ("belongs_to", parent_table, fk_column, exclude_deleted)
+        for obj, fk_val in zip(instances, fk_vals):
+            obj._remember(key, (fk_val, by_id.get(fk_val)))
+
+    def _remember(self, key: Tuple[Any, ...], value: Any) -> None:
+        cache = getattr(self, "_prefetched", None)
+        if cache is None:
+            cache = self._prefetched = {}
+        cache[key] = value
+
+    def _recall(self, key: Tuple[Any, ...]) -> Any:
+        cache = getattr(self, "_prefetched", None)
+        return _MISSING if cache is None else cache.get(key, _MISSING)
+
     # -------------------- Instanz-Logik -----------------------------------
 
-    def __init__(self, table: str, row_id: int):
+    def __init__(self, table: str, row_id: int, lazy: bool = False):
+        """
+        lazy=True: keine Query beim Anlegen; alle Spalten werden beim ersten Attributzugriff
+        mit einer Query geladen.
+        """
         if self._connection is None and self._pool is None:
             raise RuntimeError("Bitte erst DynamicModel.connect() aufrufen.")
         self._table = table
         self._id = row_id
         self._columns: Set[str] = set()
         self._data: Dict[str, Any] = {}
+        # geänderte Spalten; None = keine (Set erst bei der ersten vorgemerkten Zuweisung)
+        self._dirty: Optional[Set[str]] = None
+        self._deferred: Optional[Set[str]] = None
         self._load_columns()
-        self._load_data()
+        if lazy:
+            self._data = {"id": row_id}
+            self._deferred = self._columns - {"id"} or None
+        else:
+            self._load_data()
 
     def _load_columns(self):
         infos = self.inspect_schema(self._table)
@@ -1296,96 +3856,163 @@ class DynamicModel:
             raise ValueError(f"Tabelle '{self._table}' existiert nicht.")
         self._columns = {r["column_name"] for r in infos}
 
-    def _load_data(self):
-        cols_sql = sql.SQL(", ").join(map(sql.Identifier, self._columns))
-        q = sql.SQL("SELECT {cols} FROM {t} WHERE id = %s").format(
-            cols=cols_sql, t=sql.Identifier(self._table)
-        )
+    def _fetch_columns(self, cols: Tuple[str, ...]) -> Dict[str, Any]:
+        table = self._table
         with self._get_cursor(dict_cursor=True) as (conn, cur):
+            q = self._cached_sql(
+                ("load", table, cols),
+                conn,
+                lambda: sql.SQL("SELECT {cols} FROM {t} WHERE id = %s").format(
+                    cols=sql.SQL(", ").join(map(sql.Identifier, cols)), t=sql.Identifier(table)
+                ),
+            )
             params = (self._id,)
             self._log_sql(conn, q, params)
-            cur.execute(q, params)
+            self._execute(conn, cur, q, params)
             row = cur.fetchone()
             if not row:
                 raise ValueError(f"Kein Datensatz mit id={self._id} in Tabelle {self._table}.")
-            self._data = dict(row)
+            return dict(row)
+
+    def _load_data(self):
+        self._data = self._fetch_columns(tuple(sorted(self._columns)))
+        self._deferred = None
+
+    def _load_deferred(self) -> None:
+        """
+        Lädt alle noch nicht geladenen (deferred/lazy) Spalten mit einer Query nach —
+        stammt die Instanz aus einem Abruf mit mehreren Instanzen, gleich für alle (load_deferred).
+        """
+        batch = getattr(self._deferred, "batch", None)
+        if batch is not None and batch.members:
+            members = [o for o in (ref() for ref in batch.members) if o is not None]
+            batch.members = []
+            self.load_deferred(members)
+        # ohne Geschwister oder Datensatz nicht (mehr) gefunden -> Einzelabfrage
+        if self._deferred:
+            self._merge(self._fetch_columns(tuple(sorted(self._deferred))))
+        self._deferred = None
+
+    @classmethod
+    def load_deferred(cls, instances: Iterable["DynamicModel"], chunk_size: int = 1000) -> None:
+        """
+        Lädt die nicht geladenen (defer=/only=/lazy) Spalten vieler Instanzen mit einer Query je
+        Tabelle und chunk_size Instanzen (WHERE id = ANY(%s)) statt einer Query pro Instanz.
+        Bereits zugewiesene Werte werden nicht überschrieben.
+        """
+        groups: Dict[str, List[DynamicModel]] = {}
+        for obj in instances:
+            if obj._deferred:
+                groups.setdefault(obj._table, []).append(obj)
+        for table, objs in groups.items():
+            for chunk in cls._iter_chunks(objs, max(1, chunk_size)):
+                cols = sorted(set().union(*(o._deferred for o in chunk)) - {"id"})
+                rows = cls.find_rows(
+                    table, exclude_deleted=False, columns=["id"] + cols, id=[o._id for o in chunk]
+                )
+                by_id = {r["id"]: r for r in rows}
+                for o in chunk:
+                    row = by_id.get(o._id)
+                    if row is not None:
+                        o._merge({c: row[c] for c in o._deferred if c in row})
+                        o._deferred = None
+
+    def _merge(self, row: Dict[str, Any]) -> None:
+        self._data.update(row)
 
     def __getattr__(self, name: str) -> Any:
-        if name in self._columns:
+        if name != "_columns" and name in self._columns:
+            deferred = self._deferred
+            if deferred and name in deferred:
+                self._load_deferred()
             return self._data.get(name)
         raise AttributeError(f"'{type(self).__name__}' hat kein Attribut '{name}'")
 
+    def _assign(self, name: str, value: Any) -> None:
+        self._data[name] = value
+
+    def _register_column(self, name: str) -> None:
+        self._columns.add(name)
+
     def __setattr__(self, name: str, value: Any):
         # interne Felder normal setzen
-        if name in (
-            "_table",
-            "_id",
-            "_columns",
-            "_data",
-            "_connection",
-            "_pool",
-            "_before_hooks",
-            "_after_hooks",
-            "_migrations",
-            "_logger",
-            "_local",
-            "_schema_cache",
-            "_schema_cache_ttl_seconds",
-        ):
+        if name in self._INTERNAL_ATTRS:
             return super().__setattr__(name, value)
 
-        # Update existierende Spalte
-        if "_columns" in self.__dict__ and name in self._columns:
-            stmt = sql.SQL("UPDATE {t} SET {c} = %s WHERE id = %s").format(
-                t=sql.Identifier(self._table), c=sql.Identifier(name)
-            )
-            with self._get_cursor() as (conn, cur):
-                params = (value, self._id)
-                self._log_sql(conn, stmt, params)
-                cur.execute(stmt, params)
-            self._data[name] = value
-            return
+        columns = getattr(self, "_columns", None)
+        if columns is None:
+            # Fallback
+            return super().__setattr__(name, value)
 
         # Neue Spalte hinzufügen (mit Typ-Inferenz)
-        if "_columns" in self.__dict__:
-            typ = self._infer_pg_type(value)
-            with self._get_cursor() as (conn, cur):
-                add = sql.SQL("ALTER TABLE {t} ADD COLUMN IF NOT EXISTS {c} {typ}").format(
-                    t=sql.Identifier(self._table), c=sql.Identifier(name), typ=sql.SQL(typ)
-                )
-                self._log_sql(conn, add, None)
-                cur.execute(add)
-            self._columns.add(name)
-            self.__class__._invalidate_schema_cache(self._table)
-
-            stmt = sql.SQL("UPDATE {t} SET {c} = %s WHERE id = %s").format(
-                t=sql.Identifier(self._table), c=sql.Identifier(name)
-            )
-            with self._get_cursor() as (conn, cur):
-                params = (value, self._id)
-                self._log_sql(conn, stmt, params)
-                cur.execute(stmt, params)
-            self._data[name] = value
+        if name not in columns:
+            self._auto_add_columns(self._table, {name: self._infer_pg_type(value)})
+            self._register_column(name)
+
+        # zugewiesener Wert ersetzt eine noch nicht geladene Spalte
+        deferred = self._deferred
+        if deferred:
+            deferred.discard(name)
+
+        if self._deferring():
+            self._assign(name, value)
+            if self._dirty is None:
+                self._dirty = set()
+            self._dirty.add(name)
+            self._register_dirty(self)
             return
 
-        # Fallback
-        return super().__setattr__(name, value)
+        stmt = sql.SQL("UPDATE {t} SET {c} = %s WHERE id = %s").format(
+            t=sql.Identifier(self._table), c=sql.Identifier(name)
+        )
+        with self._get_cursor() as (conn, cur):
+            params = (value, self._id)
+            self._log_sql(conn, stmt, params)
+            cur.execute(stmt, params)
+        self._assign(name, value)
 
-    def save(self):
+    def save(self, force: bool = False):
         """
-        Speichert alle im _data gehaltenen Werte (außer id).
+        Speichert geänderte Spalten (Dirty-Tracking) mit einem UPDATE.
+        Ohne Zuweisung seit dem Laden bzw. letzten Speichern ist save() ein No-op (kein UPDATE);
+        force=True schreibt alle im _data gehaltenen Werte (außer id).
         """
-        cols = [c for c in self._columns if c != "id"]
+        if force:
+            if self._deferred:
+                self._load_deferred()
+            cols = [c for c in self._columns if c != "id"]
+        else:
+            cols = sorted(self._dirty or ())
         if not cols:
             return
-        parts = [sql.SQL("{} = %s").format(sql.Identifier(c)) for c in cols]
-        stmt = sql.SQL("UPDATE {t} SET {sets} WHERE id = %s").format(
-            t=sql.Identifier(self._table), sets=sql.SQL(", ").join(parts)
-        )
-        vals = [self._data[c] for c in cols] + [self._id]
+        self._write_columns(cols)
+        self._dirty = None
+        pending = getattr(self._local, "pending", None)
+        if pending:
+            pending.pop(id(self), None)
+
+    def _write_columns(self, cols: Sequence[str]):
+        cols = tuple(cols)
+        table = self._table
+        data = self._data
+        vals = [data[c] for c in cols] + [self._id]
+        plan = self._frozen_tables.get(table)
         with self._get_cursor() as (conn, cur):
+            if plan is not None:
+                stmt = plan.update_sql.get(cols) or self._frozen_update_sql(plan, conn, table, cols)
+                self._log_sql(conn, stmt, vals)
+                self._execute(conn, cur, stmt, vals)
+                return
+            stmt = self._cached_sql(
+                ("update", table, cols),
+                conn,
+                lambda: sql.SQL("UPDATE {t} SET {sets} WHERE id = %s").format(
+                    t=sql.Identifier(table),
+                    sets=sql.SQL(", ").join(sql.SQL("{} = %s").format(sql.Identifier(c)) for c in cols),
+                ),
+            )
             self._log_sql(conn, stmt, vals)
-            cur.execute(stmt, vals)
+            self._execute(conn, cur, stmt, vals)
 
     def save_with_version(self, version_col: str = "version") -> bool:
         """
@@ -1394,20 +4021,23 @@ class DynamicModel:
         """
         if version_col not in self._columns:
             raise ValueError(f"Version-Spalte '{version_col}' existiert nicht — nutze ensure_version_column().")
-        current_version = self._data.get(version_col, 0)
+        if self._deferred:
+            self._load_deferred()
+        data = self._data
+        current_version = data.get(version_col, 0)
         cols = [c for c in self._columns if c not in ("id", version_col)]
         set_parts = [sql.SQL("{} = %s").format(sql.Identifier(c)) for c in cols]
         set_parts.append(sql.SQL("{} = {} + 1").format(sql.Identifier(version_col), sql.Identifier(version_col)))
         stmt = sql.SQL("UPDATE {t} SET {sets} WHERE id = %s AND {v} = %s").format(
             t=sql.Identifier(self._table), sets=sql.SQL(", ").join(set_parts), v=sql.Identifier(version_col)
         )
-        vals = [self._data[c] for c in cols] + [self._id, current_version]
+        vals = [data[c] for c in cols] + [self._id, current_version]
         with self._get_cursor() as (conn, cur):
             self._log_sql(conn, stmt, vals)
             cur.execute(stmt, vals)
             updated = cur.rowcount == 1
         if updated:
-            self._data[version_col] = current_version + 1
+            self._assign(version_col, current_version + 1)
         return updated
 
     def delete(self):
@@ -1446,10 +4076,14 @@ class DynamicModel:
     # -------------------- Clone / Copy ------------------------------------
 
     def to_dict(self) -> Dict[str, Any]:
+        if self._deferred:
+            self._load_deferred()
         return dict(self._data)
 
     def refresh(self) -> None:
         self._load_data()
+        self._dirty = None
+        self._prefetched = None
 
     def clone_row(self, overrides: Optional[Dict[str, Any]] = None) -> "DynamicModel":
         """
@@ -1479,3 +4113,464 @@ class DynamicModel:
         with cls._get_cursor() as (conn, cur):
             cls._log_sql(conn, stmt, None)
             cur.execute(stmt)
+
+
+class AsyncDynamicModel:
+    """
+    asyncio-Pendant zu den DynamicModel-Klassenmethoden (benötigt aiopg).
+    Nutzt einen aiopg-Pool; Query-Bau, Schema-Cache, Hooks und Logger werden mit
+    DynamicModel geteilt. Gelieferte Instanzen sind normale DynamicModel-Objekte:
+    Attributzugriffe auf geladene Spalten sind rein lokal, aber Nachladen, Zuweisungen,
+    save()/refresh() und Relationen laufen synchron über DynamicModel.connect()/connect_pool().
+    """
+
+    _pool: Any = None
+    _model = DynamicModel
+
+    # Verbindung der aktuellen (async) Transaktion + Verschachtelungstiefe
+    _tx: "contextvars.ContextVar[Optional[Tuple[Any, int]]]" = contextvars.ContextVar(
+        "dynamic_model_async_tx", default=None
+    )
+    _names = itertools.count(1)
+
+    # ---------------------- Verbindungs-Setup ----------------------------
+
+    @classmethod
+    async def connect_pool(cls, minsize: int = 1, maxsize: int = 10, timeout: float = 30.0, **db_params):
+        """
+        Async-Verbindungspool via aiopg.create_pool. Viele Coroutinen teilen sich maxsize Verbindungen.
+        """
+        if aiopg is None:
+            raise RuntimeError("AsyncDynamicModel benötigt aiopg (pip install aiopg).")
+        cls._pool = await aiopg.create_pool(minsize=minsize, maxsize=maxsize, timeout=timeout, **db_params)
+
+    @classmethod
+    async def close(cls) -> None:
+        if cls._pool is not None:
+            try:
+                cls._pool.close()
+                await cls._pool.wait_closed()
+            finally:
+                cls._pool = None
+
+    # ---------------------- Helpers für Connection / Cursor ---------------
+
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def _acquire(cls):
+        state = cls._tx.get()
+        if state is not None:
+            yield state[0]
+            return
+        if cls._pool is None:
+            raise RuntimeError("Bitte erst AsyncDynamicModel.connect_pool() aufrufen.")
+        async with cls._pool.acquire() as conn:
+            yield conn
+
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def _get_cursor(cls, dict_cursor: bool = False):
+        """
+        aiopg-Verbindungen laufen im Autocommit; Transaktionen nur über transaction().
+        """
+        cur_cls = psycopg2.extras.RealDictCursor if dict_cursor else None
+        async with cls._acquire() as conn:
+            async with conn.cursor(cursor_factory=cur_cls) as cur:
+                yield conn, cur
+
+    @classmethod
+    def _log_sql(cls, conn, query: Any, params: Optional[Sequence[Any]]) -> None:
+        cls._model._log_sql(conn.raw, query, params)
+
+    # -------------------- Transaction-Context -----------------------------
+
+    @classmethod
+    @contextlib.asynccontextmanager
+    async def transaction(cls):
+        """
+        async with AsyncDynamicModel.transaction():
+            … mehrere Operationen …
+        commit/rollback automatisch; Verschachtelung via Savepoints.
+        Innerhalb einer Transaktion keine parallelen Queries (gather) absetzen.
+        """
+        state = cls._tx.get()
+        if state is None:
+            async with cls._acquire() as conn:
+                token = cls._tx.set((conn, 1))
+                try:
+                    async with conn.cursor() as cur:
+                        await cur.execute("BEGIN")
+                        try:
+                            yield
+                        except BaseException:
+                            await cur.execute("ROLLBACK")
+                            raise
+                        await cur.execute("COMMIT")
+                finally:
+                    cls._tx.reset(token)
+            return
+
+        conn, depth = state
+        token = cls._tx.set((conn, depth + 1))
+        sp = sql.Identifier(f"asp_{next(cls._names)}")
+        try:
+            async with conn.cursor() as cur:
+                await cur.execute(sql.SQL("SAVEPOINT {}").format(sp))
+                try:
+                    yield
+                except BaseException:
+                    await cur.execute(sql.SQL("ROLLBACK TO SAVEPOINT {}").format(sp))
+                    raise
+                await cur.execute(sql.SQL("RELEASE SAVEPOINT {}").format(sp))
+        finally:
+            cls._tx.reset(token)
+
+    # -------------------- Schema-Cache / Inspektion -----------------------
+
+    @classmethod
+    async def inspect_schema(cls, table: str) -> List[Dict[str, Any]]:
+        """
+        Wie DynamicModel.inspect_schema (gleicher Cache), aber async geladen.
+        """
+        model = cls._model
+        now = time.time()
+        entry = model._schema_cache.get(model._cache_key(table))
+        if entry is not None and model._schema_entry_fresh(entry):
+            return entry[1]
+
+        qry = model._CATALOG_COLUMNS_SQL
+        params = model._catalog_params("public", [table])
+        async with cls._get_cursor(dict_cursor=True) as (conn, cur):
+            cls._log_sql(conn, qry, params)
+            await cur.execute(qry, params)
+            rows = await cur.fetchall()
+        return model._store_catalog_rows("public", rows, [table], now)[table]
+
+    @classmethod
+    async def _has_column(cls, table: str, column: str) -> bool:
+        infos = await cls.inspect_schema(table)
+        return any(r["column_name"] == column for r in infos)
+
+    @classmethod
+    async def ensure_columns(cls, table: str, columns: Dict[str, str]) -> None:
+        """
+        Wie DynamicModel.ensure_columns: ein ALTER TABLE unter lock_timeout, bei Lock-Timeout
+        Wiederholung mit Backoff (set_ddl_options); in transaction() über Savepoints.
+        """
+        if not columns:
+            return
+        stmt = sql.SQL("ALTER TABLE {} {}").format(
+            sql.Identifier(table),
+            sql.SQL(", ").join(
+                sql.SQL("ADD COLUMN IF NOT EXISTS {} {}").format(sql.Identifier(c), sql.SQL(t))
+                for c, t in columns.items()
+            ),
+        )
+        model = cls._model
+        attempt = 0
+        while True:
+            try:
+                # eigene kurze Transaktion bzw. Savepoint: lock_timeout gilt nur für das ALTER
+                async with cls.transaction():
+                    await cls._execute_ddl(table, stmt)
+                break
+            except psycopg2.Error as e:
+                # 55P03 = lock_not_available (lock_timeout überschritten)
+                if getattr(e, "pgcode", None) != "55P03" or attempt >= model._ddl_retries:
+                    raise
+                await asyncio.sleep(model._ddl_backoff_seconds * (2 ** attempt))
+                attempt += 1
+        model._invalidate_schema_cache(table, notify=False)
+
+    @classmethod
+    async def _execute_ddl(cls, table: str, stmt: sql.Composable) -> None:
+        model = cls._model
+        nested = cls._tx.get()[1] > 1
+        async with cls._get_cursor() as (conn, cur):
+            restore = None
+            if model._ddl_lock_timeout_ms is not None:
+                if nested:
+                    await cur.execute("SELECT current_setting('lock_timeout')")
+                    restore = (await cur.fetchone())[0]
+                await cur.execute(
+                    "SELECT set_config('lock_timeout', %s, true)", (f"{model._ddl_lock_timeout_ms}ms",)
+                )
+            cls._log_sql(conn, stmt, None)
+            await cur.execute(stmt)
+            if restore is not None:
+                await cur.execute("SELECT set_config('lock_timeout', %s, true)", (restore,))
+            if model._schema_channel:
+                # NOTIFY auf derselben Verbindung, ohne den Event-Loop zu blockieren
+                q = "SELECT pg_notify(%s, %s)"
+                params = (model._schema_channel, model._cache_key(table))
+                cls._log_sql(conn, q, params)
+                await cur.execute(q, params)
+
+    # -------------------- SELECT Hilfen -----------------------------------
+
+    @classmethod
+    async def _select(
+        cls,
+        table: str,
+        select: str,
+        dict_cursor: bool,
+        order_by: Iterable[str],
+        exclude_deleted: bool,
+        limit: Optional[int],
+        offset: Optional[int],
+        conditions: Dict[str, Any],
+    ) -> List[Any]:
+        has_deleted = False
+        if exclude_deleted:
+            model = cls._model
+            key = model._cache_key(table)
+            has_deleted = True if key in model._soft_delete_registered else model._soft_delete_flags.get(key)
+            entry = model._schema_cache.get(key)
+            if has_deleted is None or (
+                key not in model._soft_delete_registered and (entry is None or not model._schema_entry_fresh(entry))
+            ):
+                has_deleted = model._soft_delete_flags[key] = await cls._has_column(table, "deleted")
+        async with cls._get_cursor(dict_cursor=dict_cursor) as (conn, cur):
+            q, vals = cls._model._compiled_select(
+                conn.raw, table, select, order_by, exclude_deleted, limit, offset, conditions, has_deleted
+            )
+            cls._log_sql(conn, q, vals)
+            await cur.execute(q, vals)
+            return await cur.fetchall()
+
+    @classmethod
+    async def find_ids(
+        cls,
+        table: str,
+        order_by: Iterable[str] = (),
+        exclude_deleted: bool = True,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        **conditions,
+    ) -> List[int]:
+        rows = await cls._select(
+            table, "id", False, order_by, exclude_deleted, limit, offset, conditions
+        )
+        return [r[0] for r in rows]
+
+    @classmethod
+    async def find_rows(
+        cls,
+        table: str,
+        order_by: Iterable[str] = (),
+        exclude_deleted: bool = True,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        **conditions,
+    ) -> List[Dict[str, Any]]:
+        rows = await cls._select(
+            table, "*", True, order_by, exclude_deleted, limit, offset, conditions
+        )
+        return [dict(r) for r in rows]
+
+    @classmethod
+    async def get_all(
+        cls,
+        table: str,
+        order_by: Iterable[str] = (),
+        exclude_deleted: bool = True,
+        **conditions,
+    ) -> List[DynamicModel]:
+        rows = await cls.find_rows(table, order_by=order_by, exclude_deleted=exclude_deleted, **conditions)
+        return cls._model._from_rows(table, rows)
+
+    @classmethod
+    async def count(cls, table: str, exclude_deleted: bool = True, **conditions) -> int:
+        rows = await cls._select(
+            table, "COUNT(*)", False, (), exclude_deleted, None, None, conditions
+        )
+        return rows[0][0]
+
+    # -------------------- INSERT / UPSERT / BULK --------------------------
+
+    @classmethod
+    async def create(
+        cls, table: str, column_types: Optional[Dict[str, str]] = None, infer_types: bool = True, **kwargs
+    ) -> DynamicModel:
+        """
+        Wie DynamicModel.create: fehlende Spalten ergänzen, Hooks ausführen; ein INSERT ... RETURNING *.
+        Bei eingefrorenem Schema (freeze_schema): kein Schema-Lookup, vorkompiliertes INSERT.
+        """
+        model = cls._model
+        plan = model._frozen_tables.get(table)
+        if plan is not None:
+            model._run_before_hooks(table, kwargs)
+            cols = tuple(kwargs.keys())
+            vals = list(kwargs.values())
+            async with cls._get_cursor(dict_cursor=True) as (conn, cur):
+                ins = plan.insert_sql.get(cols) or model._frozen_insert_sql(plan, conn.raw, table, cols)
+                cls._log_sql(conn, ins, vals)
+                await cur.execute(ins, vals)
+                row = dict(await cur.fetchone())
+            model._run_after_hooks(table, kwargs)
+            return model._from_row(table, row)
+
+        infos = await cls.inspect_schema(table)
+        if not infos:
+            raise ValueError(f"Tabelle '{table}' existiert nicht.")
+        existing = {r["column_name"] for r in infos}
+        missing = model._missing_column_types(existing, kwargs, column_types, infer_types)
+        model._check_auto_ddl(table, missing)
+        await cls.ensure_columns(table, missing)
+
+        model._run_before_hooks(table, kwargs)
+        ins = sql.SQL("INSERT INTO {} ({}) VALUES ({}) RETURNING *").format(
+            sql.Identifier(table),
+            sql.SQL(", ").join(map(sql.Identifier, kwargs.keys())),
+            sql.SQL(", ").join([sql.Placeholder()] * len(kwargs)),
+        )
+        vals = list(kwargs.values())
+        async with cls._get_cursor(dict_cursor=True) as (conn, cur):
+            cls._log_sql(conn, ins, vals)
+            await cur.execute(ins, vals)
+            row = dict(await cur.fetchone())
+        model._run_after_hooks(table, kwargs)
+        return model._from_row(table, row)
+
+    @classmethod
+    async def upsert(
+        cls,
+        table: str,
+        conflict_cols: Iterable[str],
+        values: Dict[str, Any],
+        update_cols: Optional[Iterable[str]] = None,
+        column_types: Optional[Dict[str, str]] = None,
+        infer_types: bool = True,
+    ) -> int:
+        """
+        INSERT ... ON CONFLICT DO UPDATE ... RETURNING id.
+        """
+        existing = {r["column_name"] for r in await cls.inspect_schema(table)}
+        missing = cls._model._missing_column_types(existing, values, column_types, infer_types)
+        cls._model._check_auto_ddl(table, missing)
+        await cls.ensure_columns(table, missing)
+        conflict_cols = list(conflict_cols)
+        if update_cols is None:
+            update_cols = [c for c in values.keys() if c not in set(conflict_cols) and c != "id"]
+        stmt = sql.SQL(
+            "INSERT INTO {} ({cols}) VALUES ({vals}) ON CONFLICT ({conflict}) DO UPDATE SET {set_exprs} RETURNING id"
+        ).format(
+            sql.Identifier(table),
+            cols=sql.SQL(", ").join(map(sql.Identifier, values.keys())),
+            vals=sql.SQL(", ").join([sql.Placeholder()] * len(values)),
+            conflict=sql.SQL(", ").join(map(sql.Identifier, conflict_cols)),
+            set_exprs=sql.SQL(", ").join(
+                sql.SQL("{} = EXCLUDED.{}").format(sql.Identifier(c), sql.Identifier(c)) for c in update_cols
+            ),
+        )
+        vals = list(values.values())
+        async with cls._get_cursor() as (conn, cur):
+            cls._log_sql(conn, stmt, vals)
+            await cur.execute(stmt, vals)
+            return (await cur.fetchone())[0]
+
+    @classmethod
+    async def bulk_create(
+        cls,
+        table: str,
+        rows: Iterable[Dict[str, Any]],
+        column_types: Optional[Dict[str, str]] = None,
+        infer_types: bool = True,
+        page_size: int = 1000,
+    ) -> List[int]:
+        """
+        Seitenweise Multi-Row-INSERTs in einer Transaktion; alle ids in Eingabereihenfolge.
+        Wie DynamicModel.bulk_create: fehlende Spalten der ersten Seite vorab in einer eigenen
+        kurzen Transaktion, damit der DDL-Lock nicht während des ganzen Imports gehalten wird.
+        """
+        if page_size < 1:
+            raise ValueError("page_size muss >= 1 sein.")
+        model = cls._model
+        new_ids: List[int] = []
+        chunks = model._iter_chunks(rows, page_size)
+        first = next(chunks, None)
+        if first is None:
+            return new_ids
+        plan = model._frozen_tables.get(table)
+        existing = set(plan.column_set) if plan else {r["column_name"] for r in await cls.inspect_schema(table)}
+
+        if cls._tx.get() is None:
+            add = model._chunk_missing_columns(first, existing, column_types, infer_types)
+            if add:
+                model._check_auto_ddl(table, add)
+                await cls.ensure_columns(table, add)
+                existing |= add.keys()
+
+        async with cls.transaction():
+            for chunk in itertools.chain([first], chunks):
+                all_cols = set().union(*(r.keys() for r in chunk)) - {"id"}
+                # Spalten, die erst in späteren Seiten auftauchen, werden hier angelegt
+                add = model._chunk_missing_columns(chunk, existing, column_types, infer_types)
+                if add:
+                    model._check_auto_ddl(table, add)
+                    await cls.ensure_columns(table, add)
+                    existing |= add.keys()
+
+                for row in chunk:
+                    model._run_before_hooks(table, row)
+                ordered = sorted(all_cols)
+                row_sql = sql.SQL("({})").format(sql.SQL(", ").join([sql.Placeholder()] * len(ordered)))
+                ins = sql.SQL("INSERT INTO {} ({}) VALUES {} RETURNING id").format(
+                    sql.Identifier(table),
+                    sql.SQL(", ").join(map(sql.Identifier, ordered)),
+                    sql.SQL(", ").join([row_sql] * len(chunk)),
+                )
+                params = [row.get(c) for row in chunk for c in ordered]
+                async with cls._get_cursor() as (conn, cur):
+                    cls._log_sql(conn, ins, ("<multi-row VALUES>",))
+                    await cur.execute(ins, params)
+                    new_ids.extend(r[0] for r in await cur.fetchall())
+                for row in chunk:
+                    model._run_after_hooks(table, row)
+        return new_ids
+
+    # -------------------- Raw / Streaming ---------------------------------
+
+    @classmethod
+    async def raw_query(cls, query: str, params: Iterable[Any] = ()) -> List[Dict[str, Any]]:
+        async with cls._get_cursor(dict_cursor=True) as (conn, cur):
+            cls._log_sql(conn, query, params)
+            await cur.execute(query, list(params))
+            if cur.description is None:
+                return []
+            return [dict(r) for r in await cur.fetchall()]
+
+    @classmethod
+    async def stream_query(
+        cls, query: str, params: Iterable[Any] = (), fetch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        async for row in AsyncDynamicModel.stream_query(...):
+        Server-seitiger Cursor (DECLARE/FETCH; aiopg kennt keine Named Cursors).
+        Hält eine Verbindung, bis das Iterieren endet.
+        """
+        name = sql.Identifier(f"assc_{next(cls._names)}")
+        declare = sql.SQL("DECLARE {} NO SCROLL CURSOR FOR ").format(name) + sql.SQL(query)
+        fetch = sql.SQL("FETCH {} FROM {}").format(sql.Literal(int(fetch_size)), name)
+        outer = cls._tx.get() is not None
+        async with cls._acquire() as conn:
+            async with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                if not outer:
+                    await cur.execute("BEGIN")
+                try:
+                    cls._log_sql(conn, declare, params)
+                    await cur.execute(declare, list(params))
+                    while True:
+                        await cur.execute(fetch)
+                        rows = await cur.fetchall()
+                        if not rows:
+                            break
+                        for r in rows:
+                            yield dict(r)
+                    await cur.execute(sql.SQL("CLOSE {}").format(name))
+                except BaseException:
+                    if not outer:
+                        await cur.execute("ROLLBACK")
+                    raise
+                if not outer:
+                    await cur.execute("COMMIT")
@@ -0,0 +1,67 @@
+"""
+query_columns(): Transponieren in Spalten (ohne Datenbank, ohne NumPy-Pfad).
+"""
+
+import array
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from dynamic_model import DynamicModel as DM  # noqa: E402
+
+# (name, type_code) wie in cursor.description; die restlichen Felder braucht _columnar nicht
+DESCRIPTION = [
+    ("id", 20),
+    ("small", 21),
+    ("n", 23),
+    ("ratio", 701),
+    ("f4", 700),
+    ("flag", 16),
+    ("name", 25),
+]
+
+
+def test_columnar_typecodes():
+    rows = [
+        (1, 2, 3, 0.5, 1.5, True, "a"),
+        (2**40, -2, -3, 2.25, -1.0, False, "b"),
+    ]
+    out = DM._columnar(DESCRIPTION, rows, use_numpy=False)
+    assert list(out) == [d[0] for d in DESCRIPTION]
+    assert [out[k].typecode for k in ("id", "small", "n", "ratio", "f4", "flag")] == ["q", "h", "i", "d", "f", "b"]
+    assert out["id"] == array.array("q", [1, 2**40])
+    assert out["ratio"].tolist() == [0.5, 2.25]
+    assert out["flag"].tolist() == [1, 0]
+    assert out["name"] == ["a", "b"]
+
+
+def test_columnar_null_falls_back_to_list():
+    rows = [(1, None, 3, None, 1.0, None, None), (2, 5, 4, 1.0, 2.0, True, "x")]
+    out = DM._columnar(DESCRIPTION, rows, use_numpy=False)
+    assert isinstance(out["n"], array.array)
+    assert out["small"] == [None, 5]
+    assert out["ratio"] == [None, 1.0]
+    assert out["flag"] == [None, True]
+    assert out["name"] == [None, "x"]
+
+
+def test_columnar_unknown_type_is_list():
+    out = DM._columnar([("total", 1700)], [(1,), (2,)], use_numpy=False)
+    assert out == {"total": [1, 2]}
+
+
+def test_columnar_empty_result():
+    out = DM._columnar(DESCRIPTION, [], use_numpy=False)
+    assert list(out) == [d[0] for d in DESCRIPTION]
+    assert out["id"] == array.array("q")
+    assert out["name"] == []
+
+
+def test_columnar_numpy():
+    numpy = pytest.importorskip("numpy")
+    out = DM._columnar(DESCRIPTION[:6], [(1, 2, 3, 0.5, 1.5, True), (4, 5, 6, 1.5, 2.5, False)], use_numpy=True)
+    assert out["id"].dtype == numpy.int64
+    assert out["flag"].dtype == numpy.bool_
+    assert out["flag"].tolist() == [True, False]
+    assert out["ratio"].tolist() == [0.5, 1.5]
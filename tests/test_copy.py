@@ -0,0 +1,112 @@
+"""
+COPY-Kodierung (ohne Datenbank) und bulk_copy gegen PostgreSQL (DM_TEST_DSN, sonst übersprungen).
+"""
+
+import datetime
+import os
+import struct
+import uuid
+
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+from dynamic_model import DynamicModel as DM  # noqa: E402
+
+DSN = os.environ.get("DM_TEST_DSN")
+needs_db = pytest.mark.skipif(not DSN, reason="DM_TEST_DSN nicht gesetzt")
+
+
+def test_copy_text_value():
+    enc = DM._copy_text_value
+    assert enc(None) == "\\N"
+    assert enc(True) == "t" and enc(False) == "f"
+    assert enc(42) == "42"
+    assert enc({"a": [1, 2]}) == '{"a": [1, 2]}'
+    assert enc(b"\x00\xff") == "\\\\x00ff"
+    assert enc(datetime.date(2024, 2, 29)) == "2024-02-29"
+    assert enc("a\tb\nc\rd\\e") == "a\\tb\\nc\\rd\\\\e"
+
+
+def test_copy_binary_encoder():
+    enc = DM._copy_binary_encoder
+    assert enc("integer")(-2) == struct.pack("!i", -2)
+    assert enc("bigint")(2**40) == struct.pack("!q", 2**40)
+    assert enc("double precision")(1.5) == struct.pack("!d", 1.5)
+    assert enc("boolean")(True) == b"\x01"
+    assert enc("character varying")("ä") == "ä".encode("utf-8")
+    assert enc("jsonb")({"a": 1}) == b'\x01{"a": 1}'
+    assert enc("json")('{"a":1}') == b'{"a":1}'
+    u = uuid.uuid4()
+    assert enc("uuid")(str(u)) == u.bytes
+    assert enc("date")(datetime.date(2000, 1, 2)) == struct.pack("!i", 1)
+    assert enc("timestamp without time zone")(datetime.datetime(2000, 1, 1, 0, 0, 1)) == struct.pack("!q", 10**6)
+    tz = datetime.timezone(datetime.timedelta(hours=1))
+    naive_utc = enc("timestamp with time zone")(datetime.datetime(2000, 1, 1, 1, 0))
+    assert naive_utc == enc("timestamp with time zone")(datetime.datetime(2000, 1, 1, 2, 0, tzinfo=tz))
+    with pytest.raises(ValueError):
+        enc("ARRAY")
+
+
+def test_copy_chunks_binary_framing():
+    chunks = DM._copy_chunks("t", [{"n": 1, "s": None}], ["n", "s"], "binary", False, {"n": "integer"})
+    data = b"".join(chunks)
+    header = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+    row = struct.pack("!h", 2) + struct.pack("!i", 4) + struct.pack("!i", 1) + struct.pack("!i", -1)
+    assert data == header + row + struct.pack("!h", -1)
+
+
+def test_copy_chunks_text_blocks():
+    rows = [{"n": i} for i in range(100)]
+    chunks = list(DM._copy_chunks("t", rows, ["n"], "text", False, {}, chunk_bytes=50))
+    assert len(chunks) > 1
+    assert b"".join(chunks) == "".join(f"{i}\n" for i in range(100)).encode()
+
+
+@pytest.fixture
+def db():
+    DM.connect(dsn=DSN)
+    names = []
+
+    def make(ddl):
+        name = f"dm_test_{uuid.uuid4().hex[:8]}"
+        DM.raw_query(f"CREATE TABLE {name} ({ddl})")
+        names.append(name)
+        return name
+
+    yield make
+    for name in names:
+        DM.drop_table(name)
+    DM.close()
+
+
+@needs_db
+@pytest.mark.parametrize(
+    "ddl",
+    [
+        "id SERIAL PRIMARY KEY, n INTEGER",
+        "id INTEGER GENERATED ALWAYS AS IDENTITY PRIMARY KEY, n INTEGER",
+    ],
+    ids=["serial", "identity"],
+)
+def test_bulk_copy_returning_maps_ids_to_inputs(db, ddl):
+    table = db(ddl)
+    DM.raw_query(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), 100)")
+    rows = [{"n": n} for n in (7, 3, 9, 1, 5)]
+    ids = DM.bulk_copy(table, rows, returning=True)
+    stored = {r["id"]: r["n"] for r in DM.raw_query(f"SELECT id, n FROM {table}")}
+    assert [stored[i] for i in ids] == [7, 3, 9, 1, 5]
+    assert min(ids) > 100
+
+
+@needs_db
+def test_bulk_copy_returning_with_explicit_ids(db):
+    table = db("id INTEGER PRIMARY KEY, n INTEGER")
+    assert DM.bulk_copy(table, [{"id": 5, "n": 1}, {"id": 2, "n": 2}], columns=["id", "n"], returning=True) == [5, 2]
+
+
+@needs_db
+def test_bulk_copy_binary_returning(db):
+    table = db("id SERIAL PRIMARY KEY, n INTEGER, label TEXT")
+    ids = DM.bulk_copy(table, [{"n": 1, "label": "a"}, {"n": 2, "label": None}], format="binary", returning=True)
+    assert [r.label for r in DM.get_many(table, ids)] == ["a", None]
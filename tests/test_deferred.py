@@ -0,0 +1,53 @@
+"""
+Nachladen ausgelassener Spalten (defer=/only=) gegen PostgreSQL (DM_TEST_DSN, sonst übersprungen).
+"""
+
+import os
+import uuid
+
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+from dynamic_model import DynamicModel as DM  # noqa: E402
+
+DSN = os.environ.get("DM_TEST_DSN")
+pytestmark = pytest.mark.skipif(not DSN, reason="DM_TEST_DSN nicht gesetzt")
+
+
+@pytest.fixture
+def table():
+    DM.connect(dsn=DSN)
+    name = f"dm_test_{uuid.uuid4().hex[:8]}"
+    DM.create_table(name, {"label": "TEXT", "payload": "TEXT"})
+    for i in range(5):
+        DM.create(name, label=f"l{i}", payload=f"p{i}")
+    yield name
+    DM.set_logger(None)
+    DM.drop_table(name)
+    DM.close()
+
+
+def _count_selects():
+    queries = []
+    DM.set_logger(lambda q, params: queries.append(q) if q.lstrip().upper().startswith("SELECT") else None)
+    return queries
+
+
+@pytest.mark.parametrize("model", [DM, None], ids=["dynamic", "model_for"])
+def test_deferred_columns_load_once_for_all_siblings(table, model):
+    model = model or DM.model_for(table)
+    objs = model.get_all(table, order_by=("id",), defer=("payload",))
+    objs[1].payload = "changed"
+
+    queries = _count_selects()
+    assert [o.payload for o in objs] == ["p0", "changed", "p2", "p3", "p4"]
+    assert len(queries) == 1
+
+
+def test_load_deferred(table):
+    objs = [DM.get_by(table, only=("label",), label=f"l{i}") for i in range(3)]
+    queries = _count_selects()
+    DM.load_deferred(objs)
+    assert [o.to_dict()["payload"] for o in objs] == ["p0", "p1", "p2"]
+    assert len(queries) == 1
@@ -0,0 +1,41 @@
+"""
+model_for()-Klassen gegen PostgreSQL (DM_TEST_DSN, sonst übersprungen).
+"""
+
+import os
+import uuid
+
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+from dynamic_model import DynamicModel as DM  # noqa: E402
+
+DSN = os.environ.get("DM_TEST_DSN")
+pytestmark = pytest.mark.skipif(not DSN, reason="DM_TEST_DSN nicht gesetzt")
+
+
+@pytest.fixture
+def table():
+    DM.connect(dsn=DSN)
+    name = f"dm_test_{uuid.uuid4().hex[:8]}"
+    DM.create_table(name, {"label": "TEXT", "tmp": "INTEGER"})
+    yield name
+    DM.drop_table(name)
+    DM.close()
+
+
+def test_model_class_follows_schema_changes(table):
+    row_id = DM.create(table, label="a", tmp=1)._id
+    Model = DM.model_for(table)
+    assert Model(row_id).to_dict() == {"id": row_id, "label": "a", "tmp": 1}
+
+    DM.drop_column(table, "tmp")
+    DM.ensure_columns(table, {"note": "TEXT"})
+    DM.update_by_conditions(table, {"note": "x"}, id=row_id)
+
+    obj = Model(row_id)
+    assert obj.to_dict() == {"id": row_id, "label": "a", "note": "x"}
+    assert obj.note == "x"
+    assert DM.model_for(table) is Model
+    assert Model.get_all(table, defer=("note",))[0].note == "x"
@@ -0,0 +1,61 @@
+"""
+Keyset-Pagination: Kodierung der Cursor-Tokens (ohne Datenbank).
+"""
+
+import base64
+import datetime
+import decimal
+import json
+import uuid
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from dynamic_model import DynamicModel as DM  # noqa: E402
+
+
+def test_cursor_roundtrip():
+    values = [
+        datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2024, 5, 1, 12, 30),
+        datetime.date(2024, 5, 1),
+        decimal.Decimal("12.3400"),
+        uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        42,
+        "ä/ö?",
+        None,
+        True,
+    ]
+    token = DM._encode_cursor(values, "next")
+    decoded, direction = DM._decode_cursor(token)
+    assert direction == "next"
+    assert decoded == values
+    assert [type(v) for v in decoded] == [type(v) for v in values]
+
+
+def test_cursor_is_urlsafe():
+    token = DM._encode_cursor(["???>>>" * 10], "prev")
+    assert "=" not in token
+    assert set(token) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+    assert DM._decode_cursor(token) == (["???>>>" * 10], "prev")
+
+
+def _token(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "",
+        "nicht base64!",
+        base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+        _token({"v": [1]}),
+        _token({"v": [1], "d": "sideways"}),
+        _token({"v": [{"$dt": "kein Datum"}], "d": "next"}),
+    ],
+)
+def test_invalid_cursor_raises(token):
+    with pytest.raises(ValueError, match="Pagination-Cursor"):
+        DM._decode_cursor(token)
@@ -0,0 +1,209 @@
+"""
+Connection-Pool und transaction() mit einer Fake-Verbindung (keine Datenbank nötig);
+der letzte Test läuft zusätzlich gegen PostgreSQL, wenn DM_TEST_DSN gesetzt ist.
+"""
+
+import os
+import uuid
+
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+import dynamic_model  # noqa: E402
+from dynamic_model import DynamicModel as DM  # noqa: E402
+
+DSN = os.environ.get("DM_TEST_DSN")
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def execute(self, query, params=None):
+        if self.conn.broken:
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        self.conn.executed.append(query)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.autocommit = True
+        self.closed = 0
+        self.broken = False
+        self.executed = []
+
+    def cursor(self, cursor_factory=None, **kwargs):
+        return FakeCursor(self)
+
+    def get_transaction_status(self):
+        return psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = 1
+
+
+@pytest.fixture
+def fake_connect(monkeypatch):
+    monkeypatch.setattr(dynamic_model.psycopg2, "connect", lambda **kw: FakeConnection())
+
+
+def test_pool_counters(fake_connect):
+    pool = dynamic_model._ConnectionPool(0, 2, timeout=0.01)
+    a, b = pool.getconn(), pool.getconn()
+    stats = pool.stats()
+    assert (stats["in_use"], stats["idle"], stats["size"]) == (2, 0, 2)
+    with pytest.raises(dynamic_model.PoolTimeout):
+        pool.getconn()
+    pool.putconn(a)
+    pool.putconn(b)
+    assert pool.getconn() is b
+    stats = pool.stats()
+    assert (stats["in_use"], stats["idle"], stats["size"]) == (1, 1, 2)
+    assert stats["checkouts"] == 3
+    assert stats["timeouts"] == 1
+    assert stats["connections_created"] == 2
+
+
+def test_pre_ping_off_by_default(fake_connect):
+    pool = dynamic_model._ConnectionPool(1, 1)
+    conn = pool.getconn()
+    pool.putconn(conn)
+    assert pool.getconn() is conn
+    assert conn.executed == []
+
+
+def test_pre_ping_only_after_idle_time(fake_connect):
+    pool = dynamic_model._ConnectionPool(1, 1, pre_ping=True, ping_after=60)
+    conn = pool.getconn()
+    pool.putconn(conn)
+    pool.getconn()
+    assert conn.executed == []
+
+    pool.ping_after = 0
+    pool.putconn(conn)
+    pool.getconn()
+    assert conn.executed == ["SELECT 1"]
+
+
+def test_pre_ping_replaces_dead_connection(fake_connect):
+    pool = dynamic_model._ConnectionPool(1, 1, pre_ping=True, ping_after=0)
+    dead = pool.getconn()
+    pool.putconn(dead)
+    dead.broken = True
+    conn = pool.getconn()
+    assert conn is not dead and dead.closed
+    stats = pool.stats()
+    assert stats["ping_failures"] == 1
+    assert (stats["in_use"], stats["size"]) == (1, 1)
+
+
+def test_max_lifetime_replaces_connection(fake_connect):
+    pool = dynamic_model._ConnectionPool(0, 1, max_lifetime=0)
+    old = pool.getconn()
+    pool.putconn(old)
+    assert old.closed
+    new = pool.getconn()
+    assert new is not old
+    stats = pool.stats()
+    assert (stats["connections_created"], stats["connections_closed"], stats["size"]) == (2, 1, 1)
+
+
+def test_max_idle_keeps_minconn(fake_connect):
+    pool = dynamic_model._ConnectionPool(1, 3, max_idle=0)
+    conns = [pool.getconn() for _ in range(3)]
+    for conn in conns:
+        pool.putconn(conn)
+    pool.getconn()
+    assert sum(1 for c in conns if c.closed) == 2
+    assert pool.stats()["size"] == 1
+
+
+def test_putconn_rolls_back_open_transaction(fake_connect, monkeypatch):
+    pool = dynamic_model._ConnectionPool(0, 1)
+    conn = pool.getconn()
+    rolled_back = []
+    monkeypatch.setattr(conn, "get_transaction_status", lambda: psycopg2.extensions.TRANSACTION_STATUS_INTRANS)
+    monkeypatch.setattr(conn, "rollback", lambda: rolled_back.append(True))
+    pool.putconn(conn)
+    assert rolled_back == [True] and not conn.closed
+    assert pool.getconn() is conn
+
+
+def test_putconn_discards_closed_connection(fake_connect):
+    pool = dynamic_model._ConnectionPool(0, 1)
+    conn = pool.getconn()
+    conn.close()
+    pool.putconn(conn)
+    assert pool.stats()["size"] == 0
+    assert pool.getconn() is not conn
+
+
+def test_closeall(fake_connect):
+    pool = dynamic_model._ConnectionPool(2, 2)
+    conns = [pool.getconn() for _ in range(2)]
+    for conn in conns:
+        pool.putconn(conn)
+    pool.closeall()
+    assert all(c.closed for c in conns)
+    with pytest.raises(dynamic_model.PoolError):
+        pool.getconn()
+
+
+def test_invalid_pool_size():
+    with pytest.raises(ValueError):
+        dynamic_model._ConnectionPool(2, 1)
+
+
+@pytest.fixture
+def fake_pool(fake_connect):
+    DM.connect_pool(minconn=0, maxconn=3, timeout=0.1)
+    yield DM
+    DM.close()
+
+
+def test_transactions_return_connection_to_pool(fake_pool):
+    for _ in range(5):
+        with DM.transaction():
+            pass
+    stats = DM.pool_stats()
+    assert stats["in_use"] == 0
+    assert stats["size"] == stats["idle"] == 1
+
+
+def test_failed_transaction_returns_connection_to_pool(fake_pool):
+    for _ in range(5):
+        with pytest.raises(ValueError):
+            with DM.transaction():
+                raise ValueError("boom")
+    assert DM.pool_stats()["in_use"] == 0
+
+
+@pytest.mark.skipif(not DSN, reason="DM_TEST_DSN nicht gesetzt")
+def test_bulk_create_more_often_than_maxconn():
+    DM.connect_pool(minconn=0, maxconn=3, timeout=2, dsn=DSN)
+    name = f"dm_test_{uuid.uuid4().hex[:8]}"
+    try:
+        DM.create_table(name, {"n": "INTEGER"})
+        for i in range(5):
+            assert len(DM.bulk_create(name, [{"n": i}, {"n": i + 1}])) == 2
+        assert DM.count(name) == 10
+        assert DM.pool_stats()["in_use"] == 0
+    finally:
+        DM.drop_table(name)
+        DM.close()
@@ -0,0 +1,206 @@
+"""
+Prepared Statements: Platzhalter-Umschreibung und _execute mit einer Fake-Verbindung (ohne
+Datenbank) sowie Wiederanlauf nach DEALLOCATE ALL gegen PostgreSQL (DM_TEST_DSN, sonst
+übersprungen).
+"""
+
+import os
+import re
+import uuid
+
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+from dynamic_model import DynamicModel as DM  # noqa: E402
+
+DSN = os.environ.get("DM_TEST_DSN")
+needs_db = pytest.mark.skipif(not DSN, reason="DM_TEST_DSN nicht gesetzt")
+
+
+def test_numbered_params():
+    assert DM._numbered_params("SELECT 1") == "SELECT 1"
+    assert DM._numbered_params("SELECT id FROM t WHERE a = %s AND b = %s") == (
+        "SELECT id FROM t WHERE a = $1 AND b = $2"
+    )
+    assert DM._numbered_params("INSERT INTO t (a, b) VALUES (%s,%s)") == "INSERT INTO t (a, b) VALUES ($1,$2)"
+
+
+class StatementGone(psycopg2.Error):
+    pgcode = "26000"
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def execute(self, query, params=None):
+        self.conn.executed.append((query, params))
+        if self.conn.fail_execute and "EXECUTE dm_ps_" in query:
+            self.conn.fail_execute -= 1
+            raise StatementGone("prepared statement does not exist")
+
+
+class FakeConnection:
+    def __init__(self, status=psycopg2.extensions.TRANSACTION_STATUS_IDLE):
+        self.status = status
+        self.executed = []
+        self.fail_execute = 0
+        self.rollbacks = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def get_transaction_status(self):
+        return self.status
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture
+def prepared():
+    DM.enable_prepared_statements(max_per_connection=2)
+    yield
+    DM.enable_prepared_statements(False)
+
+
+def _names(sql):
+    return re.findall(r"dm_ps_\d+", sql)
+
+
+def test_execute_without_prepare():
+    conn = FakeConnection()
+    DM._execute(conn, conn.cursor(), "SELECT a FROM t WHERE b = %s", [1])
+    assert conn.executed == [("SELECT a FROM t WHERE b = %s", [1])]
+
+
+def test_execute_prepares_once(prepared):
+    conn = FakeConnection()
+    cur = conn.cursor()
+    for i in range(2):
+        DM._execute(conn, cur, "SELECT a FROM t WHERE b = %s AND c = %s", [i, "x"])
+    (prepare, _), (execute1, params1), (execute2, params2) = conn.executed
+    [name] = _names(prepare)
+    assert prepare == f"PREPARE {name} AS SELECT a FROM t WHERE b = $1 AND c = $2"
+    assert execute1 == execute2 == f"EXECUTE {name} (%s, %s)"
+    assert (params1, params2) == ([0, "x"], [1, "x"])
+
+
+def test_execute_prepare_false_bypasses_cache(prepared):
+    conn = FakeConnection()
+    DM._execute(conn, conn.cursor(), "SELECT 1", [], prepare=False)
+    assert conn.executed == [("SELECT 1", [])]
+
+
+def test_execute_evicts_least_recently_used(prepared):
+    conn = FakeConnection()
+    cur = conn.cursor()
+    DM._execute(conn, cur, "SELECT 1", [])
+    DM._execute(conn, cur, "SELECT 2", [])
+    [one] = _names(conn.executed[0][0])
+    [two] = _names(conn.executed[2][0])
+    DM._execute(conn, cur, "SELECT 1", [])
+    conn.executed.clear()
+    DM._execute(conn, cur, "SELECT 3", [])
+    setup = conn.executed[0][0]
+    assert setup.startswith(f"DEALLOCATE {two}; PREPARE ")
+    [three] = _names(setup)[1:]
+    assert conn.executed[1][0] == f"EXECUTE {three}"
+    conn.executed.clear()
+    DM._execute(conn, cur, "SELECT 1", [])
+    assert conn.executed == [(f"EXECUTE {one}", [])]
+    assert DM.prepared_statement_stats()["evictions"] >= 1
+
+
+def test_execute_reprepares_after_26000(prepared):
+    conn = FakeConnection()
+    cur = conn.cursor()
+    DM._execute(conn, cur, "SELECT %s", [1])
+    conn.executed.clear()
+    conn.fail_execute = 1
+    DM._execute(conn, cur, "SELECT %s", [2])
+    assert conn.rollbacks == 1
+    queries = [q for q, _ in conn.executed]
+    assert queries[0].startswith("EXECUTE")
+    assert queries[1].startswith("PREPARE")
+    assert queries[2].startswith("EXECUTE") and conn.executed[2][1] == [2]
+
+
+def test_execute_in_transaction_uses_savepoint(prepared):
+    conn = FakeConnection(psycopg2.extensions.TRANSACTION_STATUS_INTRANS)
+    cur = conn.cursor()
+    DM._execute(conn, cur, "SELECT %s", [1])
+    queries = [q for q, _ in conn.executed]
+    assert queries[0].startswith("SAVEPOINT dm_prepared; PREPARE")
+    assert queries[-1] == "RELEASE SAVEPOINT dm_prepared"
+
+    conn.executed.clear()
+    conn.fail_execute = 1
+    DM._execute(conn, cur, "SELECT %s", [2])
+    queries = [q for q, _ in conn.executed]
+    assert conn.rollbacks == 0
+    assert queries[0].startswith("SAVEPOINT dm_prepared; EXECUTE")
+    assert queries[1] == "ROLLBACK TO SAVEPOINT dm_prepared"
+    assert queries[2].startswith("PREPARE") and queries[3].startswith("EXECUTE")
+    assert queries[-1] == "RELEASE SAVEPOINT dm_prepared"
+
+
+def test_execute_other_errors_propagate(prepared):
+    class Other(psycopg2.Error):
+        pgcode = "42P01"
+
+    conn = FakeConnection()
+    cur = conn.cursor()
+
+    def fail(query, params=None):
+        raise Other("relation does not exist")
+
+    cur.execute = fail
+    with pytest.raises(Other):
+        DM._execute(conn, cur, "SELECT 1", [])
+    assert conn.rollbacks == 0
+
+
+@pytest.fixture
+def table():
+    DM.connect(dsn=DSN)
+    DM.enable_prepared_statements()
+    name = f"dm_test_{uuid.uuid4().hex[:8]}"
+    DM.create_table(name, {"n": "INTEGER"})
+    yield name
+    DM.enable_prepared_statements(False)
+    DM.drop_table(name)
+    DM.close()
+
+
+def _deallocate_all():
+    with DM._get_cursor() as (conn, cur):
+        cur.execute("DEALLOCATE ALL")
+
+
+@needs_db
+def test_reprepare_after_deallocate_all(table):
+    DM.create(table, n=1)
+    assert DM.find_ids(table, n=1)
+    _deallocate_all()
+    assert len(DM.find_ids(table, n=1)) == 1
+    assert DM.prepared_statement_stats()["prepares"] >= 2
+
+
+@needs_db
+def test_reprepare_inside_transaction(table):
+    DM.find_ids(table, n=1)
+    with DM.transaction():
+        DM.create(table, n=2)
+        with DM._get_cursor() as (conn, cur):
+            cur.execute("DEALLOCATE ALL")
+        assert len(DM.find_ids(table, n=2)) == 1
+        DM.create(table, n=2)
+    assert len(DM.find_ids(table, n=2)) == 2
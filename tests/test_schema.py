@@ -0,0 +1,55 @@
+"""
+Schema-Metadaten aus dem Katalog gegen information_schema (DM_TEST_DSN, sonst übersprungen).
+"""
+
+import os
+import uuid
+
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+from dynamic_model import DynamicModel as DM  # noqa: E402
+
+DSN = os.environ.get("DM_TEST_DSN")
+pytestmark = pytest.mark.skipif(not DSN, reason="DM_TEST_DSN nicht gesetzt")
+
+
+@pytest.fixture
+def table():
+    DM.connect(dsn=DSN)
+    name = f"dm_test_{uuid.uuid4().hex[:8]}"
+    DM.raw_query(f"CREATE TYPE {name}_mood AS ENUM ('ok', 'meh')")
+    DM.raw_query(f"CREATE DOMAIN {name}_code AS VARCHAR(8)")
+    DM.raw_query(f"CREATE DOMAIN {name}_tags AS TEXT[]")
+    DM.create_table(
+        name,
+        {
+            "ints": "INTEGER[]",
+            "mood": f"{name}_mood",
+            "code": f"{name}_code",
+            "tags": f"{name}_tags",
+            "short": "CHAR(5)",
+            "price": "NUMERIC(10, 2)",
+            "seen": "TIMESTAMPTZ",
+        },
+    )
+    yield name
+    DM.drop_table(name)
+    for obj in ("DOMAIN {}_tags", "DOMAIN {}_code", "TYPE {}_mood"):
+        DM.raw_query(f"DROP {obj.format(name)}")
+    DM.close()
+
+
+def test_data_type_matches_information_schema(table):
+    expected = {
+        r["column_name"]: r["data_type"]
+        for r in DM.raw_query(
+            "SELECT column_name, data_type FROM information_schema.columns WHERE table_name = %s", (table,)
+        )
+    }
+    infos = DM.inspect_schema(table)
+    assert {r["column_name"]: r["data_type"] for r in infos} == expected
+    cast = {r["column_name"]: r["cast_type"] for r in infos}
+    assert cast["ints"] == "integer[]"
+    assert cast["short"] == "bpchar"
@@ -0,0 +1,140 @@
+"""
+Streaming-Adapter ohne Datenbank: _IterStream (Bytes-Blöcke als Datei für COPY) und
+stream_query() mit einer Fake-Verbindung aus dem Pool.
+"""
+
+import io
+
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+import dynamic_model  # noqa: E402
+from dynamic_model import DynamicModel as DM, _IterStream  # noqa: E402
+
+
+def test_iter_stream_reads_across_chunks():
+    stream = _IterStream(iter([b"abc", b"", b"defg", b"h"]))
+    assert stream.read(2) == b"ab"
+    assert stream.read(4) == b"cdef"
+    assert stream.read() == b"gh"
+    assert stream.read(1) == b""
+
+
+def test_iter_stream_buffered_reader():
+    stream = io.BufferedReader(_IterStream(iter([b"x" * 10] * 5)), buffer_size=7)
+    assert stream.read() == b"x" * 50
+
+
+def test_iter_stream_empty():
+    assert _IterStream(iter([])).read() == b""
+
+
+class FakeNamedCursor:
+    def __init__(self, conn, name, withhold):
+        self.conn = conn
+        self.name = name
+        self.withhold = withhold
+        self.itersize = None
+        self.description = None
+        self.closed = False
+
+    def execute(self, query, params=None):
+        self.description = (("n", 23),)
+
+    def __iter__(self):
+        for row in self.conn.rows:
+            if row is None:
+                raise psycopg2.OperationalError("connection lost")
+            yield row
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self):
+        self.autocommit = True
+        self.closed = 0
+        self.rows = [(1,), (2,), (3,)]
+        self.cursors = []
+        self.log = []
+
+    def cursor(self, name=None, cursor_factory=None, withhold=False, **kwargs):
+        cur = FakeNamedCursor(self, name, withhold)
+        self.cursors.append(cur)
+        return cur
+
+    def get_transaction_status(self):
+        return psycopg2.extensions.TRANSACTION_STATUS_IDLE
+
+    def commit(self):
+        self.log.append("commit")
+
+    def rollback(self):
+        self.log.append("rollback")
+
+    def close(self):
+        self.closed = 1
+
+
+@pytest.fixture
+def conn(monkeypatch):
+    fake = FakeConnection()
+    monkeypatch.setattr(dynamic_model.psycopg2, "connect", lambda **kw: fake)
+    DM.connect_pool(minconn=0, maxconn=1, timeout=0.1)
+    yield fake
+    DM.close()
+
+
+def test_stream_query_commits_and_releases(conn):
+    rows = DM.stream_query("SELECT n FROM t", rows="tuple", fetch_size=2)
+    assert DM.pool_stats()["in_use"] == 0
+    assert list(rows) == [(1,), (2,), (3,)]
+    [cur] = conn.cursors
+    assert cur.itersize == 2 and cur.closed
+    assert conn.log == ["commit"]
+    assert DM.pool_stats()["in_use"] == 0
+    assert rows.description == (("n", 23),)
+
+
+def test_stream_query_close_early_rolls_back(conn):
+    with DM.stream_query("SELECT n FROM t", rows="tuple") as rows:
+        assert next(rows) == (1,)
+        assert DM.pool_stats()["in_use"] == 1
+    assert conn.log == ["rollback"]
+    assert DM.pool_stats()["in_use"] == 0
+    assert list(rows) == []
+
+
+def test_stream_query_error_releases_connection(conn):
+    conn.rows = [(1,), None]
+    rows = DM.stream_query("SELECT n FROM t", rows="tuple")
+    assert next(rows) == (1,)
+    with pytest.raises(psycopg2.OperationalError):
+        next(rows)
+    assert conn.log == ["rollback"]
+    assert DM.pool_stats()["in_use"] == 0
+
+
+def test_stream_query_withhold_commits_after_open(conn):
+    rows = DM.stream_query("SELECT n FROM t", rows="tuple", withhold=True)
+    assert next(rows) == (1,)
+    assert conn.cursors[0].withhold
+    assert conn.log == ["commit"]
+    rows.close()
+    assert conn.log == ["commit", "rollback"]
+
+
+def test_stream_query_inside_transaction_keeps_connection(conn):
+    with DM.transaction():
+        assert list(DM.stream_query("SELECT n FROM t", rows="tuple")) == [(1,), (2,), (3,)]
+        assert conn.log == []
+        assert DM.pool_stats()["in_use"] == 1
+    assert conn.log == ["commit"]
+    assert DM.pool_stats()["in_use"] == 0
+
+
+def test_stream_query_rejects_unknown_row_format(conn):
+    with pytest.raises(ValueError):
+        DM.stream_query("SELECT 1", rows="list")
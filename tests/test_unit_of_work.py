@@ -0,0 +1,98 @@
+"""
+Unit of Work / Deferred Writes. Die Integrationstests laufen gegen eine echte PostgreSQL-Datenbank:
+Verbindung per DM_TEST_DSN (z. B. "host=localhost dbname=test user=postgres"); ohne DSN übersprungen.
+"""
+
+import gc
+import os
+import threading
+import uuid
+
+import pytest
+
+psycopg2 = pytest.importorskip("psycopg2")
+
+from dynamic_model import DynamicModel as DM  # noqa: E402
+
+DSN = os.environ.get("DM_TEST_DSN")
+needs_db = pytest.mark.skipif(not DSN, reason="DM_TEST_DSN nicht gesetzt")
+
+
+class Dirty:
+    _dirty = {"n"}
+
+
+def test_unflushed_writes_warn_when_thread_ends():
+    def work():
+        DM._register_dirty(Dirty())
+
+    with pytest.warns(RuntimeWarning, match="nie geschrieben"):
+        t = threading.Thread(target=work)
+        t.start()
+        t.join()
+        gc.collect()
+
+
+def test_check_unflushed_warns_once():
+    DM._register_dirty(Dirty())
+    with pytest.warns(RuntimeWarning, match="1 Instanz"):
+        DM._check_unflushed()
+    assert not DM._local.pending
+
+
+@pytest.fixture
+def table():
+    DM.connect(dsn=DSN)
+    name = f"dm_test_{uuid.uuid4().hex[:8]}"
+    DM.raw_query(f"CREATE TABLE {name} (id SERIAL PRIMARY KEY, n INTEGER, u UUID, label TEXT, code CHAR(5))")
+    yield name
+    DM.raw_query(f"DROP TABLE IF EXISTS {name}")
+    DM.close()
+
+
+@needs_db
+def test_flush_bulk_update_with_nulls_and_uuid_strings(table):
+    a = DM.create(table, n=1, label="a")
+    b = DM.create(table, n=2, label="b")
+    ua, ub = str(uuid.uuid4()), str(uuid.uuid4())
+
+    with DM.unit_of_work():
+        a.n = None
+        b.n = None
+        a.u = ua
+        b.u = ub
+
+    rows = {r["id"]: r for r in DM.raw_query(f"SELECT id, n, u::text AS u FROM {table}")}
+    assert rows[a._id]["n"] is None and rows[b._id]["n"] is None
+    assert rows[a._id]["u"] == ua and rows[b._id]["u"] == ub
+
+
+@needs_db
+def test_flush_bulk_update_keeps_char_length(table):
+    a = DM.create(table, code="AAAAA")
+    b = DM.create(table, code="BBBBB")
+
+    with DM.unit_of_work():
+        a.code = "ZZZZZ"
+        b.code = "ab"
+
+    rows = {r["id"]: r["code"] for r in DM.raw_query(f"SELECT id, code FROM {table}")}
+    assert rows[a._id] == "ZZZZZ"
+    assert rows[b._id] == "ab   "
+
+    # zu lange Werte werden nicht stillschweigend abgeschnitten
+    with pytest.raises(psycopg2.DataError):
+        with DM.unit_of_work():
+            a.code = "TOOLONG"
+            b.code = "TOOLONG"
+
+
+@needs_db
+def test_unit_of_work_returns_pooled_connections(table):
+    DM.connect_pool(minconn=0, maxconn=2, timeout=2, dsn=DSN)
+    obj = DM.create(table, n=0)
+    for i in range(1, 5):
+        with DM.unit_of_work():
+            obj.n = i
+    assert DM.pool_stats()["in_use"] == 0
+    assert DM.raw_query(f"SELECT n FROM {table}")[0]["n"] == 4